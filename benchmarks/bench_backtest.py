@@ -0,0 +1,88 @@
+# benchmarks/bench_backtest.py - Walk-forward backtest: cold vs cached folds, new vintage, process pool
+#
+# Usage: python benchmarks/bench_backtest.py [--indicators 500 --events 100 --links 2000 --jobs 2]
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.backtest import FINDEX_VINTAGES, run_backtest
+from src.forecasting import forecast_trend
+from src.impact_model import join_impact_links
+from synthetic import make_events, make_findex_observations, make_impact_links
+
+
+def timed(label, func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<44} {elapsed * 1000:10.1f} ms")
+    return result, elapsed
+
+
+def loop_fold(observations, origin):
+    """Per-series forecast_trend loop for one origin (the notebook approach)"""
+    frame = observations.assign(year=observations['observation_date'].dt.year)
+    train = frame[frame['year'] <= origin]
+    test_years = sorted(frame.loc[frame['year'] > origin, 'year'].unique())
+    forecasts = []
+    for _, group in train.groupby(['indicator_code', 'gender']):
+        history = pd.DataFrame({'year': group['year'], 'value': group['value_numeric']})
+        forecasts.append(forecast_trend(history, test_years))
+    return forecasts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--indicators', type=int, default=500)
+    parser.add_argument('--events', type=int, default=100)
+    parser.add_argument('--links', type=int, default=2000)
+    parser.add_argument('--jobs', type=int, default=2)
+    args = parser.parse_args()
+    
+    observations = make_findex_observations(args.indicators)
+    impact_links = make_impact_links(args.links, n_events=args.events, n_indicators=args.indicators)
+    impact_with_events = join_impact_links(impact_links, make_events(args.events))
+    through_2021 = observations[observations['observation_date'].dt.year <= 2021]
+    n_series = args.indicators * observations['gender'].nunique()
+    print(f"{n_series} series at vintages {FINDEX_VINTAGES}, {len(impact_with_events)} impact links\n")
+    
+    _, loop_seconds = timed("forecast_trend loop, one origin (2017)", loop_fold, observations, 2017)
+    
+    with tempfile.TemporaryDirectory() as cache_dir:
+        options = {'impact_with_events': impact_with_events, 'cache_dir': cache_dir}
+        
+        # Vintages up to 2021, then the 2024 vintage arrives
+        old, _ = timed("backtest through 2021, cold", run_backtest, through_2021, **options)
+        timed("backtest through 2021, cached fits", run_backtest, through_2021, **options)
+        new, _ = timed("backtest with 2024 added, cached fits", run_backtest, observations, **options)
+        print(f"\nFolds after adding 2024:\n{new['folds'].to_string(index=False)}\n")
+        
+        # Unchanged folds give the same predictions as before the new vintage
+        merge_on = ['indicator_code', 'gender', 'location', 'origin', 'year']
+        common = old['predictions'].merge(new['predictions'], on=merge_on, suffixes=('_old', '_new'))
+        diff = np.abs(common['predicted_old'] - common['predicted_new']).max()
+        print(f"max |difference| on {len(common)} points shared with the 2021 run: {diff:.2e}")
+        
+        if args.jobs > 1:
+            timed(f"backtest, cold, n_jobs={args.jobs}", run_backtest, observations,
+                  impact_with_events=impact_with_events, n_jobs=args.jobs)
+        _, cold_seconds = timed("backtest, cold, n_jobs=1", run_backtest, observations,
+                                impact_with_events=impact_with_events)
+    
+    n_origins = len(new['folds'])
+    print(f"\nper-series loop for {n_origins} origins (est.): {loop_seconds * n_origins * 1000:.0f} ms "
+          f"({loop_seconds * n_origins / cold_seconds:.0f}x the batched backtest)")
+    
+    metrics = new['metrics']
+    print(f"\nOverall metrics:\n{metrics[metrics['indicator_code'] == 'ALL'].to_string(index=False)}")
+
+
+if __name__ == '__main__':
+    main()
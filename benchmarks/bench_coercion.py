@@ -0,0 +1,60 @@
+# benchmarks/bench_coercion.py - Schema-driven coercion: time and memory footprint
+#
+# Usage: python benchmarks/bench_coercion.py [--path data/processed/observations_enriched.csv]
+#        (falls back to a synthetic extract when the file is missing)
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from synthetic import make_main_data
+from src.schema import coerce_frame
+
+
+def legacy_clean(observations):
+    """The previous per-column conversions for observations"""
+    observations = observations.copy()
+    for col in ['observation_date', 'start_date', 'end_date']:
+        if col in observations.columns:
+            observations[col] = pd.to_datetime(observations[col], errors='coerce')
+    if 'value_numeric' in observations.columns:
+        observations['value_numeric'] = pd.to_numeric(observations['value_numeric'], errors='coerce')
+    return observations
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Schema-driven coercion benchmark')
+    parser.add_argument('--path', default='data/processed/observations_enriched.csv')
+    parser.add_argument('--rows', type=int, default=1_000_000,
+                        help='synthetic rows when --path does not exist')
+    args = parser.parse_args()
+    
+    path = args.path
+    if not os.path.exists(path):
+        path = os.path.join(tempfile.mkdtemp(prefix='fi_coercion_bench_'), 'observations.csv')
+        make_main_data(args.rows).to_csv(path, index=False)
+        print(f"{args.path} not found, using {args.rows} synthetic rows")
+    
+    raw = pd.read_csv(path, low_memory=False)
+    raw_mb = raw.memory_usage(deep=True).sum() / 1024 ** 2
+    
+    for label, func in [('legacy', legacy_clean),
+                        ('schema', lambda df: coerce_frame(df)[0]),
+                        ('downcast', lambda df: coerce_frame(df, downcast=True)[0])]:
+        start = time.perf_counter()
+        cleaned = func(raw)
+        elapsed = time.perf_counter() - start
+        mb = cleaned.memory_usage(deep=True).sum() / 1024 ** 2
+        print(f"{label:<8} {elapsed:>7.3f}s {mb:>8.1f}MB ({1 - mb / raw_mb:.0%} smaller than raw {raw_mb:.1f}MB)")
+    
+    _, failures = coerce_frame(raw)
+    print("Coercion failures:", {col: n for col, n in failures.items() if n} or 'none')
+
+
+if __name__ == '__main__':
+    main()
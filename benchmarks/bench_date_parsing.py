@@ -0,0 +1,73 @@
+# benchmarks/bench_date_parsing.py - Mixed-format date parsing vs the old safe_date_parse
+#
+# Usage: python benchmarks/bench_date_parsing.py [--rows 1000000]
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.date_parsing import FormatCache, parse_dates
+
+FORMATS = ['%Y-%m-%d', '%Y-%m-%d %H:%M:%S', '%m/%d/%Y', '%d %b %Y']
+
+
+def legacy_safe_date_parse(date_series):
+    """The dashboard's previous parser"""
+    try:
+        return pd.to_datetime(date_series, format='ISO8601', errors='coerce')
+    except Exception:
+        pass
+    try:
+        return pd.to_datetime(date_series, format='mixed', errors='coerce')
+    except Exception:
+        pass
+    return date_series
+
+
+def legacy_load_data_parse(date_series):
+    """The element-wise parse load_data used"""
+    return pd.to_datetime(date_series, errors='coerce', format='mixed')
+
+
+def make_mixed_dates(n_rows, seed=0):
+    rng = np.random.default_rng(seed)
+    dates = pd.Timestamp('2000-01-01') + pd.to_timedelta(rng.integers(0, 9000, n_rows), unit='D')
+    which = rng.integers(0, len(FORMATS), n_rows)
+    values = np.empty(n_rows, dtype=object)
+    for i, fmt in enumerate(FORMATS):
+        mask = which == i
+        values[mask] = dates[mask].strftime(fmt)
+    return pd.Series(values)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Mixed-format date parsing benchmark')
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+    
+    series = make_mixed_dates(args.rows)
+    cache = FormatCache(os.path.join(tempfile.mkdtemp(prefix='fi_dates_bench_'), 'formats.json'))
+    key = FormatCache.key('synthetic.csv', 'date')
+    
+    runs = [
+        ('safe_date_parse (old)', legacy_safe_date_parse),
+        ("format='mixed' (old load_data)", legacy_load_data_parse),
+        ('parse_dates, cold cache', lambda s: parse_dates(s, cache=cache, cache_key=key)),
+        ('parse_dates, warm cache', lambda s: parse_dates(s, cache=cache, cache_key=key)),
+    ]
+    print(f"{'parser':<32} {'time':>9} {'parsed':>10}")
+    for label, func in runs:
+        start = time.perf_counter()
+        parsed = func(series)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<32} {elapsed:>8.2f}s {parsed.notna().sum():>10}")
+
+
+if __name__ == '__main__':
+    main()
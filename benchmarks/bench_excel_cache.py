@@ -0,0 +1,47 @@
+# benchmarks/bench_excel_cache.py - Cold vs warm loads through the sheet cache
+#
+# Usage: python benchmarks/bench_excel_cache.py [--rows 1000 10000 100000 1000000]
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from synthetic import write_workbook
+from src.data_loader import load_financial_inclusion_data
+
+
+def time_call(func, *args, **kwargs):
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Cold vs warm workbook loads')
+    parser.add_argument('--rows', type=int, nargs='+',
+                        default=[1_000, 10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+    
+    workdir = tempfile.mkdtemp(prefix='fi_cache_bench_')
+    try:
+        print(f"{'rows':>10} {'no cache':>10} {'cold':>10} {'warm':>10} {'speedup':>8}")
+        for n_rows in args.rows:
+            path = write_workbook(os.path.join(workdir, f'wb_{n_rows}.xlsx'), n_rows)
+            cache_dir = os.path.join(workdir, f'cache_{n_rows}')
+            
+            baseline = time_call(load_financial_inclusion_data, path)
+            cold = time_call(load_financial_inclusion_data, path, cache_dir=cache_dir)
+            warm = time_call(load_financial_inclusion_data, path, cache_dir=cache_dir)
+            
+            print(f"{n_rows:>10} {baseline:>9.3f}s {cold:>9.3f}s {warm:>9.3f}s "
+                  f"{baseline / warm:>7.1f}x")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
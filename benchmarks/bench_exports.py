@@ -0,0 +1,75 @@
+# benchmarks/bench_exports.py - Eager CSV downloads vs deferred, streamed and shared exports
+#
+# Usage: python benchmarks/bench_exports.py [--rows 1000000 --users 8]
+import argparse
+import gzip
+import io
+import os
+import sys
+import tempfile
+import threading
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from synthetic import make_main_data
+from src.explorer_store import ExplorerStore
+from src.exports import ExportCache, filter_key
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Data Explorer export benchmark')
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--users', type=int, default=8)
+    args = parser.parse_args()
+    
+    observations = make_main_data(args.rows)
+    filters = {'pillar': ['ACCESS', 'USAGE']}
+    
+    # Every rerun of every session before: the whole filtered CSV as a string
+    filtered = observations[observations['pillar'].isin(filters['pillar'])]
+    t0 = time.perf_counter()
+    csv = filtered.to_csv(index=False)
+    eager_time = time.perf_counter() - t0
+    eager_mb = len(csv.encode('utf-8')) / 1e6
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ExplorerStore(observations, ['pillar', 'indicator_code'], cache_dir=tmp)
+        cache = ExportCache()
+        key = (store.path, filter_key(filters))
+        results = {}
+        
+        def download(user, fmt):
+            results[(user, fmt)] = cache.get(key, lambda: store.reader(filters), fmt)
+        
+        # All users click both buttons at once
+        t0 = time.perf_counter()
+        threads = [threading.Thread(target=download, args=(user, fmt))
+                   for user in range(args.users) for fmt in ['csv.gz', 'parquet']]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        export_time = time.perf_counter() - t0
+        
+        csv_gz = results[(0, 'csv.gz')]
+        parquet = results[(0, 'parquet')]
+        shared = all(results[(user, fmt)] is results[(0, fmt)]
+                     for user in range(args.users) for fmt in ['csv.gz', 'parquet'])
+        round_trip = pd.read_parquet(io.BytesIO(parquet))
+        expected = filtered.sort_values(['pillar', 'indicator_code'], kind='stable')
+        same = (gzip.decompress(csv_gz).count(b'\n') - 1 == len(filtered)
+                and round_trip['record_id'].tolist() == expected['record_id'].tolist())
+    
+    print(f"{len(filtered)} rows: eager CSV {eager_time:.2f}s and {eager_mb:.0f} MB per session rerun "
+          f"({args.users} sessions: {eager_mb * args.users:.0f} MB)")
+    print(f"deferred: {args.users} users x 2 formats in {export_time:.2f}s, generations {cache.misses}, "
+          f"cached {cache.size() / 1e6:.1f} MB (csv.gz {len(csv_gz) / 1e6:.1f} MB, "
+          f"parquet {len(parquet) / 1e6:.1f} MB), "
+          f"shared = {shared}, consistent = {same}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+# benchmarks/bench_forecast_cube.py - Forecast cube lookups vs boolean-mask filtering
+#
+# Usage: python benchmarks/bench_forecast_cube.py [--scenarios 5000 --lookups 2000]
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.forecast_cube import ForecastCube
+from synthetic import make_forecasts
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Forecast cube lookup benchmark')
+    parser.add_argument('--scenarios', type=int, default=5000)
+    parser.add_argument('--lookups', type=int, default=2000)
+    args = parser.parse_args()
+    
+    forecast = make_forecasts(args.scenarios)
+    scenarios = forecast['scenario'].unique()
+    years = forecast['year'].unique()
+    rng = np.random.default_rng(1)
+    queries = [(rng.choice(scenarios), int(rng.choice(years))) for _ in range(args.lookups)]
+    
+    t0 = time.perf_counter()
+    masked = []
+    for scenario, year in queries:
+        rows = forecast[(forecast['scenario'] == scenario) & (forecast['year'] == year)]
+        masked.append(rows['access_forecast'].iloc[0])
+    mask_time = time.perf_counter() - t0
+    
+    t0 = time.perf_counter()
+    cube = ForecastCube(forecast)
+    build_time = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    looked_up = [cube.value(scenario, year, 'access_forecast') for scenario, year in queries]
+    cube_time = time.perf_counter() - t0
+    
+    print(f"{args.lookups} lookups over {len(forecast)} rows: masks {mask_time:.3f}s, "
+          f"cube {cube_time:.4f}s (+{build_time:.3f}s build), "
+          f"identical = {np.array_equal(masked, looked_up)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+# benchmarks/bench_forecasting.py - Batched closed-form trend forecasts vs per-series statsmodels
+#
+# Usage: python benchmarks/bench_forecasting.py [--series 100000 --statsmodels-series 200]
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from reference import FORECAST_YEARS, statsmodels_forecast
+from src.forecasting import FORECAST_COLUMNS, forecast_trends
+from synthetic import make_series
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Batched trend forecasting benchmark')
+    parser.add_argument('--series', type=int, default=100_000)
+    parser.add_argument('--statsmodels-series', type=int, default=200)
+    args = parser.parse_args()
+    
+    small = make_series(args.statsmodels_series)
+    t0 = time.perf_counter()
+    reference = statsmodels_forecast(small)
+    reference_time = time.perf_counter() - t0
+    batched = forecast_trends(small, FORECAST_YEARS)
+    diff = np.abs(batched[FORECAST_COLUMNS].to_numpy() - reference).max()
+    print(f"statsmodels, {args.statsmodels_series} series: {reference_time:.2f}s "
+          f"(max abs difference from batched: {diff:.2e})")
+    
+    frame = make_series(args.series)
+    t0 = time.perf_counter()
+    results = forecast_trends(frame, FORECAST_YEARS)
+    elapsed = time.perf_counter() - t0
+    print(f"batched, {args.series} series ({len(frame)} points, {len(results)} rows): {elapsed:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+# benchmarks/bench_impact_model.py - Scalar vs array event impact simulation
+#
+# Usage: python benchmarks/bench_impact_model.py [--events 500 --indicators 200 --months 240]
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from synthetic import make_model
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Event impact simulation benchmark')
+    parser.add_argument('--events', type=int, default=500)
+    parser.add_argument('--indicators', type=int, default=200)
+    parser.add_argument('--months', type=int, default=240)
+    args = parser.parse_args()
+    
+    start = pd.Timestamp('2010-01-01')
+    end = start + pd.DateOffset(months=args.months) - pd.Timedelta(days=1)
+    
+    # The scalar model is too slow for the full grid; check equality on a slice
+    small, small_baseline = make_model(10, 10)
+    scalar = small.simulate_impacts_scalar(small_baseline, start, end)
+    vectorized = small.simulate_impacts(small_baseline, start, end)
+    print(f"10 x 10 x {args.months}: identical = {np.array_equal(scalar.values, vectorized.values)}")
+    
+    model, baseline = make_model(args.events, args.indicators)
+    t0 = time.perf_counter()
+    surface = model.simulate_impacts(baseline, start, end)
+    elapsed = time.perf_counter() - t0
+    print(f"{args.events} x {args.indicators} x {len(surface)}: {elapsed:.3f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+# benchmarks/bench_instrumentation.py - Cost of timing spans when disabled, enabled and with memory tracking
+#
+# Usage: python benchmarks/bench_instrumentation.py [--calls 200000 --rows 200000]
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data_loader import clean_and_prepare_data, separate_record_types
+from src.instrumentation import TRACER, configure, span, traced
+from synthetic import make_impact_links, make_main_data
+
+
+def noop():
+    return None
+
+
+@traced()
+def traced_noop():
+    return None
+
+
+def per_call_ns(func, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return (time.perf_counter() - start) / calls * 1e9
+
+
+def span_block():
+    with span('block'):
+        pass
+
+
+def loader_pipeline(main_data, impact_links):
+    with span('pipeline', rows=len(main_data)):
+        observations, events, targets = separate_record_types(main_data, verbose=False)
+        return clean_and_prepare_data(observations, events, targets, impact_links)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Instrumentation overhead benchmark')
+    parser.add_argument('--calls', type=int, default=200_000)
+    parser.add_argument('--rows', type=int, default=200_000)
+    args = parser.parse_args()
+    
+    print(f"Per-call cost over {args.calls} calls (ns)")
+    configure(enabled=False)
+    base = per_call_ns(noop, args.calls)
+    print(f"  plain function                  {base:8.0f}")
+    print(f"  traced, tracing disabled        {per_call_ns(traced_noop, args.calls):8.0f}")
+    print(f"  span block, tracing disabled    {per_call_ns(span_block, args.calls):8.0f}")
+    configure(enabled=True)
+    print(f"  traced, tracing enabled         {per_call_ns(traced_noop, args.calls):8.0f}")
+    print(f"  span block, tracing enabled     {per_call_ns(span_block, args.calls):8.0f}")
+    configure(enabled=False)
+    TRACER.clear()
+    
+    main_data = make_main_data(args.rows)
+    impact_links = make_impact_links(max(args.rows // 100, 10))
+    print(f"\nseparate_record_types + clean_and_prepare_data on {args.rows} rows")
+    with tempfile.TemporaryDirectory() as directory, contextlib.redirect_stdout(io.StringIO()):
+        loader_pipeline(main_data, impact_links)
+        timings = {}
+        for label, settings in [('tracing disabled', {'enabled': False, 'memory': False}),
+                                ('tracing enabled', {'enabled': True, 'memory': False}),
+                                ('enabled + peak memory', {'enabled': True, 'memory': True})]:
+            configure(path=os.path.join(directory, 'trace.jsonl'), **settings)
+            start = time.perf_counter()
+            loader_pipeline(main_data, impact_links)
+            timings[label] = time.perf_counter() - start
+        configure(enabled=False, memory=False)
+        with open(os.path.join(directory, 'trace.jsonl')) as f:
+            trace_lines = f.readlines()
+    
+    for label, seconds in timings.items():
+        print(f"  {label:<24} {seconds * 1000:8.1f} ms")
+    
+    spans = TRACER.spans()
+    last = spans[spans['trace'] == spans['trace'].max()].sort_values('id')
+    print(f"\nSpans of the last run ({len(trace_lines)} lines in the JSON-lines trace over both traced runs):")
+    for row in last.itertuples():
+        print(f"  {'  ' * row.depth}{row.name:<40} {row.wall_seconds * 1000:8.1f} ms wall "
+              f"{row.cpu_seconds * 1000:8.1f} ms CPU  rows={row.rows}  peak={row.peak_memory_mb:.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
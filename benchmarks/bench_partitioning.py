@@ -0,0 +1,50 @@
+# benchmarks/bench_partitioning.py - Record-type partitioning: boolean masks vs factorize
+#
+# Usage: python benchmarks/bench_partitioning.py [--rows 1000000 10000000]
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from synthetic import make_main_data
+from src.data_loader import separate_record_types
+
+
+def separate_with_masks(main_data):
+    """The previous implementation: one mask scan and a copy per record type"""
+    observations = main_data[main_data['record_type'] == 'observation'].copy()
+    events = main_data[main_data['record_type'] == 'event'].copy()
+    targets = main_data[main_data['record_type'] == 'target'].copy()
+    return observations, events, targets
+
+
+def measure(func, main_data):
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(main_data)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1024 ** 2
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Record-type partitioning benchmark')
+    parser.add_argument('--rows', type=int, nargs='+', default=[1_000_000, 10_000_000])
+    args = parser.parse_args()
+    
+    print(f"{'rows':>10} {'method':<12} {'time':>9} {'peak alloc':>11}")
+    for n_rows in args.rows:
+        main_data = make_main_data(n_rows)
+        for label, func in [('masks', separate_with_masks),
+                            ('factorize', lambda df: separate_record_types(df, verbose=False))]:
+            elapsed, peak_mb = measure(func, main_data)
+            print(f"{n_rows:>10} {label:<12} {elapsed:>8.3f}s {peak_mb:>9.0f}MB")
+        del main_data
+
+
+if __name__ == '__main__':
+    main()
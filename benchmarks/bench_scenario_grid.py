@@ -0,0 +1,92 @@
+# benchmarks/bench_scenario_grid.py - Broadcasted scenario grid vs per-scenario loop
+#
+# Usage: python benchmarks/bench_scenario_grid.py [--steps 10 --toggled-events 5 --jobs 1]
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.forecasting import apply_event_impacts, event_adjustment_matrices, event_adjustments, forecast_trend
+from src.impact_model import join_impact_links
+from src.scenarios import (SCENARIOS, named_scenarios, read_scenario_results, run_scenario_grid,
+                           scenario_grid)
+from synthetic import make_adjustment_inputs
+
+FORECAST_YEARS = [2025, 2026, 2027]
+METRIC_INDICATORS = {'access': 'IND_0000', 'usage': 'IND_0001'}
+
+
+def notebook_scenario(baseline_future, adjusted_future, scenario_name, params, metric):
+    """Task 4 generate_scenario_forecasts arithmetic for the forecast years"""
+    multiplier = params[f"{metric}_multiplier"]
+    baseline = baseline_future['predicted'].to_numpy()
+    event = adjusted_future['predicted'].to_numpy()
+    predicted = baseline * multiplier + (event - baseline) * params['event_effectiveness']
+    ci_range = (adjusted_future['ci_upper'] - adjusted_future['ci_lower']).to_numpy()
+    ci_adjustment = {'optimistic': 0.8, 'pessimistic': 1.3}.get(scenario_name, 1.0)
+    return predicted, predicted - ci_range * ci_adjustment / 2, predicted + ci_range * ci_adjustment / 2
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Scenario grid benchmark')
+    parser.add_argument('--steps', type=int, default=10, help='values per multiplier')
+    parser.add_argument('--toggled-events', type=int, default=5)
+    parser.add_argument('--jobs', type=int, default=1)
+    parser.add_argument('--chunk-size', type=int, default=10_000)
+    args = parser.parse_args()
+    
+    events, impact_links, _ = make_adjustment_inputs(300, 200, 3000)
+    impact_with_events = join_impact_links(impact_links, events)
+    
+    rng = np.random.default_rng(1)
+    matrices = event_adjustment_matrices(impact_with_events, METRIC_INDICATORS.values(), FORECAST_YEARS)
+    baseline, adjustments, adjusted = {}, {}, {}
+    for metric, indicator in METRIC_INDICATORS.items():
+        history = pd.DataFrame({'year': [2011, 2014, 2017, 2021, 2024],
+                                'value': np.sort(rng.uniform(5, 50, 5))})
+        baseline[metric] = forecast_trend(history, FORECAST_YEARS)['future'].reset_index(drop=True)
+        adjustments[metric] = matrices[indicator]
+        adjusted[metric] = apply_event_impacts(baseline[metric].assign(indicator_code=indicator),
+                                               event_adjustments(impact_with_events, FORECAST_YEARS))
+    
+    named = run_scenario_grid(named_scenarios(), baseline, adjustments)
+    worst = 0.0
+    for name, params in SCENARIOS.items():
+        rows = named[named['scenario'] == name]
+        for metric in METRIC_INDICATORS:
+            expected = notebook_scenario(baseline[metric], adjusted[metric], name, params, metric)
+            actual = rows[[f"{metric}_forecast", f"{metric}_ci_lower", f"{metric}_ci_upper"]].to_numpy().T
+            worst = max(worst, float(np.abs(actual - np.array(expected)).max()))
+    print(f"named scenarios, max abs difference from notebook arithmetic: {worst:.2e}")
+    
+    toggled = adjustments['access'][0][:args.toggled_events]
+    steps = np.linspace(0.5, 1.5, args.steps)
+    grid = scenario_grid(steps, steps, steps, ci_adjustments=(0.8, 1.0, 1.3), event_ids=toggled)
+    
+    t0 = time.perf_counter()
+    results = run_scenario_grid(grid, baseline, adjustments, chunk_size=args.chunk_size)
+    elapsed = time.perf_counter() - t0
+    print(f"{len(grid)} scenarios in memory: {elapsed:.2f}s ({len(results)} rows)")
+    
+    output_dir = tempfile.mkdtemp(prefix='scenario_grid_')
+    try:
+        t0 = time.perf_counter()
+        run_scenario_grid(grid, baseline, adjustments, output_dir=output_dir,
+                          chunk_size=args.chunk_size, n_jobs=args.jobs, verbose=False)
+        elapsed = time.perf_counter() - t0
+        print(f"{len(grid)} scenarios to Parquet ({args.jobs} job(s)): {elapsed:.2f}s")
+        subset = read_scenario_results(output_dir, scenarios=['grid_000000'], years=[2027])
+        print(subset.to_string(index=False))
+    finally:
+        shutil.rmtree(output_dir)
+
+
+if __name__ == '__main__':
+    main()
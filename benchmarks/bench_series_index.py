@@ -0,0 +1,59 @@
+# benchmarks/bench_series_index.py - Boolean-mask observation filtering vs the sorted series index
+#
+# Usage: python benchmarks/bench_series_index.py [--rows 1000000 --indicators 500 --queries 200]
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from synthetic import make_main_data
+from src.series_index import SeriesIndex
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Per-indicator series index benchmark')
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--indicators', type=int, default=500)
+    parser.add_argument('--queries', type=int, default=200)
+    args = parser.parse_args()
+    
+    observations = make_main_data(args.rows, n_indicators=args.indicators)
+    observations['observation_date'] = pd.to_datetime(observations['observation_date'])
+    rng = np.random.default_rng(1)
+    queries = [(f"IND_{rng.integers(args.indicators):04d}", int(start), int(start) + int(span))
+               for start, span in zip(rng.integers(2011, 2020, args.queries),
+                                      rng.integers(0, 6, args.queries))]
+    
+    # Trends page before: add a year column, then mask the whole table per query
+    t0 = time.perf_counter()
+    filtered = []
+    for indicator, start_year, end_year in queries:
+        observations['year'] = observations['observation_date'].dt.year
+        filtered.append(observations[(observations['indicator_code'] == indicator) &
+                                     (observations['year'].between(start_year, end_year))])
+    mask_time = time.perf_counter() - t0
+    observations = observations.drop(columns='year')
+    
+    t0 = time.perf_counter()
+    index = SeriesIndex(observations)
+    build_time = time.perf_counter() - t0
+    
+    t0 = time.perf_counter()
+    indexed = [index.series(indicator, start_year, end_year) for indicator, start_year, end_year in queries]
+    index_time = time.perf_counter() - t0
+    
+    same = all(np.array_equal(a.sort_values('observation_date', kind='stable')['value_numeric'].to_numpy(),
+                              b['value_numeric'].to_numpy())
+               for a, b in zip(filtered, indexed))
+    print(f"{args.queries} series queries over {args.rows} rows: masks {mask_time:.2f}s "
+          f"({mask_time / args.queries * 1e3:.1f} ms each), index build {build_time:.2f}s (once), "
+          f"index {index_time:.3f}s ({index_time / args.queries * 1e3:.2f} ms each), identical = {same}")
+
+
+if __name__ == '__main__':
+    main()
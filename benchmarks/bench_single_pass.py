@@ -0,0 +1,66 @@
+# benchmarks/bench_single_pass.py - Per-sheet vs single-pass workbook reads
+#
+# Each mode runs in a fresh interpreter so peak RSS is not shared between them.
+#
+# Usage: python benchmarks/bench_single_pass.py [--rows 200000] [--extra-sheets 4]
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from synthetic import write_workbook
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+CHILD = '''
+import json, resource, sys, time
+sys.path.insert(0, {root!r})
+from src.data_loader import load_workbook_sheets
+start = time.perf_counter()
+sheets = load_workbook_sheets({path!r}, streaming={streaming!r}, usecols={usecols!r})
+elapsed = time.perf_counter() - start
+peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{'seconds': elapsed, 'peak_mb': peak_kb / 1024,
+                  'cells': sum(f.size for f in sheets.values())}}))
+'''
+
+MODES = [
+    ('per-sheet read_excel', False, None),
+    ('single pass', True, None),
+    ('single pass, 3 columns', True, ['record_type', 'indicator_code', 'value_numeric']),
+]
+
+
+def run_mode(path, streaming, usecols):
+    code = CHILD.format(root=REPO_ROOT, path=path, streaming=streaming, usecols=usecols)
+    output = subprocess.run([sys.executable, '-c', code], check=True,
+                            capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Per-sheet vs single-pass workbook reads')
+    parser.add_argument('--rows', type=int, default=200_000)
+    parser.add_argument('--extra-sheets', type=int, default=4)
+    args = parser.parse_args()
+    
+    workdir = tempfile.mkdtemp(prefix='fi_single_pass_bench_')
+    try:
+        path = write_workbook(os.path.join(workdir, 'workbook.xlsx'), args.rows,
+                              n_extra_sheets=args.extra_sheets)
+        print(f"{'mode':<26} {'wall':>9} {'peak RSS':>10} {'cells':>10}")
+        for label, streaming, usecols in MODES:
+            result = run_mode(path, streaming, usecols)
+            print(f"{label:<26} {result['seconds']:>8.2f}s {result['peak_mb']:>8.0f}MB "
+                  f"{result['cells']:>10}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+# benchmarks/load_test_sessions.py - Concurrent headless dashboard sessions and their memory footprint
+#
+# Usage: python benchmarks/load_test_sessions.py [--sessions 50]
+#
+# Each session is a Streamlit AppTest (a headless client running the real
+# script in this process, so st.cache_resource state is shared as on a
+# server). Sessions stay open together and their page views are
+# interleaved, as with analysts working at the same time; process RSS is
+# sampled as sessions join. Script runs are not overlapped: compiling the
+# script from several threads at once trips a CPython 3.11 AST bug.
+import argparse
+import os
+import time
+
+from streamlit.testing.v1 import AppTest
+
+DASHBOARD_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'dashboard')
+PAGES = ["📈 Overview", "📊 Trends Analysis", "🔮 Forecasts", "🎯 Inclusion Projections", "📋 Data"]
+
+
+def rss_mb():
+    """Resident set size of this process (Linux), in MB"""
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1]) / 1024
+    return float('nan')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Concurrent dashboard session load test')
+    parser.add_argument('--sessions', type=int, default=50)
+    args = parser.parse_args()
+    
+    # The dashboard reads ../data relative to its own directory
+    os.chdir(DASHBOARD_DIR)
+    checkpoints = sorted({1, 10, 25, args.sessions} & set(range(1, args.sessions + 1)))
+    
+    baseline = rss_mb()
+    sessions = []
+    view_seconds = []
+    errors = 0
+    samples = []
+    
+    t0 = time.perf_counter()
+    for n_sessions in checkpoints:
+        joining = []
+        while len(sessions) + len(joining) < n_sessions:
+            session = AppTest.from_file(os.path.join(DASHBOARD_DIR, 'app.py'), default_timeout=120)
+            session.run()
+            joining.append(session)
+        
+        # Interleave the new sessions' page views
+        for page in PAGES:
+            for session in joining:
+                session.sidebar.radio[0].set_value(page)
+                start = time.perf_counter()
+                session.run()
+                view_seconds.append(time.perf_counter() - start)
+                errors += len(session.error)
+        
+        sessions.extend(joining)
+        samples.append((len(sessions), rss_mb()))
+    total_time = time.perf_counter() - t0
+    
+    view_seconds.sort()
+    print(f"{len(sessions)} sessions x {len(PAGES)} pages in {total_time:.1f}s: page view median "
+          f"{view_seconds[len(view_seconds) // 2]:.3f}s, p95 {view_seconds[int(len(view_seconds) * 0.95)]:.3f}s, "
+          f"page errors {errors}")
+    print(f"RSS before sessions {baseline:.0f} MB")
+    previous_n, previous_rss = samples[0]
+    print(f"   1 session : {previous_rss:.0f} MB (+{previous_rss - baseline:.0f} MB, loads shared data)")
+    for n, rss in samples[1:]:
+        print(f"  {n:>2} sessions: {rss:.0f} MB (+{(rss - previous_rss) / (n - previous_n):.2f} MB per extra session)")
+        previous_n, previous_rss = n, rss
+    
+    shared_dir = os.path.join(DASHBOARD_DIR, '..', 'data', 'cache', 'shared')
+    if os.path.isdir(shared_dir):
+        print(f"Shared frame files: {sorted(os.listdir(shared_dir))}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+# benchmarks/reference.py - Task 4 notebook implementations the vectorized code is checked against
+import numpy as np
+import pandas as pd
+from statsmodels.api import OLS, add_constant
+
+FORECAST_YEARS = [2025, 2026, 2027]
+
+
+def statsmodels_forecast(frame, forecast_years=FORECAST_YEARS):
+    """Task 4 notebook approach: one OLS and summary_frame per series"""
+    results = []
+    for _, group in frame.groupby('indicator_code', sort=True):
+        model = OLS(group['value'].values, add_constant(group['year'].values.astype(float))).fit()
+        all_years = np.array(list(group['year']) + list(forecast_years), dtype=float)
+        summary = model.get_prediction(add_constant(all_years)).summary_frame(alpha=0.05)
+        results.append(summary[['mean', 'mean_ci_lower', 'mean_ci_upper',
+                                'obs_ci_lower', 'obs_ci_upper']].to_numpy())
+    return np.vstack(results)
+
+
+def notebook_adjust(results, impact_matrix, events_df, target_indicator, forecast_years=FORECAST_YEARS):
+    """Task 4 apply_event_impacts logic (lag fixed at 12 months, printing removed)"""
+    results = results.copy()
+    impact_matrix_reset = impact_matrix.reset_index()
+    adjustments = {}
+    for _, row in impact_matrix_reset.iterrows():
+        if not pd.isna(row[target_indicator]) and row[target_indicator] != 0:
+            event_match = events_df[events_df['event_name'] == row['event_name']]
+            if event_match.empty:
+                continue
+            event_year = pd.to_datetime(event_match.iloc[0]['event_date']).year
+            for year in forecast_years:
+                years_since = year - event_year
+                if years_since >= 1:
+                    build_up = years_since - 1 if years_since <= 2 else 1.0
+                    adjustments[year] = adjustments.get(year, 0) + row[target_indicator] * build_up
+    for year, adjustment in adjustments.items():
+        mask = results['year'] == year
+        results.loc[mask, 'predicted'] += adjustment * 100
+        results.loc[mask, 'ci_lower'] += adjustment * 100 * 0.8
+        results.loc[mask, 'ci_upper'] += adjustment * 100 * 1.2
+    return results
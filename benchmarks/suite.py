@@ -0,0 +1,419 @@
+# benchmarks/suite.py - Benchmark suite over the loader, impact model, forecaster and dashboard data paths
+#
+# Usage: python benchmarks/suite.py [--rows 10000 --events 50 --indicators 100 --scenarios 3]
+#                                   [--output results.json] [--baseline results.json --threshold 0.25]
+#                                   [--filter dashboard] [--pages] [--list]
+#
+# Every case runs on synthetic data sized by the parameters, once to warm
+# up and then --repeat rounds (fast cases are looped so a round lasts at
+# least --min-time). Per-call min/median/mean/stdev seconds are written as
+# JSON with --output. With --baseline, cases slower than the baseline by
+# more than --threshold (a fraction) are reported as regressions and the
+# run exits with status 1; the fastest round (--statistic min) is compared
+# by default, as it is the least affected by other load on the machine. --pages adds full renders of
+# each dashboard page through a headless Streamlit session.
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from src.backtest import run_backtest
+from src.data_loader import (clean_and_prepare_data, get_data_summary, load_financial_inclusion_data,
+                             separate_record_types)
+from src.forecasting import event_adjustments, forecast_trends, observation_series
+from src.impact_model import join_impact_links
+from src.schema import build_schema
+from synthetic import (make_events, make_findex_observations, make_impact_links, make_main_data, make_model,
+                       write_processed_data, write_workbook)
+
+FORECAST_YEARS = [2025, 2026, 2027]
+PAGES = ["📈 Overview", "📊 Trends Analysis", "🔮 Forecasts", "🎯 Inclusion Projections", "📋 Data"]
+MILESTONES = [
+    {'name': '50% Account Ownership', 'metric': 'access_forecast', 'target': 50},
+    {'name': '60% Account Ownership', 'metric': 'access_forecast', 'target': 60},
+    {'name': '40% Digital Payments', 'metric': 'usage_forecast', 'target': 40},
+    {'name': '50% Digital Payments', 'metric': 'usage_forecast', 'target': 50},
+]
+
+CASES = []
+
+
+def case(name, pages=False):
+    """Register a case; the decorated setup(fixtures) returns the callable to time"""
+    def register(setup):
+        CASES.append({'name': name, 'setup': setup, 'pages': pages})
+        return setup
+    return register
+
+
+def quiet_streamlit():
+    """
+    Silence Streamlit's logging: warnings on every call outside a script
+    run, and tracebacks of page errors (the page cases report those)
+    """
+    from streamlit import config
+    from streamlit.logger import set_log_level
+    # The option is re-applied whenever the config is parsed (e.g. by AppTest)
+    config.set_option('logger.level', 'critical')
+    set_log_level('critical')
+
+
+class Fixtures:
+    """Synthetic inputs built on first use and shared by the cases"""
+    
+    def __init__(self, params, directory):
+        self.params = params
+        self.directory = directory
+        self._built = {}
+    
+    def _get(self, name, build):
+        if name not in self._built:
+            self._built[name] = build()
+        return self._built[name]
+    
+    def workbook(self):
+        return self._get('workbook', lambda: write_workbook(
+            os.path.join(self.directory, 'unified_data.xlsx'), self.params['rows']))
+    
+    def main_data(self):
+        return self._get('main_data', lambda: make_main_data(
+            self.params['rows'], n_indicators=self.params['indicators']))
+    
+    def separated(self):
+        return self._get('separated', lambda: separate_record_types(self.main_data(), verbose=False))
+    
+    def impact_links(self):
+        return self._get('impact_links', lambda: make_impact_links(
+            self.params['events'] * 10, n_events=self.params['events'],
+            n_indicators=self.params['indicators']))
+    
+    def schema(self):
+        return self._get('schema', lambda: build_schema(
+            os.path.join(ROOT, 'data', 'raw', 'reference_codes.xlsx'),
+            os.path.join(ROOT, 'data', 'templates')))
+    
+    def cleaned(self):
+        return self._get('cleaned', lambda: clean_and_prepare_data(
+            *self.separated(), self.impact_links(), schema=self.schema()))
+    
+    def events(self):
+        return self._get('events', lambda: make_events(self.params['events']))
+    
+    def impact_with_events(self):
+        return self._get('impact_with_events', lambda: join_impact_links(
+            self.impact_links(), self.events()))
+    
+    def findex_observations(self):
+        return self._get('findex_observations', lambda: make_findex_observations(
+            self.params['indicators']))
+    
+    def app(self):
+        """The dashboard module, run against synthetic processed data"""
+        def build():
+            # The dashboard reads ../data relative to its working directory
+            write_processed_data(os.path.join(self.directory, 'data', 'processed'), self.params['rows'],
+                                 n_events=self.params['events'], n_indicators=self.params['indicators'],
+                                 n_scenarios=self.params['scenarios'])
+            dashboard_dir = os.path.join(self.directory, 'dashboard')
+            os.makedirs(dashboard_dir, exist_ok=True)
+            os.chdir(dashboard_dir)
+            sys.path.insert(0, os.path.join(ROOT, 'dashboard'))
+            quiet_streamlit()
+            import app
+            return app
+        return self._get('app', build)
+    
+    def dashboard_data(self):
+        """Dashboard data with every artifact loaded"""
+        def build():
+            data = self.app().load_data()
+            for name in self.app().ARTIFACT_SPECS:
+                data[name]
+            return data
+        return self._get('dashboard_data', build)
+
+
+@case('loader.load_financial_inclusion_data')
+def bench_load(fx):
+    path = fx.workbook()
+    return lambda: load_financial_inclusion_data(path)
+
+
+@case('loader.load_financial_inclusion_data.cached')
+def bench_load_cached(fx):
+    path = fx.workbook()
+    cache_dir = os.path.join(fx.directory, 'sheet_cache')
+    return lambda: load_financial_inclusion_data(path, cache_dir=cache_dir)
+
+
+@case('loader.separate_record_types')
+def bench_separate(fx):
+    main_data = fx.main_data()
+    return lambda: separate_record_types(main_data, verbose=False)
+
+
+@case('loader.clean_and_prepare_data')
+def bench_clean(fx):
+    observations, events, targets = fx.separated()
+    impact_links, schema = fx.impact_links(), fx.schema()
+    return lambda: clean_and_prepare_data(observations, events, targets, impact_links, schema=schema)
+
+
+@case('loader.get_data_summary')
+def bench_summary(fx):
+    cleaned = fx.cleaned()
+    return lambda: get_data_summary(*cleaned)
+
+
+@case('impact.simulate_impacts')
+def bench_simulate(fx):
+    model, baseline = make_model(fx.params['events'], fx.params['indicators'])
+    return lambda: model.simulate_impacts(baseline, '2015-01-01', '2027-12-31')
+
+
+@case('impact.event_adjustments')
+def bench_adjustments(fx):
+    impact_with_events = fx.impact_with_events()
+    return lambda: event_adjustments(impact_with_events, FORECAST_YEARS)
+
+
+@case('forecast.forecast_trends')
+def bench_trends(fx):
+    series = observation_series(fx.findex_observations())
+    return lambda: forecast_trends(series, FORECAST_YEARS)
+
+
+@case('forecast.run_backtest')
+def bench_backtest(fx):
+    observations, impact_with_events = fx.findex_observations(), fx.impact_with_events()
+    return lambda: run_backtest(observations, impact_with_events)
+
+
+@case('dashboard.load_data.cold')
+def bench_load_data_cold(fx):
+    app = fx.app()
+    
+    def run():
+        app.get_artifact_cache().invalidate()
+        data = app.load_data()
+        for name in app.ARTIFACT_SPECS:
+            data[name]
+    return run
+
+
+@case('dashboard.load_data.warm')
+def bench_load_data_warm(fx):
+    app = fx.app()
+    fx.dashboard_data()
+    
+    def run():
+        data = app.load_data()
+        for name in app.ARTIFACT_SPECS:
+            data[name]
+    return run
+
+
+@case('dashboard.forecasts.scenario_table')
+def bench_scenario_table(fx):
+    app, data = fx.app(), fx.dashboard_data()
+    return lambda: app.scenario_table(data)
+
+
+@case('dashboard.forecasts.milestones')
+def bench_milestones(fx):
+    app, data = fx.app(), fx.dashboard_data()
+    start = {'access_forecast': (2024, 49.0), 'usage_forecast': (2024, 35.0)}
+    
+    def run():
+        crossings = app.first_crossings(data['cube'], MILESTONES, start=start)
+        crossings['label'] = crossings.apply(app.format_crossing, axis=1,
+                                             horizon_label=app.not_reached_label(data['cube']))
+        return crossings.pivot(index=['milestone', 'target'], columns='scenario', values='label')
+    return run
+
+
+@case('dashboard.trends.series_and_correlates')
+def bench_trends_page(fx):
+    data = fx.dashboard_data()
+    
+    def run():
+        data['series_index'].series('ACC_OWNERSHIP', 2011, 2024)
+        # A fresh window each round, so the correlations are computed
+        data['correlations']._results.clear()
+        return data['correlations'].top_correlates('ACC_OWNERSHIP', 2011, 2024)
+    return run
+
+
+@case('dashboard.explorer.page')
+def bench_explorer_page(fx):
+    store = fx.dashboard_data()['observation_store']
+    filters = {'pillar': ['access'], 'indicator_code': []}
+    
+    def run():
+        store.count(filters)
+        return store.page(filters, page=2, page_size=100)
+    return run
+
+
+def make_page_case(page):
+    def setup(fx):
+        from streamlit.testing.v1 import AppTest
+        fx.app()
+        session = AppTest.from_file(os.path.join(ROOT, 'dashboard', 'app.py'), default_timeout=120)
+        session.run()
+        session.sidebar.radio[0].set_value(page)
+        session.run()
+        for error in session.exception:
+            print(f"{page}: {error.message}", file=sys.stderr)
+        
+        def run():
+            session.sidebar.radio[0].set_value(page)
+            session.run()
+        return run
+    return setup
+
+
+for _page in PAGES:
+    case(f"dashboard.page.{_page.split(' ', 1)[1].lower().replace(' ', '_')}", pages=True)(
+        make_page_case(_page))
+
+
+def measure(run, repeat, min_time):
+    """Per-call seconds of each round, and the calls per round"""
+    run()
+    start = time.perf_counter()
+    run()
+    once = time.perf_counter() - start
+    number = max(1, math.ceil(min_time / once)) if once > 0 else 1000
+    
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        times.append((time.perf_counter() - start) / number)
+    return times, number
+
+
+def environment():
+    """Where the results come from, for the JSON report"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'commit': commit,
+        'machine': {'python': platform.python_version(), 'platform': platform.platform(),
+                    'cpus': os.cpu_count(), 'numpy': np.__version__, 'pandas': pd.__version__},
+    }
+
+
+def compare(results, baseline, threshold, statistic='min'):
+    """Print the change against a baseline report; returns the regressed case names"""
+    previous = {entry['name']: entry for entry in baseline['results']}
+    regressions = []
+    print(f"\n{'case':<48} {'baseline ms':>12} {'current ms':>12} {'change':>8}  ({statistic})")
+    for entry in results:
+        before = previous.get(entry['name'])
+        if before is None:
+            print(f"{entry['name']:<48} {'-':>12} {entry[statistic] * 1000:12.2f} {'new':>8}")
+            continue
+        change = entry[statistic] / before[statistic] - 1
+        flag = ''
+        if change > threshold:
+            regressions.append(entry['name'])
+            flag = '  REGRESSION'
+        print(f"{entry['name']:<48} {before[statistic] * 1000:12.2f} {entry[statistic] * 1000:12.2f} "
+              f"{change:+8.1%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark suite with regression check')
+    parser.add_argument('--rows', type=int, default=10_000)
+    parser.add_argument('--events', type=int, default=50)
+    parser.add_argument('--indicators', type=int, default=100)
+    parser.add_argument('--scenarios', type=int, default=3)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-time', type=float, default=0.05,
+                        help='Minimum seconds per round; faster cases are looped')
+    parser.add_argument('--filter', default=None, help='Only run cases whose name contains this')
+    parser.add_argument('--pages', action='store_true', help='Also render each dashboard page')
+    parser.add_argument('--output', default=None, help='Write the results as JSON to this path')
+    parser.add_argument('--baseline', default=None, help='JSON results to compare against')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='Allowed slowdown against the baseline, as a fraction')
+    parser.add_argument('--statistic', choices=['min', 'median', 'mean'], default='min',
+                        help='Per-call time compared with the baseline')
+    parser.add_argument('--list', action='store_true', help='List the cases and exit')
+    args = parser.parse_args()
+    
+    params = {'rows': args.rows, 'events': args.events, 'indicators': args.indicators,
+              'scenarios': args.scenarios}
+    cases = [c for c in CASES if (args.pages or not c['pages'])
+             and (args.filter is None or args.filter in c['name'])]
+    if args.list:
+        print('\n'.join(c['name'] for c in cases))
+        return
+    
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline['params'] != params:
+            sys.exit(f"Baseline was run with {baseline['params']}, not {params}")
+    
+    cwd = os.getcwd()
+    results = []
+    print(f"{len(cases)} cases, {params}\n")
+    print(f"{'case':<48} {'median ms':>12} {'min ms':>10} {'stdev ms':>10} {'calls':>6}")
+    with tempfile.TemporaryDirectory() as directory:
+        fx = Fixtures(params, directory)
+        try:
+            for c in cases:
+                # Library progress messages would drown the report
+                with contextlib.redirect_stdout(io.StringIO()):
+                    times, number = measure(c['setup'](fx), args.repeat, args.min_time)
+                entry = {'name': c['name'], 'rounds': len(times), 'number': number,
+                         'min': min(times), 'median': statistics.median(times),
+                         'mean': statistics.fmean(times),
+                         'stdev': statistics.stdev(times) if len(times) > 1 else 0.0}
+                results.append(entry)
+                print(f"{entry['name']:<48} {entry['median'] * 1000:12.2f} {entry['min'] * 1000:10.2f} "
+                      f"{entry['stdev'] * 1000:10.2f} {number:6d}")
+        finally:
+            os.chdir(cwd)
+    
+    report = {**environment(), 'params': params, 'results': results}
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}")
+    
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold, args.statistic)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}: {', '.join(regressions)}")
+            sys.exit(1)
+        print(f"\nNo regressions beyond {args.threshold:.0%}")
+
+
+if __name__ == '__main__':
+    main()
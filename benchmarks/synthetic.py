@@ -0,0 +1,246 @@
+# benchmarks/synthetic.py - Synthetic data generators shared by the benchmarks and tests
+import os
+
+import numpy as np
+import pandas as pd
+
+from src.impact_model import EventImpactModel
+
+PILLARS = ['ACCESS', 'USAGE', 'QUALITY', 'AFFORDABILITY', 'TRUST', 'DEPTH', 'GENDER']
+CONFIDENCE = ['high', 'medium', 'low', 'estimated']
+EVENT_CATEGORIES = ['product_launch', 'market_entry', 'policy', 'regulation',
+                    'infrastructure', 'partnership', 'milestone']
+# Indicators the dashboard pages look up by code
+DASHBOARD_INDICATORS = ['ACC_OWNERSHIP', 'USG_DIGITAL_PAYMENT', 'ACC_MM_ACCOUNT', 'USG_P2P_COUNT']
+
+
+def make_main_data(n_rows, n_indicators=50, seed=0):
+    """
+    Build a unified-schema frame with observations, events and targets
+    
+    Roughly 90% of rows are observations, 7% events and 3% targets, which
+    mirrors the mix of the real workbook.
+    """
+    rng = np.random.default_rng(seed)
+    record_type = rng.choice(['observation', 'event', 'target'], size=n_rows,
+                             p=[0.90, 0.07, 0.03])
+    indicator_idx = rng.integers(0, n_indicators, size=n_rows)
+    dates = pd.Timestamp('2011-01-01') + pd.to_timedelta(
+        rng.integers(0, 14 * 365, size=n_rows), unit='D')
+    
+    return pd.DataFrame({
+        'record_id': [f"REC_{i:08d}" for i in range(n_rows)],
+        'record_type': record_type,
+        'category': np.where(record_type == 'event',
+                             rng.choice(EVENT_CATEGORIES, size=n_rows), None),
+        'pillar': rng.choice(PILLARS, size=n_rows),
+        'indicator_code': [f"IND_{i:04d}" for i in indicator_idx],
+        'value_numeric': rng.normal(40, 15, size=n_rows).round(2),
+        'observation_date': dates.strftime('%Y-%m-%d'),
+        'source_name': rng.choice(['Global Findex', 'NBE', 'Ethio Telecom', 'GSMA'],
+                                  size=n_rows),
+        'confidence': rng.choice(CONFIDENCE, size=n_rows),
+    })
+
+
+def make_impact_links(n_links, n_events=20, n_indicators=50, seed=0):
+    """Build an impact-link frame connecting synthetic events to indicators"""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'record_id': [f"IMP_{i:06d}" for i in range(n_links)],
+        'parent_id': [f"EVT_{i:04d}" for i in rng.integers(0, n_events, size=n_links)],
+        'record_type': 'impact_link',
+        'pillar': rng.choice(PILLARS, size=n_links),
+        'related_indicator': [f"IND_{i:04d}" for i in rng.integers(0, n_indicators, size=n_links)],
+        'impact_direction': rng.choice(['increase', 'decrease'], size=n_links, p=[0.8, 0.2]),
+        'impact_magnitude': rng.uniform(0.01, 0.25, size=n_links).round(3),
+        'lag_months': rng.integers(0, 36, size=n_links),
+    })
+
+
+def make_events(n_events, seed=0):
+    """Build dated events with ids matching make_impact_links parent ids"""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'id': [f"EVT_{i:04d}" for i in range(n_events)],
+        'event_date': pd.Timestamp('2015-01-01') + pd.to_timedelta(
+            rng.integers(0, 10 * 365, size=n_events), unit='D'),
+        'event_name': [f"event_{i}" for i in range(n_events)],
+        'category': rng.choice(EVENT_CATEGORIES, size=n_events),
+        'description': 'synthetic event',
+    })
+
+
+def make_model(n_events, n_indicators, seed=0, nan_lags=0.0):
+    """
+    Build an EventImpactModel from random event x indicator magnitudes,
+    directions and lags, plus a baseline value per indicator
+    
+    A nan_lags share of the lags is left missing, as in unvalidated links.
+    """
+    rng = np.random.default_rng(seed)
+    index = pd.MultiIndex.from_arrays([
+        [f"event_{i}" for i in range(n_events)],
+        rng.choice(['policy', 'product_launch', 'infrastructure'], n_events),
+        pd.Timestamp('2005-01-01') + pd.to_timedelta(rng.integers(0, 8000, n_events), unit='D'),
+    ], names=['event_name', 'category', 'event_date'])
+    columns = [f"IND_{j:04d}" for j in range(n_indicators)]
+    
+    linked = rng.random((n_events, n_indicators)) < 0.3
+    magnitudes = pd.DataFrame(np.where(linked, rng.uniform(0.01, 0.2, linked.shape), 0.0),
+                              index=index, columns=columns)
+    directions = pd.DataFrame(np.where(linked, rng.choice(['increase', 'decrease'], linked.shape,
+                                                          p=[0.8, 0.2]), 'none'),
+                              index=index, columns=columns)
+    lags = rng.integers(0, 36, linked.shape).astype(float)
+    lags[rng.random(linked.shape) < nan_lags] = np.nan
+    lags = pd.DataFrame(lags, index=index, columns=columns)
+    baseline = {col: rng.uniform(5, 60) for col in columns}
+    return EventImpactModel(magnitudes, directions, lags), baseline
+
+
+def make_series(n_series, seed=0):
+    """Long frame of 3-12 noisy yearly points per series"""
+    rng = np.random.default_rng(seed)
+    counts = rng.integers(3, 13, n_series)
+    series = np.repeat(np.arange(n_series), counts)
+    years = 2000 + rng.integers(0, 25, len(series))
+    slopes = rng.normal(1.5, 1.0, n_series)[series]
+    values = 20 + slopes * (years - 2000) + rng.normal(0, 3, len(series))
+    return pd.DataFrame({'indicator_code': series, 'year': years, 'value': values})
+
+
+def make_adjustment_inputs(n_events, n_indicators, n_links, years=(2025, 2026, 2027), seed=0):
+    """Events, increase-only impact links and a flat baseline forecast per indicator"""
+    rng = np.random.default_rng(seed)
+    events = pd.DataFrame({
+        'id': [f"EVT_{i:05d}" for i in range(n_events)],
+        'event_name': [f"event_{i}" for i in range(n_events)],
+        'event_date': pd.Timestamp('2018-01-01') + pd.to_timedelta(rng.integers(0, 3000, n_events), unit='D'),
+        'category': rng.choice(['policy', 'product_launch', 'infrastructure'], n_events),
+    })
+    indicators = [f"IND_{j:04d}" for j in range(n_indicators)]
+    pairs = rng.choice(n_events * n_indicators, min(n_links, n_events * n_indicators), replace=False)
+    impact_links = pd.DataFrame({
+        'parent_id': events['id'].to_numpy()[pairs // n_indicators],
+        'related_indicator': np.asarray(indicators)[pairs % n_indicators],
+        'impact_direction': 'increase',
+        'impact_magnitude': rng.uniform(0.01, 0.1, len(pairs)),
+        'lag_months': rng.choice([3, 6, 12, 24], len(pairs)),
+    })
+    all_years = np.array(list(range(2011, 2025, 3)) + list(years))
+    forecasts = pd.DataFrame({
+        'indicator_code': np.repeat(indicators, len(all_years)),
+        'year': np.tile(all_years, n_indicators),
+        'predicted': 40.0,
+        'ci_lower': 35.0,
+        'ci_upper': 45.0,
+    })
+    return events, impact_links, forecasts
+
+
+def make_observations(n_rows, n_indicators=20, seed=0):
+    """Cleaned observations with gender disaggregations and missing values"""
+    rng = np.random.default_rng(seed)
+    values = rng.normal(40, 15, n_rows).round(2)
+    values[rng.random(n_rows) < 0.05] = np.nan
+    return pd.DataFrame({
+        'indicator_code': [f"IND_{i:04d}" for i in rng.integers(0, n_indicators, n_rows)],
+        'gender': rng.choice(['all', 'female', 'male'], n_rows, p=[0.6, 0.2, 0.2]),
+        'location': 'national',
+        'observation_date': pd.Timestamp('2011-01-01') + pd.to_timedelta(
+            rng.integers(0, 14 * 365, n_rows), unit='D'),
+        'value_numeric': values,
+    })
+
+
+def make_findex_observations(n_indicators, vintages=(2011, 2014, 2017, 2021, 2024),
+                             genders=('all', 'female', 'male'), seed=0):
+    """
+    Build cleaned observations: one linear-trend-plus-noise series per
+    indicator and gender, observed at the Findex survey vintages
+    """
+    rng = np.random.default_rng(seed)
+    n_series = n_indicators * len(genders)
+    intercept = rng.uniform(5, 30, size=n_series)
+    slope = rng.uniform(0.5, 3.0, size=n_series)
+    years = np.asarray(vintages)
+    values = (intercept[:, None] + slope[:, None] * (years - years[0])
+              + rng.normal(0, 2, size=(n_series, len(years))))
+    
+    return pd.DataFrame({
+        'indicator_code': np.repeat([f"IND_{i:04d}" for i in range(n_indicators)],
+                                    len(genders) * len(years)),
+        'gender': np.tile(np.repeat(list(genders), len(years)), n_indicators),
+        'location': 'national',
+        'observation_date': np.tile(pd.to_datetime([f"{y}-06-30" for y in years]), n_series),
+        'value_numeric': values.ravel().round(2),
+    })
+
+
+def make_forecasts(n_scenarios, years=(2025, 2026, 2027), seed=0):
+    """Build an access/usage forecast table like forecast_results_2025_2027.csv"""
+    rng = np.random.default_rng(seed)
+    names = ['pessimistic', 'base', 'optimistic'][:n_scenarios]
+    names += [f"scenario_{i}" for i in range(len(names), n_scenarios)]
+    steps = np.arange(len(years))
+    frames = []
+    for name in names:
+        access = rng.uniform(48, 56) + rng.uniform(1, 3) * steps
+        usage = rng.uniform(34, 42) + rng.uniform(1, 3) * steps
+        frames.append(pd.DataFrame({
+            'year': list(years), 'scenario': name,
+            'access_forecast': access, 'access_ci_lower': access - 2, 'access_ci_upper': access + 2,
+            'usage_forecast': usage, 'usage_ci_lower': usage - 3, 'usage_ci_upper': usage + 3,
+        }))
+    return pd.concat(frames, ignore_index=True)
+
+
+def write_processed_data(directory, n_observations, n_events=20, n_indicators=50, n_scenarios=3,
+                         seed=0):
+    """
+    Write the processed CSVs read by the dashboard (observations, events,
+    event x indicator association matrix and forecasts) to a directory
+    """
+    rng = np.random.default_rng(seed)
+    os.makedirs(directory, exist_ok=True)
+    indicators = DASHBOARD_INDICATORS + [f"IND_{i:04d}" for i in
+                                         range(max(n_indicators - len(DASHBOARD_INDICATORS), 0))]
+    
+    dates = pd.Timestamp('2011-01-01') + pd.to_timedelta(
+        rng.integers(0, 14 * 365, size=n_observations), unit='D')
+    pd.DataFrame({
+        'observation_date': dates.strftime('%Y-%m-%d'),
+        'indicator_code': rng.choice(indicators, size=n_observations),
+        'value_numeric': rng.uniform(5, 60, size=n_observations).round(1),
+        'pillar': rng.choice(['access', 'usage'], size=n_observations),
+        'source_name': rng.choice(['Global Findex', 'NBE', 'GSMA'], size=n_observations),
+        'gender': rng.choice(['all', 'female', 'male'], size=n_observations),
+    }).to_csv(os.path.join(directory, 'observations_enriched.csv'), index=False)
+    
+    events = make_events(n_events, seed=seed)
+    events['event_date'] = events['event_date'].dt.strftime('%Y-%m-%d')
+    events.to_csv(os.path.join(directory, 'events_enriched.csv'), index=False)
+    
+    linked = rng.random((n_events, len(indicators))) < 0.2
+    magnitudes = np.where(linked, rng.uniform(0.01, 0.25, linked.shape), 0.0).round(3)
+    matrix = pd.concat([events[['event_name', 'category', 'event_date']],
+                        pd.DataFrame(magnitudes, columns=indicators)], axis=1)
+    matrix.to_csv(os.path.join(directory, 'event_indicator_association_matrix.csv'), index=False)
+    
+    make_forecasts(n_scenarios, seed=seed).to_csv(
+        os.path.join(directory, 'forecast_results_2025_2027.csv'), index=False)
+    return directory
+
+
+def write_workbook(path, n_rows, n_extra_sheets=0, seed=0):
+    """Write a synthetic multi-sheet workbook shaped like the unified dataset"""
+    with pd.ExcelWriter(path, engine='openpyxl') as writer:
+        make_main_data(n_rows, seed=seed).to_excel(
+            writer, sheet_name='ethiopia_fi_unified_data', index=False)
+        make_impact_links(max(n_rows // 100, 10), seed=seed).to_excel(
+            writer, sheet_name='Impact_sheet', index=False)
+        for i in range(n_extra_sheets):
+            make_main_data(max(n_rows // 10, 10), seed=seed + i + 1).to_excel(
+                writer, sheet_name=f'extra_{i + 1}', index=False)
+    return path
@@ -9,10 +9,25 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import json
+import os
+import sys
+import time
 from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from src.artifact_cache import ArtifactCache, LazyArtifacts
+from src.correlations import CorrelationEngine
+from src.date_parsing import FormatCache, parse_dates
+from src.explorer_store import ExplorerStore, frame_fingerprint
+from src.exports import EXPORT_FORMATS, ExportCache, filter_key, frame_reader
+from src.forecast_cube import ForecastCube
+from src.instrumentation import TRACER, configure as configure_tracing, span, traced
+from src.milestones import first_crossings, format_crossing, not_reached_label
+from src.series_index import SeriesIndex
+from src.shared_store import SharedFrameStore
+
 # Set page configuration
 st.set_page_config(
     page_title="Ethiopia Financial Inclusion Dashboard",
@@ -49,16 +64,15 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-def safe_date_parse(date_series):
+def safe_date_parse(date_series, cache=None, cache_key=None):
     """Safely parse dates with mixed formats"""
     if pd.api.types.is_datetime64_any_dtype(date_series):
         return date_series
     
-    # Try different parsing strategies
     try:
-        # First try ISO8601 format
-        return pd.to_datetime(date_series, format='ISO8601', errors='coerce')
-    except:
+        # Detect the formats present and parse each group in one batch
+        return parse_dates(date_series, cache=cache, cache_key=cache_key)
+    except Exception:
         pass
     
     try:
@@ -67,131 +81,250 @@ def safe_date_parse(date_series):
     except:
         pass
     
-    try:
-        # Try just the date part (extract YYYY-MM-DD)
-        return pd.to_datetime(date_series.str.extract(r'(\d{4}-\d{2}-\d{2})')[0], errors='coerce')
-    except:
-        pass
-    
     # If all fails, return as is
     return date_series
 
+# Processed artifacts read by the dashboard
+PROCESSED_DIR = '../data/processed'
+FORECAST_PATH = os.path.join(PROCESSED_DIR, 'forecast_results_2025_2027.csv')
+SUMMARY_PATH = os.path.join(PROCESSED_DIR, 'forecast_summary.json')
+OBSERVATIONS_PATH = os.path.join(PROCESSED_DIR, 'observations_enriched.csv')
+EVENTS_PATH = os.path.join(PROCESSED_DIR, 'events_enriched.csv')
+IMPACT_MATRIX_PATH = os.path.join(PROCESSED_DIR, 'event_indicator_association_matrix.csv')
+
+# Maximum age of a cached artifact in seconds, even if its file is unchanged
+DATA_CACHE_TTL = 3600
+
+# Parquet copies of explorer tables (data/cache is not tracked)
+EXPLORER_CACHE_DIR = '../data/cache/explorer'
+EXPLORER_FILTER_COLUMNS = ['pillar', 'indicator_code']
+EXPLORER_PAGE_SIZES = [25, 50, 100, 250, 1000]
+
+# Memory-mapped Feather files of derived frames shared between sessions
+SHARED_CACHE_DIR = '../data/cache/shared'
+
+# Timing spans: JSON-lines trace file, and environment variables that turn
+# tracing (and peak memory tracking) on at startup
+TRACE_PATH = '../data/cache/trace.jsonl'
+TRACE_ENV = 'FI_DASHBOARD_TRACE'
+TRACE_MEMORY_ENV = 'FI_DASHBOARD_TRACE_MEMORY'
+
+@st.cache_resource
+def get_artifact_cache():
+    """Artifact cache shared by all sessions of this server"""
+    return ArtifactCache(ttl=DATA_CACHE_TTL)
+
+@st.cache_resource
+def get_export_cache():
+    """Generated download files shared by all sessions of this server"""
+    return ExportCache()
+
+@st.cache_resource
+def get_shared_store():
+    """Derived frames shared by all sessions of this server"""
+    return SharedFrameStore(SHARED_CACHE_DIR)
+
+@st.cache_resource
+def get_tracer():
+    """Timing span recorder shared by all sessions of this server"""
+    return configure_tracing(enabled=os.environ.get(TRACE_ENV) == '1', path=TRACE_PATH,
+                             memory=os.environ.get(TRACE_MEMORY_ENV) == '1')
+
+@st.cache_resource
+def get_page_timings():
+    """Per-page render timings shared by all sessions of this server"""
+    return {}
+
+def read_dated_csv(path, date_column):
+    """Read a processed CSV and parse one date column with the shared format cache"""
+    frame = pd.read_csv(path)
+    if date_column in frame.columns:
+        # Detected date formats are remembered between runs
+        format_cache = FormatCache('../data/cache/date_formats.json')
+        frame[date_column] = safe_date_parse(
+            frame[date_column],
+            cache=format_cache,
+            cache_key=FormatCache.key(os.path.basename(path), date_column)
+        )
+        try:
+            format_cache.save()
+        except OSError:
+            pass
+    return frame
+
+def read_summary(data):
+    with open(SUMMARY_PATH, 'r') as f:
+        return json.load(f)
+
+def fallback_forecast(data):
+    """Synthetic forecast used when the forecast file cannot be read"""
+    forecast_data = []
+    scenarios = ['pessimistic', 'base', 'optimistic']
+    years = [2025, 2026, 2027]
+    
+    for scenario in scenarios:
+        for year in years:
+            if scenario == 'pessimistic':
+                access = 50 + (year - 2025) * 1
+                usage = 36 + (year - 2025) * 1.5
+            elif scenario == 'base':
+                access = 52 + (year - 2025) * 2
+                usage = 38 + (year - 2025) * 2
+            else:  # optimistic
+                access = 54 + (year - 2025) * 3
+                usage = 40 + (year - 2025) * 3
+            
+            forecast_data.append({
+                'year': year,
+                'scenario': scenario,
+                'access_forecast': access,
+                'access_ci_lower': access - 2,
+                'access_ci_upper': access + 2,
+                'usage_forecast': usage,
+                'usage_ci_lower': usage - 3,
+                'usage_ci_upper': usage + 3
+            })
+    
+    return pd.DataFrame(forecast_data)
+
+def fallback_summary(data):
+    return {
+        'access_2024': 49.0,
+        'usage_2024': 35.0,
+        'access_2027_base': 57.0,
+        'usage_2027_base': 44.0,
+        'access_growth_2024_2027': 8.0,
+        'usage_growth_2024_2027': 9.0,
+        'access_cagr': 5.0,
+        'usage_cagr': 8.0,
+        'generated_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    }
+
+def fallback_observations(data):
+    return pd.DataFrame({
+        'observation_date': pd.to_datetime(['2011-01-01', '2014-01-01', '2017-01-01', '2021-01-01', '2024-01-01']),
+        'indicator_code': ['ACC_OWNERSHIP'] * 5,
+        'value_numeric': [14, 22, 35, 46, 49],
+        'pillar': ['access'] * 5,
+        'source_name': ['Findex'] * 5
+    })
+
+def fallback_events(data):
+    return pd.DataFrame({
+        'event_date': pd.to_datetime(['2021-05-01', '2022-08-01', '2023-08-01']),
+        'event_name': ['Telebirr Launch', 'Safaricom Entry', 'M-Pesa Launch'],
+        'category': ['product_launch', 'market_entry', 'product_launch'],
+        'description': ['National mobile money service', 'Safaricom market entry', 'M-Pesa mobile money service']
+    })
+
+# How each artifact is read and what replaces it when reading fails
+ARTIFACT_SPECS = {
+    'forecast': {
+        'paths': FORECAST_PATH,
+        'loader': lambda data: pd.read_csv(FORECAST_PATH),
+        'fallback': fallback_forecast
+    },
+    'cube': {
+        'paths': FORECAST_PATH,
+        'loader': lambda data: ForecastCube(data['forecast']),
+        'fallback': lambda data: ForecastCube(data['forecast']),
+        'report_errors': False
+    },
+    'summary': {
+        'paths': SUMMARY_PATH,
+        'loader': read_summary,
+        'fallback': fallback_summary
+    },
+    'observations': {
+        'paths': OBSERVATIONS_PATH,
+        'loader': lambda data: read_dated_csv(OBSERVATIONS_PATH, 'observation_date'),
+        'fallback': fallback_observations
+    },
+    'observation_store': {
+        'paths': OBSERVATIONS_PATH,
+        'loader': lambda data: ExplorerStore(data['observations'], EXPLORER_FILTER_COLUMNS,
+                                             cache_dir=EXPLORER_CACHE_DIR),
+        'fallback': lambda data: ExplorerStore(data['observations'], EXPLORER_FILTER_COLUMNS),
+        'report_errors': False
+    },
+    'series_index': {
+        'paths': OBSERVATIONS_PATH,
+        'loader': lambda data: SeriesIndex(data['observations']),
+        'fallback': lambda data: None
+    },
+    'correlations': {
+        'paths': OBSERVATIONS_PATH,
+        'loader': lambda data: CorrelationEngine(data['observations']),
+        'fallback': lambda data: CorrelationEngine(data['observations']),
+        'report_errors': False
+    },
+    'events': {
+        'paths': EVENTS_PATH,
+        'loader': lambda data: read_dated_csv(EVENTS_PATH, 'event_date'),
+        'fallback': fallback_events
+    },
+    'impact_matrix': {
+        'paths': IMPACT_MATRIX_PATH,
+        'loader': lambda data: pd.read_csv(IMPACT_MATRIX_PATH),
+        'fallback': lambda data: pd.DataFrame()
+    }
+}
+
 # Load data
-@st.cache_data
 def load_data():
-    """Load all required data files"""
-    try:
-        # Load forecast data
-        forecast_df = pd.read_csv('../data/processed/forecast_results_2025_2027.csv')
-        
-        # Load forecast summary
-        with open('../data/processed/forecast_summary.json', 'r') as f:
-            forecast_summary = json.load(f)
-        
-        # Load historical data
-        observations = pd.read_csv('../data/processed/observations_enriched.csv')
-        if 'observation_date' in observations.columns:
-            # Try to parse dates, handle different formats
-            observations['observation_date'] = pd.to_datetime(
-                observations['observation_date'], 
-                errors='coerce',
-                format='mixed'
-            )
-        
-        # Load events data
-        events = pd.read_csv('../data/processed/events_enriched.csv')
-        if 'event_date' in events.columns:
-            events['event_date'] = pd.to_datetime(
-                events['event_date'],
-                errors='coerce',
-                format='mixed'
-            )
-        
-        # Load impact matrix
-        impact_matrix = pd.read_csv('../data/processed/event_indicator_association_matrix.csv')
-        
-        return {
-            'forecast': forecast_df,
-            'summary': forecast_summary,
-            'observations': observations,
-            'events': events,
-            'impact_matrix': impact_matrix
-        }
-        
-    except Exception as e:
-        st.error(f"Error loading data: {e}")
-        
-        # Create fallback data
-        # Forecast data
-        forecast_data = []
-        scenarios = ['pessimistic', 'base', 'optimistic']
-        years = [2025, 2026, 2027]
-        
-        for scenario in scenarios:
-            for year in years:
-                if scenario == 'pessimistic':
-                    access = 50 + (year - 2025) * 1
-                    usage = 36 + (year - 2025) * 1.5
-                elif scenario == 'base':
-                    access = 52 + (year - 2025) * 2
-                    usage = 38 + (year - 2025) * 2
-                else:  # optimistic
-                    access = 54 + (year - 2025) * 3
-                    usage = 40 + (year - 2025) * 3
-                
-                forecast_data.append({
-                    'year': year,
-                    'scenario': scenario,
-                    'access_forecast': access,
-                    'access_ci_lower': access - 2,
-                    'access_ci_upper': access + 2,
-                    'usage_forecast': usage,
-                    'usage_ci_lower': usage - 3,
-                    'usage_ci_upper': usage + 3
-                })
-        
-        forecast_df = pd.DataFrame(forecast_data)
-        
-        # Summary
-        forecast_summary = {
-            'access_2024': 49.0,
-            'usage_2024': 35.0,
-            'access_2027_base': 57.0,
-            'usage_2027_base': 44.0,
-            'access_growth_2024_2027': 8.0,
-            'usage_growth_2024_2027': 9.0,
-            'access_cagr': 5.0,
-            'usage_cagr': 8.0,
-            'generated_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        }
-        
-        # Observations
-        observations = pd.DataFrame({
-            'observation_date': pd.to_datetime(['2011-01-01', '2014-01-01', '2017-01-01', '2021-01-01', '2024-01-01']),
-            'indicator_code': ['ACC_OWNERSHIP'] * 5,
-            'value_numeric': [14, 22, 35, 46, 49],
-            'pillar': ['access'] * 5,
-            'source_name': ['Findex'] * 5
-        })
-        
-        # Events
-        events = pd.DataFrame({
-            'event_date': pd.to_datetime(['2021-05-01', '2022-08-01', '2023-08-01']),
-            'event_name': ['Telebirr Launch', 'Safaricom Entry', 'M-Pesa Launch'],
-            'category': ['product_launch', 'market_entry', 'product_launch'],
-            'description': ['National mobile money service', 'Safaricom market entry', 'M-Pesa mobile money service']
-        })
-        
-        # Empty impact matrix
-        impact_matrix = pd.DataFrame()
-        
-        return {
-            'forecast': forecast_df,
-            'summary': forecast_summary,
-            'observations': observations,
-            'events': events,
-            'impact_matrix': impact_matrix
-        }
+    """
+    Lazily loaded dashboard data
+    
+    Artifacts are read on first access (data['forecast'], ...), so each page
+    only loads what it uses; files are re-read only when they change.
+    """
+    return LazyArtifacts(
+        get_artifact_cache(),
+        ARTIFACT_SPECS,
+        on_error=lambda name, e: st.error(f"Error loading {name} data: {e}")
+    )
+
+def shared_frame(name, data, artifacts, compute):
+    """
+    Derived frame computed once per version of its input artifacts
+    
+    Parameters:
+    -----------
+    name : str
+        Frame name in the shared store
+    data : LazyArtifacts
+        Dashboard data
+    artifacts : list of str
+        Artifacts the frame is derived from (their versions key the frame)
+    compute : callable
+        Builds the frame (with a default index) from data
+    """
+    version = '-'.join(data.version(artifact) for artifact in artifacts)
+    with span(f"shared.{name}"):
+        return get_shared_store().get(name, version, lambda: compute(data))
+
+def scenario_table(data):
+    """Access and usage forecasts per scenario and year, with growth since 2024"""
+    cube = data['cube']
+    access_2024 = data['summary'].get('access_2024', 49)
+    usage_2024 = data['summary'].get('usage_2024', 35)
+    
+    rows = []
+    for sc in cube.scenarios:
+        for year in cube.years_of(sc):
+            access = cube.value(sc, year, 'access_forecast')
+            usage = cube.value(sc, year, 'usage_forecast')
+            rows.append({
+                'scenario': sc,
+                'year': year,
+                'access_forecast': access,
+                'usage_forecast': usage,
+                'access_growth': access - access_2024,
+                'usage_growth': usage - usage_2024
+            })
+    
+    return pd.DataFrame(rows, columns=['scenario', 'year', 'access_forecast', 'usage_forecast',
+                                       'access_growth', 'usage_growth'])
 
 # Main dashboard
 def main():
@@ -243,21 +376,138 @@ def main():
         """
     )
     
-    # Load data
-    data = load_data()
-    
-    # Page routing
-    if page == "📈 Overview":
-        show_overview(data, scenario_filter)
-    elif page == "📊 Trends Analysis":
-        show_trends_analysis(data)
-    elif page == "🔮 Forecasts":
-        show_forecasts(data, scenario_filter, year_filter)
-    elif page == "🎯 Inclusion Projections":
-        show_inclusion_projections(data, scenario_filter)
-    elif page == "📋 Data":
-        show_data_explorer(data)
+    # One trace per rerun: artifact loads and the page render are nested spans
+    get_tracer()
+    with span('dashboard.rerun', page=page):
+        # Load data (artifacts are read when a page first uses them)
+        data = load_data()
+        page_start = time.perf_counter()
+        
+        # Page routing
+        if page == "📈 Overview":
+            show_overview(data, scenario_filter)
+        elif page == "📊 Trends Analysis":
+            show_trends_analysis(data)
+        elif page == "🔮 Forecasts":
+            show_forecasts(data, scenario_filter, year_filter)
+        elif page == "🎯 Inclusion Projections":
+            show_inclusion_projections(data, scenario_filter)
+        elif page == "📋 Data":
+            show_data_explorer(data)
+        
+        record_page_timing(page, time.perf_counter() - page_start, data)
+        
+        # Cache diagnostics, page timings and manual refresh
+        show_cache_diagnostics()
+        show_performance_panel()
+
+def record_page_timing(page, seconds, data):
+    """Keep first-view and latest render times, and the artifacts used, per page"""
+    timings = get_page_timings()
+    entry = timings.setdefault(page, {'views': 0, 'first_view_seconds': seconds,
+                                      'first_view_load_seconds': sum(data.timings.values())})
+    entry['views'] += 1
+    entry['last_view_seconds'] = seconds
+    entry['artifacts'] = ', '.join(data.loaded())
+
+def show_cache_diagnostics():
+    """Sidebar panel with per-artifact cache statistics and a refresh button"""
+    cache = get_artifact_cache()
+    
+    with st.sidebar.expander("⚙️ Data Cache"):
+        if st.button("🔄 Refresh data"):
+            cache.invalidate()
+            st.rerun()
+        
+        stats = cache.stats()
+        if not stats.empty:
+            st.dataframe(
+                stats,
+                use_container_width=True,
+                hide_index=True,
+                column_config={
+                    "load_seconds": st.column_config.NumberColumn("Load (s)", format="%.3f")
+                }
+            )
+        st.caption(f"Entries reload when their file changes or after {DATA_CACHE_TTL // 60} minutes.")
+        
+        timings = get_page_timings()
+        if timings:
+            st.markdown("**Page timings**")
+            st.dataframe(
+                pd.DataFrame.from_dict(timings, orient='index').rename_axis('page').reset_index(),
+                use_container_width=True,
+                hide_index=True,
+                column_config={
+                    "first_view_seconds": st.column_config.NumberColumn("First view (s)", format="%.3f"),
+                    "first_view_load_seconds": st.column_config.NumberColumn("Data load (s)", format="%.3f"),
+                    "last_view_seconds": st.column_config.NumberColumn("Last view (s)", format="%.3f")
+                }
+            )
+        
+        shared = get_shared_store().stats()
+        if not shared.empty:
+            st.markdown("**Shared frames**")
+            st.dataframe(
+                shared,
+                use_container_width=True,
+                hide_index=True,
+                column_config={
+                    "memory_mb": st.column_config.NumberColumn("Memory (MB)", format="%.2f")
+                }
+            )
+
+def show_performance_panel():
+    """Sidebar panel with the timing spans of this rerun and recent totals per span"""
+    tracer = get_tracer()
+    
+    with st.sidebar.expander("⏱️ Performance"):
+        enabled = st.checkbox("Record timing spans", value=tracer.enabled,
+                              help="Applies to every session of this server")
+        memory = st.checkbox("Track peak memory (slower)", value=tracer.memory, disabled=not enabled)
+        if enabled != tracer.enabled or (enabled and memory != tracer.memory):
+            configure_tracing(enabled=enabled, memory=memory and enabled)
+            st.rerun()
+        
+        if not tracer.enabled:
+            st.caption(f"Tracing is off. Set {TRACE_ENV}=1 to record spans from startup.")
+            return
+        
+        # Spans of this rerun that have finished (the page render and its artifact loads)
+        spans = tracer.spans(trace=tracer.current_trace())
+        if not spans.empty:
+            st.markdown("**This rerun**")
+            spans = spans.sort_values('id')
+            spans['span'] = ['\u2003' * (depth - 1) + name for depth, name in zip(spans['depth'], spans['name'])]
+            st.dataframe(
+                spans[['span', 'wall_seconds', 'cpu_seconds', 'rows', 'peak_memory_mb']],
+                use_container_width=True,
+                hide_index=True,
+                column_config={
+                    "wall_seconds": st.column_config.NumberColumn("Wall (s)", format="%.3f"),
+                    "cpu_seconds": st.column_config.NumberColumn("CPU (s)", format="%.3f"),
+                    "peak_memory_mb": st.column_config.NumberColumn("Peak mem (MB)", format="%.1f")
+                }
+            )
+        
+        summary = tracer.summary()
+        if not summary.empty:
+            st.markdown("**Recent spans (all sessions)**")
+            st.dataframe(
+                summary,
+                use_container_width=True,
+                hide_index=True,
+                column_config={
+                    "total_seconds": st.column_config.NumberColumn("Total (s)", format="%.3f"),
+                    "mean_seconds": st.column_config.NumberColumn("Mean (s)", format="%.3f"),
+                    "max_seconds": st.column_config.NumberColumn("Max (s)", format="%.3f"),
+                    "cpu_seconds": st.column_config.NumberColumn("CPU (s)", format="%.3f"),
+                    "peak_memory_mb": st.column_config.NumberColumn("Peak mem (MB)", format="%.1f")
+                }
+            )
+        st.caption(f"Spans are appended to {TRACE_PATH} (one JSON object per line).")
 
+@traced('dashboard.show_overview')
 def show_overview(data, scenario_filter):
     """Display overview page with key metrics"""
     
@@ -292,13 +542,10 @@ def show_overview(data, scenario_filter):
         st.markdown('<div class="metric-card">', unsafe_allow_html=True)
         
         # Get scenario-specific forecast
-        scenario_data = data['forecast'][
-            (data['forecast']['scenario'] == scenario_filter) &
-            (data['forecast']['year'] == 2027)
-        ]
+        cube = data['cube']
         
-        if not scenario_data.empty:
-            access_2027 = scenario_data['access_forecast'].iloc[0]
+        if cube.has(scenario_filter, 2027):
+            access_2027 = cube.value(scenario_filter, 2027, 'access_forecast')
             st.metric(
                 label=f"Projected Access 2027 ({scenario_filter})",
                 value=f"{access_2027:.1f}%",
@@ -312,8 +559,8 @@ def show_overview(data, scenario_filter):
     with col4:
         st.markdown('<div class="metric-card">', unsafe_allow_html=True)
         
-        if not scenario_data.empty:
-            usage_2027 = scenario_data['usage_forecast'].iloc[0]
+        if cube.has(scenario_filter, 2027):
+            usage_2027 = cube.value(scenario_filter, 2027, 'usage_forecast')
             st.metric(
                 label=f"Projected Usage 2027 ({scenario_filter})",
                 value=f"{usage_2027:.1f}%",
@@ -468,6 +715,7 @@ def show_overview(data, scenario_filter):
     else:
         st.info("No event data available.")
 
+@traced('dashboard.show_trends_analysis')
 def show_trends_analysis(data):
     """Display trends analysis page"""
     
@@ -496,15 +744,10 @@ def show_trends_analysis(data):
     # Historical trends
     st.markdown('<h2 class="sub-header">Historical Trends</h2>', unsafe_allow_html=True)
     
-    # Extract historical data for indicators
-    if not data['observations'].empty and 'observation_date' in data['observations'].columns:
-        # Extract year from observation_date
-        data['observations']['year'] = data['observations']['observation_date'].dt.year
-        
-        access_data = data['observations'][
-            (data['observations']['indicator_code'] == 'ACC_OWNERSHIP') &
-            (data['observations']['year'].between(start_year, end_year))
-        ]
+    # Extract historical data for indicators (binary search in the shared series index)
+    series_index = data['series_index']
+    if series_index is not None and not data['observations'].empty:
+        access_data = series_index.series('ACC_OWNERSHIP', start_year, end_year)
     else:
         # Use default data
         access_data = pd.DataFrame({
@@ -516,7 +759,7 @@ def show_trends_analysis(data):
     fig = make_subplots(
         rows=2, cols=2,
         subplot_titles=('Account Ownership Trend', 'Digital Payment Trend',
-                       'Growth Rates Comparison', 'Infrastructure Correlation'),
+                       'Growth Rates Comparison', 'Correlation with Account Ownership'),
         vertical_spacing=0.15,
         horizontal_spacing=0.15
     )
@@ -556,13 +799,10 @@ def show_trends_analysis(data):
     # Plot 3: Growth rates
     if not access_data.empty and len(access_data) > 1:
         years = access_data['year'].tolist()
-        values = access_data['value_numeric'].tolist()
+        values = access_data['value_numeric']
         
-        # Calculate growth rates
-        access_growth = []
-        for i in range(1, len(values)):
-            growth = ((values[i] - values[i-1]) / values[i-1]) * 100 if values[i-1] > 0 else 0
-            access_growth.append(growth)
+        # Growth since the previous observation (0 from a non-positive base)
+        access_growth = (values.pct_change() * 100).where(values.shift() > 0, 0).iloc[1:].tolist()
         
         # Create usage growth (simulated, typically higher)
         usage_growth = [g * 1.5 for g in access_growth]
@@ -590,21 +830,28 @@ def show_trends_analysis(data):
             row=2, col=1
         )
     
-    # Plot 4: Infrastructure correlation (simulated)
-    infrastructure_metrics = ['Mobile Penetration', '4G Coverage', 'Agent Density', 'ATM Density']
-    correlation_values = [0.85, 0.72, 0.68, 0.45]  # Simulated correlations with access
-    
-    fig.add_trace(
-        go.Bar(
-            x=infrastructure_metrics,
-            y=correlation_values,
-            name='Correlation with Access',
-            marker_color='#FF9800',
-            text=[f"{v:.2f}" for v in correlation_values],
-            textposition='auto'
-        ),
-        row=2, col=2
-    )
+    # Plot 4: Indicators most correlated with account ownership in the selected window
+    correlation_values = data['correlations'].top_correlates('ACC_OWNERSHIP', start_year, end_year)
+    
+    if not correlation_values.empty:
+        fig.add_trace(
+            go.Bar(
+                x=correlation_values.index.tolist(),
+                y=correlation_values.tolist(),
+                name='Correlation with Access',
+                marker_color='#FF9800',
+                text=[f"{v:.2f}" for v in correlation_values],
+                textposition='auto'
+            ),
+            row=2, col=2
+        )
+    else:
+        fig.add_annotation(
+            text="Not enough overlapping years",
+            showarrow=False,
+            xref="x4 domain", yref="y4 domain",
+            x=0.5, y=0.5
+        )
     
     # Update layout
     fig.update_layout(
@@ -621,7 +868,7 @@ def show_trends_analysis(data):
     fig.update_yaxes(title_text="Percentage (%)", row=1, col=2)
     fig.update_xaxes(title_text="Year", row=2, col=1)
     fig.update_yaxes(title_text="Growth Rate (%)", row=2, col=1)
-    fig.update_xaxes(title_text="Infrastructure Metric", row=2, col=2)
+    fig.update_xaxes(title_text="Indicator", row=2, col=2)
     fig.update_yaxes(title_text="Correlation Coefficient", row=2, col=2)
     
     st.plotly_chart(fig, use_container_width=True)
@@ -702,6 +949,7 @@ def show_trends_analysis(data):
     for insight in insights:
         st.markdown(f"- {insight}")
 
+@traced('dashboard.show_forecasts')
 def show_forecasts(data, scenario_filter, year_filter):
     """Display forecasts page"""
     
@@ -735,10 +983,11 @@ def show_forecasts(data, scenario_filter, year_filter):
     # Main forecast visualization
     st.markdown('<h2 class="sub-header">Forecast Visualization</h2>', unsafe_allow_html=True)
     
-    # Filter data for selected scenario
-    scenario_data = data['forecast'][data['forecast']['scenario'] == scenario]
+    # Forecast years available for the selected scenario
+    cube = data['cube']
+    scenario_years = cube.years_of(scenario)
     
-    if not scenario_data.empty:
+    if scenario_years:
         # Create forecast plot
         fig = go.Figure()
         
@@ -767,25 +1016,15 @@ def show_forecasts(data, scenario_filter, year_filter):
         ))
         
         # Forecast years
-        forecast_years = [2025, 2026, 2027]
+        forecast_years = [year for year in [2025, 2026, 2027] if year in scenario_years]
         
         # Get forecast values for selected scenario
-        access_forecast = []
-        usage_forecast = []
-        access_ci_lower = []
-        access_ci_upper = []
-        usage_ci_lower = []
-        usage_ci_upper = []
-        
-        for year in forecast_years:
-            year_data = scenario_data[scenario_data['year'] == year]
-            if not year_data.empty:
-                access_forecast.append(year_data['access_forecast'].iloc[0])
-                usage_forecast.append(year_data['usage_forecast'].iloc[0])
-                access_ci_lower.append(year_data['access_ci_lower'].iloc[0])
-                access_ci_upper.append(year_data['access_ci_upper'].iloc[0])
-                usage_ci_lower.append(year_data['usage_ci_lower'].iloc[0])
-                usage_ci_upper.append(year_data['usage_ci_upper'].iloc[0])
+        access_forecast = [cube.value(scenario, year, 'access_forecast') for year in forecast_years]
+        usage_forecast = [cube.value(scenario, year, 'usage_forecast') for year in forecast_years]
+        access_ci_lower = [cube.value(scenario, year, 'access_ci_lower') for year in forecast_years]
+        access_ci_upper = [cube.value(scenario, year, 'access_ci_upper') for year in forecast_years]
+        usage_ci_lower = [cube.value(scenario, year, 'usage_ci_lower') for year in forecast_years]
+        usage_ci_upper = [cube.value(scenario, year, 'usage_ci_upper') for year in forecast_years]
         
         # Add forecast traces
         fig.add_trace(go.Scatter(
@@ -863,24 +1102,18 @@ def show_forecasts(data, scenario_filter, year_filter):
     col1, col2 = st.columns(2)
     
     with col1:
-        # Scenario comparison for selected year
+        # Scenario comparison for selected year (derived once, shared by all sessions)
         scenarios = ['pessimistic', 'base', 'optimistic']
-        comparison_data = []
-        
-        for sc in scenarios:
-            sc_data = data['forecast'][
-                (data['forecast']['scenario'] == sc) &
-                (data['forecast']['year'] == forecast_year)
-            ]
-            if not sc_data.empty:
-                comparison_data.append({
-                    'Scenario': sc.title(),
-                    'Account Ownership': sc_data['access_forecast'].iloc[0],
-                    'Digital Payments': sc_data['usage_forecast'].iloc[0]
-                })
-        
-        if comparison_data:
-            comp_df = pd.DataFrame(comparison_data)
+        scenario_rows = shared_frame('scenario_table', data, ['forecast', 'summary'], scenario_table)
+        scenario_rows = scenario_rows[scenario_rows['year'] == forecast_year].set_index('scenario')
+        scenario_rows = scenario_rows.reindex([sc for sc in scenarios if sc in scenario_rows.index])
+        
+        if not scenario_rows.empty:
+            comp_df = pd.DataFrame({
+                'Scenario': [sc.title() for sc in scenario_rows.index],
+                'Account Ownership': scenario_rows['access_forecast'].to_numpy(),
+                'Digital Payments': scenario_rows['usage_forecast'].to_numpy()
+            })
             
             fig = go.Figure()
             
@@ -923,25 +1156,12 @@ def show_forecasts(data, scenario_filter, year_filter):
         base_2024_access = data['summary'].get('access_2024', 49)
         base_2024_usage = data['summary'].get('usage_2024', 35)
         
-        growth_data = []
-        
-        for sc in scenarios:
-            sc_data = data['forecast'][
-                (data['forecast']['scenario'] == sc) &
-                (data['forecast']['year'] == forecast_year)
-            ]
-            if not sc_data.empty:
-                access_growth = sc_data['access_forecast'].iloc[0] - base_2024_access
-                usage_growth = sc_data['usage_forecast'].iloc[0] - base_2024_usage
-                
-                growth_data.append({
-                    'Scenario': sc.title(),
-                    'Access Growth': access_growth,
-                    'Usage Growth': usage_growth
-                })
-        
-        if growth_data:
-            growth_df = pd.DataFrame(growth_data)
+        if not scenario_rows.empty:
+            growth_df = pd.DataFrame({
+                'Scenario': [sc.title() for sc in scenario_rows.index],
+                'Access Growth': scenario_rows['access_growth'].to_numpy(),
+                'Usage Growth': scenario_rows['usage_growth'].to_numpy()
+            })
             
             fig = go.Figure()
             
@@ -983,40 +1203,31 @@ def show_forecasts(data, scenario_filter, year_filter):
     
     # Define milestones
     milestones = [
-        {'name': '50% Account Ownership', 'target': 50},
-        {'name': '60% Account Ownership', 'target': 60},
-        {'name': '40% Digital Payments', 'target': 40},
-        {'name': '50% Digital Payments', 'target': 50}
+        {'name': '50% Account Ownership', 'metric': 'access_forecast', 'target': 50},
+        {'name': '60% Account Ownership', 'metric': 'access_forecast', 'target': 60},
+        {'name': '40% Digital Payments', 'metric': 'usage_forecast', 'target': 40},
+        {'name': '50% Digital Payments', 'metric': 'usage_forecast', 'target': 50}
     ]
     
-    # Calculate achievement years for each scenario
-    milestone_data = []
-    
-    for milestone in milestones:
-        row = {'Milestone': milestone['name'], 'Target': milestone['target']}
-        
-        for sc in scenarios:
-            sc_forecast = data['forecast'][data['forecast']['scenario'] == sc]
-            
-            # Find when target is reached
-            achievement_year = None
-            for year in [2025, 2026, 2027]:
-                year_data = sc_forecast[sc_forecast['year'] == year]
-                if not year_data.empty:
-                    if 'access' in milestone['name'].lower():
-                        value = year_data['access_forecast'].iloc[0]
-                    else:
-                        value = year_data['usage_forecast'].iloc[0]
-                    
-                    if value >= milestone['target']:
-                        achievement_year = year
-                        break
-            
-            row[sc.title()] = achievement_year if achievement_year else 'Not by 2027'
-        
-        milestone_data.append(row)
+    # Calculate achievement years (and interpolated months) for every scenario at once
+    crossings = first_crossings(cube, milestones, start={
+        'access_forecast': (2024, base_2024_access),
+        'usage_forecast': (2024, base_2024_usage)
+    })
+    crossings = crossings[crossings['scenario'].isin(scenarios)]
+    not_reached = not_reached_label(cube)
+    if crossings.empty:
+        crossings = crossings.assign(label=pd.Series(dtype=object))
+    else:
+        crossings['label'] = crossings.apply(format_crossing, axis=1, horizon_label=not_reached)
     
-    milestone_df = pd.DataFrame(milestone_data)
+    milestone_df = crossings.pivot(index=['milestone', 'target'], columns='scenario', values='label')
+    milestone_df = milestone_df.reindex(
+        pd.MultiIndex.from_tuples([(m['name'], m['target']) for m in milestones]),
+        columns=scenarios
+    ).fillna(not_reached)
+    milestone_df.columns = [sc.title() for sc in milestone_df.columns]
+    milestone_df = milestone_df.rename_axis(['Milestone', 'Target']).reset_index()
     
     # Display as table
     st.dataframe(
@@ -1031,6 +1242,7 @@ def show_forecasts(data, scenario_filter, year_filter):
         }
     )
 
+@traced('dashboard.show_inclusion_projections')
 def show_inclusion_projections(data, scenario_filter):
     """Display inclusion projections page"""
     
@@ -1044,13 +1256,10 @@ def show_inclusion_projections(data, scenario_filter):
     current_access = data['summary'].get('access_2024', 49)
     
     # Get projection for selected scenario
-    scenario_data = data['forecast'][
-        (data['forecast']['scenario'] == scenario_filter) &
-        (data['forecast']['year'] == 2027)
-    ]
+    cube = data['cube']
     
-    if not scenario_data.empty:
-        projected_access = scenario_data['access_forecast'].iloc[0]
+    if cube.has(scenario_filter, 2027):
+        projected_access = cube.value(scenario_filter, 2027, 'access_forecast')
     else:
         projected_access = current_access + 6  # Default estimate
     
@@ -1118,10 +1327,9 @@ def show_inclusion_projections(data, scenario_filter):
     colors = {'pessimistic': '#D32F2F', 'base': '#FF9800', 'optimistic': '#4CAF50'}
     
     for sc in ['pessimistic', 'base', 'optimistic']:
-        sc_data = data['forecast'][data['forecast']['scenario'] == sc]
-        if not sc_data.empty:
-            years = [2024] + list(sc_data['year'])
-            values = [current_access] + list(sc_data['access_forecast'])
+        if cube.years_of(sc):
+            years = [2024] + cube.years_of(sc)
+            values = [current_access] + list(cube.series(sc, 'access_forecast'))
             
             fig.add_trace(go.Scatter(
                 x=years,
@@ -1198,13 +1406,15 @@ def show_inclusion_projections(data, scenario_filter):
         """)
     
     with st.expander("3. How did inclusion change in 2025 and future outlook?"):
+        access_2025 = cube.value(scenario, 2025, 'access_forecast', default=np.nan)
+        usage_2025 = cube.value(scenario, 2025, 'usage_forecast', default=np.nan)
         st.markdown(f"""
         **2025 Projections ({scenario.title()} Scenario):**
         
-        📊 **Account Ownership**: Projected at {data['forecast'][(data['forecast']['scenario'] == scenario) & (data['forecast']['year'] == 2025)]['access_forecast'].iloc[0]:.1f}%
-          - Growth from 2024: {data['forecast'][(data['forecast']['scenario'] == scenario) & (data['forecast']['year'] == 2025)]['access_forecast'].iloc[0] - current_access:+.1f} percentage points
+        📊 **Account Ownership**: Projected at {access_2025:.1f}%
+          - Growth from 2024: {access_2025 - current_access:+.1f} percentage points
         
-        💳 **Digital Payments**: Projected at {data['forecast'][(data['forecast']['scenario'] == scenario) & (data['forecast']['year'] == 2025)]['usage_forecast'].iloc[0]:.1f}%
+        💳 **Digital Payments**: Projected at {usage_2025:.1f}%
         
         **2026-2027 Outlook:**
         - **Base Scenario**: 55-57.5% account ownership by 2027
@@ -1296,6 +1506,35 @@ def show_inclusion_projections(data, scenario_filter):
         }
     )
 
+def show_export_buttons(label, file_stem, make_key, make_reader):
+    """
+    Download buttons (one per export format) whose files are built on click
+    
+    Parameters:
+    -----------
+    label : str
+        Button text, e.g. "Forecast Data"
+    file_stem : str
+        Download file name without extension
+    make_key : callable
+        Returns what identifies the exported rows (data version and filters)
+    make_reader : callable
+        Returns a record batch reader over the rows
+    """
+    cache = get_export_cache()
+    columns = st.columns(len(EXPORT_FORMATS))
+    
+    for column, (fmt, info) in zip(columns, EXPORT_FORMATS.items()):
+        with column:
+            st.download_button(
+                label=f"Download {label} ({info['label']})",
+                data=lambda fmt=fmt: cache.get(make_key(), make_reader, fmt),
+                file_name=f"{file_stem}.{fmt}",
+                mime=info['mime'],
+                on_click='ignore'
+            )
+
+@traced('dashboard.show_data_explorer')
 def show_data_explorer(data):
     """Display data explorer page"""
     
@@ -1329,47 +1568,57 @@ def show_data_explorer(data):
             }
         )
         
-        # Download button
-        csv = data['forecast'].to_csv(index=False)
-        st.download_button(
-            label="Download Forecast Data (CSV)",
-            data=csv,
-            file_name="ethiopia_fi_forecasts_2025_2027.csv",
-            mime="text/csv"
+        # Download buttons; files are generated on click and shared between sessions
+        show_export_buttons(
+            "Forecast Data",
+            "ethiopia_fi_forecasts_2025_2027",
+            lambda: ('forecast', frame_fingerprint(data['forecast'])),
+            lambda: frame_reader(data['forecast'])
         )
         
     elif data_type == "Historical Observations":
         st.markdown('<h2 class="sub-header">Historical Observations</h2>', unsafe_allow_html=True)
         
-        # Filter options
+        store = data['observation_store']
+        
+        # Filter options come from the store's distinct-value index
         col1, col2 = st.columns(2)
         
         with col1:
             pillar_filter = st.multiselect(
                 "Filter by Pillar:",
-                options=data['observations']['pillar'].unique() if 'pillar' in data['observations'].columns else [],
+                options=store.options('pillar'),
                 default=[]
             )
         
         with col2:
             indicator_filter = st.multiselect(
                 "Filter by Indicator:",
-                options=data['observations']['indicator_code'].unique() if 'indicator_code' in data['observations'].columns else [],
+                options=store.options('indicator_code'),
                 default=[]
             )
         
-        # Apply filters
-        filtered_data = data['observations'].copy()
+        filters = {'pillar': pillar_filter, 'indicator_code': indicator_filter}
+        total_rows = store.count(filters)
         
-        if pillar_filter:
-            filtered_data = filtered_data[filtered_data['pillar'].isin(pillar_filter)]
+        # Only the current page is read from the store
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            page_size = st.selectbox("Rows per page:", EXPLORER_PAGE_SIZES, index=2)
+        
+        n_pages = max((total_rows + page_size - 1) // page_size, 1)
+        with col2:
+            page_number = st.number_input("Page:", min_value=1, max_value=n_pages, value=1, step=1)
         
-        if indicator_filter:
-            filtered_data = filtered_data[filtered_data['indicator_code'].isin(indicator_filter)]
+        page_data = store.page(filters, page=page_number - 1, page_size=page_size)
+        first_row = (page_number - 1) * page_size
+        st.caption(f"Rows {first_row + 1 if len(page_data) else 0:,}–{first_row + len(page_data):,} "
+                   f"of {total_rows:,} (page {page_number} of {n_pages})")
         
         # Display data
         st.dataframe(
-            filtered_data,
+            page_data,
             use_container_width=True,
             column_config={
                 "observation_date": st.column_config.DateColumn("Date"),
@@ -1380,13 +1629,12 @@ def show_data_explorer(data):
             }
         )
         
-        # Download button
-        csv = filtered_data.to_csv(index=False)
-        st.download_button(
-            label="Download Filtered Historical Data (CSV)",
-            data=csv,
-            file_name="ethiopia_fi_historical_data.csv",
-            mime="text/csv"
+        # Download buttons
+        show_export_buttons(
+            "Filtered Historical Data",
+            "ethiopia_fi_historical_data",
+            lambda: ('observations', store.path, filter_key(filters)),
+            lambda: store.reader(filters)
         )
         
     elif data_type == "Events Data":
@@ -1404,13 +1652,12 @@ def show_data_explorer(data):
             }
         )
         
-        # Download button
-        csv = data['events'].to_csv(index=False)
-        st.download_button(
-            label="Download Events Data (CSV)",
-            data=csv,
-            file_name="ethiopia_fi_events.csv",
-            mime="text/csv"
+        # Download buttons
+        show_export_buttons(
+            "Events Data",
+            "ethiopia_fi_events",
+            lambda: ('events', frame_fingerprint(data['events'])),
+            lambda: frame_reader(data['events'])
         )
         
     else:  # Impact Matrix
@@ -1422,13 +1669,12 @@ def show_data_explorer(data):
             use_container_width=True
         )
         
-        # Download button
-        csv = data['impact_matrix'].to_csv(index=False)
-        st.download_button(
-            label="Download Impact Matrix (CSV)",
-            data=csv,
-            file_name="ethiopia_fi_impact_matrix.csv",
-            mime="text/csv"
+        # Download buttons
+        show_export_buttons(
+            "Impact Matrix",
+            "ethiopia_fi_impact_matrix",
+            lambda: ('impact_matrix', frame_fingerprint(data['impact_matrix'])),
+            lambda: frame_reader(data['impact_matrix'])
         )
     
     st.markdown("---")
@@ -0,0 +1,224 @@
+# src/artifact_cache.py - File-change-aware in-process cache for loaded data artifacts
+import hashlib
+import os
+import threading
+import time
+
+import pandas as pd
+
+from .instrumentation import span
+
+class ArtifactCache:
+    """
+    Cache of loaded artifacts keyed on the state of their source files
+    
+    Each artifact (forecast table, summary JSON, ...) is an independent
+    entry. An entry is reused while every source file keeps its mtime and
+    size and the entry is younger than ttl; otherwise only that artifact
+    is reloaded. With hash_files, a file whose mtime or size changed is
+    hashed, and an unchanged hash still counts as a hit (e.g. after touch).
+    
+    Parameters:
+    -----------
+    ttl : float, optional
+        Maximum entry age in seconds (None keeps entries until files change)
+    hash_files : bool
+        Compare SHA-256 content hashes before reloading a changed file
+    """
+    
+    def __init__(self, ttl=None, hash_files=True):
+        self.ttl = ttl
+        self.hash_files = hash_files
+        self._entries = {}
+        self._stats = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _stat(path):
+        info = os.stat(path)
+        return info.st_mtime_ns, info.st_size
+    
+    @staticmethod
+    def _digest(path):
+        sha = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                sha.update(block)
+        return sha.hexdigest()
+    
+    def _entry_lock(self, name):
+        with self._lock:
+            return self._locks.setdefault(name, threading.Lock())
+    
+    def _record(self, name, **changes):
+        stats = self._stats.setdefault(name, {'hits': 0, 'misses': 0, 'load_seconds': None,
+                                              'loaded_at': None, 'reason': None})
+        for key, value in changes.items():
+            if key in ('hits', 'misses'):
+                stats[key] += value
+            else:
+                stats[key] = value
+    
+    def _is_fresh(self, entry, paths):
+        """Return (fresh, reason); refreshes stored stats of content-identical files"""
+        if self.ttl is not None and time.time() - entry['loaded_at'] > self.ttl:
+            return False, 'expired'
+        if list(entry['files']) != list(paths):
+            return False, 'sources changed'
+        
+        for path in paths:
+            state = self._stat(path)
+            known = entry['files'][path]
+            if state == known['stat']:
+                continue
+            if not self.hash_files or known['digest'] is None or self._digest(path) != known['digest']:
+                return False, f"{os.path.basename(path)} changed"
+            known['stat'] = state
+        return True, None
+    
+    def get(self, name, paths, loader):
+        """
+        Cached value of one artifact, reloading it if its files changed
+        
+        Parameters:
+        -----------
+        name : str
+            Artifact name
+        paths : str or list of str
+            Source files whose state keys the entry
+        loader : callable
+            Called without arguments to (re)load the artifact
+        
+        Returns:
+        --------
+        object : The loaded artifact
+        """
+        paths = [paths] if isinstance(paths, str) else list(paths)
+        
+        with self._entry_lock(name):
+            entry = self._entries.get(name)
+            reason = 'not loaded'
+            if entry is not None:
+                fresh, reason = self._is_fresh(entry, paths)
+                if fresh:
+                    self._record(name, hits=1)
+                    return entry['value']
+            
+            # Fingerprint before loading so a write during the load triggers another reload
+            files = {path: {'stat': self._stat(path),
+                            'digest': self._digest(path) if self.hash_files else None}
+                     for path in paths}
+            start = time.perf_counter()
+            value = loader()
+            elapsed = time.perf_counter() - start
+            
+            self._entries[name] = {'value': value, 'files': files, 'loaded_at': time.time()}
+            self._record(name, misses=1, load_seconds=elapsed,
+                         loaded_at=pd.Timestamp.now().floor('s'), reason=reason)
+            return value
+    
+    def version(self, name):
+        """
+        Short fingerprint of the source files an artifact was last loaded from
+        
+        Returns:
+        --------
+        str or None : Content hashes (or mtime/size without hash_files) of
+            the files, hashed together; None if the artifact is not loaded
+        """
+        entry = self._entries.get(name)
+        if entry is None:
+            return None
+        sha = hashlib.sha256()
+        for path, known in entry['files'].items():
+            sha.update(f"{path}:{known['digest'] or known['stat']};".encode())
+        return sha.hexdigest()[:16]
+    
+    def invalidate(self, name=None):
+        """Drop one artifact (or all) so the next get reloads it"""
+        with self._lock:
+            if name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(name, None)
+    
+    def stats(self):
+        """
+        Hits, misses and last load time per artifact
+        
+        Returns:
+        --------
+        DataFrame : artifact, hits, misses, load_seconds, loaded_at, reason
+            (reason for the last reload)
+        """
+        rows = [{'artifact': name, **stats} for name, stats in self._stats.items()]
+        return pd.DataFrame(rows, columns=['artifact', 'hits', 'misses', 'load_seconds',
+                                           'loaded_at', 'reason'])
+
+class LazyArtifacts:
+    """
+    Dict-like view that loads each artifact on first access
+    
+    Parameters:
+    -----------
+    cache : ArtifactCache
+        Cache the artifacts are read through
+    specs : dict
+        {name: {'paths': str or list, 'loader': callable, 'fallback': callable,
+        'report_errors': bool}}. loader and fallback receive this
+        LazyArtifacts, so derived artifacts can read others; fallback
+        (optional) is used, uncached, when loading fails
+    on_error : callable, optional
+        Called as on_error(name, exception) before falling back
+    """
+    
+    def __init__(self, cache, specs, on_error=None):
+        self.cache = cache
+        self.specs = specs
+        self.on_error = on_error
+        self.timings = {}
+        self._values = {}
+        self._versions = {}
+    
+    def __contains__(self, name):
+        return name in self.specs
+    
+    def __getitem__(self, name):
+        if name not in self._values:
+            spec = self.specs[name]
+            start = time.perf_counter()
+            with span(f"artifact.{name}") as artifact_span:
+                try:
+                    value = self.cache.get(name, spec['paths'], lambda: spec['loader'](self))
+                    self._versions[name] = self.cache.version(name)
+                except Exception as e:
+                    if spec.get('fallback') is None:
+                        raise
+                    if self.on_error is not None and spec.get('report_errors', True):
+                        self.on_error(name, e)
+                    value = spec['fallback'](self)
+                    self._versions[name] = 'fallback'
+                if isinstance(value, (pd.DataFrame, pd.Series)):
+                    artifact_span.set(rows=len(value))
+            self.timings[name] = time.perf_counter() - start
+            
+            # Cached objects are shared between reruns; callers get shallow copies
+            if isinstance(value, (pd.DataFrame, pd.Series)):
+                value = value.copy(deep=False)
+            elif isinstance(value, dict):
+                value = dict(value)
+            self._values[name] = value
+        return self._values[name]
+    
+    def get(self, name, default=None):
+        return self[name] if name in self.specs else default
+    
+    def version(self, name):
+        """Fingerprint of an artifact's source files ('fallback' for fallback data), loading it if needed"""
+        self[name]
+        return self._versions[name]
+    
+    def loaded(self):
+        """Names of the artifacts accessed so far"""
+        return list(self._values)
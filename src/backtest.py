@@ -0,0 +1,260 @@
+# src/backtest.py - Rolling-origin backtests of the trend + event-impact forecasts
+import hashlib
+import itertools
+import os
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .forecasting import (DEFAULT_SERIES_KEYS, apply_event_impacts, event_adjustments, fit_trends,
+                          observation_series, predict_trends, stack_series)
+
+# Global Findex survey years: the forecast origins of the backtest
+FINDEX_VINTAGES = [2011, 2014, 2017, 2021, 2024]
+
+METRIC_COLUMNS = ['folds', 'points', 'mae', 'rmse', 'bias', 'ci_coverage', 'pi_coverage']
+
+def _digest(frame, *params):
+    """Content hash of a frame and parameters, for fit cache file names"""
+    sha = hashlib.sha256(repr(params).encode())
+    sha.update(','.join(map(str, frame.columns)).encode())
+    sha.update(pd.util.hash_pandas_object(frame, index=False).to_numpy().tobytes())
+    return sha.hexdigest()[:24]
+
+def fold_origins(years, vintages=FINDEX_VINTAGES, min_train_years=2):
+    """
+    Vintages usable as forecast origins
+    
+    An origin needs min_train_years observed years up to and including it
+    (so a trend can be fitted) and at least one observed year after it.
+    """
+    observed = np.unique(np.asarray(list(years)))
+    return [v for v in sorted(vintages)
+            if (observed <= v).sum() >= min_train_years and (observed > v).any()]
+
+def fit_fold(train, by, cache_dir=None):
+    """
+    Batched trend fits on one fold's training data, cached by content
+    
+    Parameters:
+    -----------
+    train : DataFrame
+        Long year/value frame (observation_series) up to the origin
+    by : list of str
+        Series key columns
+    cache_dir : str, optional
+        Directory for pickled fits; a fold whose training data is unchanged
+        (e.g. every old fold after a new vintage is added) is not refitted
+    
+    Returns:
+    --------
+    tuple : (keys DataFrame, fit dict from fit_trends, cached flag)
+    """
+    train = train.sort_values(by + ['year', 'value'], kind='stable').reset_index(drop=True)
+    path = None
+    if cache_dir is not None:
+        path = os.path.join(cache_dir, f"fit-{_digest(train[by + ['year', 'value']], by)}.pkl")
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                keys, fit = pickle.load(f)
+            return keys, fit, True
+    
+    keys, xs, ys, mask = stack_series(train, by)
+    fit = fit_trends(xs, ys, mask)
+    
+    if path is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((keys, fit), f)
+        os.replace(tmp_path, path)
+    return keys, fit, False
+
+def run_fold(origin, series, impact_with_events=None, by=DEFAULT_SERIES_KEYS, horizon=6,
+             confidence_level=0.95, scale=100.0, effectiveness=1.0, cache_dir=None):
+    """
+    Forecast every series from one origin and line the forecasts up with actuals
+    
+    Trends are fitted on years up to the origin and predicted for the
+    observed years in (origin, origin + horizon]. Only events dated up to
+    the origin shift the forecasts, as in the forecasting pipeline.
+    
+    Parameters:
+    -----------
+    origin : int
+        Last year of training data
+    series : DataFrame
+        Long year/value frame for all series (observation_series)
+    impact_with_events : DataFrame, optional
+        Output of impact_model.join_impact_links; no event adjustment when omitted
+    by : list of str
+        Series key columns (missing ones are ignored)
+    horizon : int
+        Years after the origin that are scored
+    confidence_level, scale, effectiveness :
+        See forecasting.predict_trends and forecasting.apply_event_impacts
+    cache_dir : str, optional
+        See fit_fold
+    
+    Returns:
+    --------
+    tuple : (predictions DataFrame with key columns, year, origin, horizon,
+             actual, predicted and interval bounds; fold info dict)
+    """
+    start = time.perf_counter()
+    by = [col for col in by if col in series.columns]
+    train = series[series['year'] <= origin]
+    test = series[(series['year'] > origin) & (series['year'] <= origin + horizon)]
+    
+    keys, fit, cached = fit_fold(train, by, cache_dir)
+    
+    # Match each test row to its fitted series; series without training data are skipped
+    keys = keys.assign(_series=np.arange(len(keys)))
+    test = test.merge(keys, on=by, how='inner') if by else test.assign(_series=0)
+    rows = test['_series'].to_numpy()
+    row_fit = {name: values[rows] for name, values in fit.items()}
+    bands = predict_trends(row_fit, test['year'].to_numpy(dtype=float)[:, None], confidence_level)
+    
+    predictions = test[by + ['year']].reset_index(drop=True)
+    predictions.insert(len(by), 'origin', origin)
+    predictions['horizon'] = predictions['year'] - origin
+    predictions['actual'] = test['value'].to_numpy()
+    for col, values in bands.items():
+        predictions[col] = values[:, 0]
+    
+    if impact_with_events is not None and len(predictions) and 'indicator_code' in predictions:
+        known = impact_with_events[pd.to_datetime(impact_with_events['event_date']).dt.year <= origin]
+        if len(known):
+            adjustments = event_adjustments(known, sorted(predictions['year'].unique()))
+            shifted = apply_event_impacts(predictions, adjustments, scale=scale,
+                                          effectiveness=effectiveness)
+            shift = shifted['predicted'] - predictions['predicted']
+            predictions = shifted.assign(pi_lower=shifted['pi_lower'] + shift,
+                                         pi_upper=shifted['pi_upper'] + shift)
+    
+    info = {'origin': origin, 'train_rows': len(train), 'test_rows': len(predictions),
+            'fit_cached': cached, 'seconds': time.perf_counter() - start}
+    return predictions, info
+
+def summarize_backtest(predictions, by=('indicator_code',)):
+    """
+    Error and interval coverage metrics from backtest predictions
+    
+    Parameters:
+    -----------
+    predictions : DataFrame
+        Output of run_backtest (or run_fold)
+    by : tuple of str
+        Grouping columns; an overall 'ALL' row is appended when grouping
+    
+    Returns:
+    --------
+    DataFrame : by columns and METRIC_COLUMNS (coverage = share of actuals
+        inside the confidence / prediction interval; bias = mean error)
+    """
+    scored = predictions.dropna(subset=['actual', 'predicted'])
+    error = scored['predicted'] - scored['actual']
+    frame = pd.DataFrame({
+        'origin': scored['origin'],
+        'abs_error': error.abs(),
+        'sq_error': error ** 2,
+        'error': error,
+        'in_ci': scored['actual'].between(scored['ci_lower'], scored['ci_upper']),
+        'in_pi': scored['actual'].between(scored['pi_lower'], scored['pi_upper']),
+    })
+    for col in by:
+        frame[col] = scored[col]
+    
+    def metrics(group):
+        return pd.Series({
+            'folds': group['origin'].nunique(),
+            'points': len(group),
+            'mae': group['abs_error'].mean(),
+            'rmse': np.sqrt(group['sq_error'].mean()),
+            'bias': group['error'].mean(),
+            'ci_coverage': group['in_ci'].mean(),
+            'pi_coverage': group['in_pi'].mean(),
+        })
+    
+    table = metrics(frame).to_frame().T
+    if by:
+        grouped = frame.groupby(list(by), dropna=False, sort=True)[frame.columns.drop(list(by))]
+        for col in by:
+            table[col] = 'ALL'
+        table = pd.concat([grouped.apply(metrics).reset_index(), table], ignore_index=True)
+    
+    table[['folds', 'points']] = table[['folds', 'points']].astype(int)
+    return table[list(by) + METRIC_COLUMNS]
+
+def run_backtest(observations, impact_with_events=None, vintages=FINDEX_VINTAGES, by=DEFAULT_SERIES_KEYS,
+                 horizon=6, min_train_years=2, confidence_level=0.95, scale=100.0, effectiveness=1.0,
+                 cache_dir=None, n_jobs=1, model_version=None):
+    """
+    Walk-forward backtest over Findex vintages for every series
+    
+    Each usable vintage is a forecast origin (see fold_origins and
+    run_fold). Folds are independent and run in a process pool when
+    n_jobs > 1; with cache_dir, folds whose training data did not change
+    reuse their fits, so adding a vintage only fits the new folds.
+    
+    Parameters:
+    -----------
+    observations : DataFrame
+        Cleaned observations (observation_date, value_numeric, key columns)
+    impact_with_events : DataFrame, optional
+        Output of impact_model.join_impact_links
+    vintages : list of int
+        Candidate forecast origins
+    by : list of str
+        Series key columns (missing ones are ignored)
+    horizon, confidence_level, scale, effectiveness :
+        See run_fold
+    min_train_years : int
+        See fold_origins
+    cache_dir : str, optional
+        Fit cache directory (see fit_fold)
+    n_jobs : int
+        Worker processes (-1 for all CPUs)
+    model_version : str, optional
+        Added as a model_version column of the metrics, to compare versions
+    
+    Returns:
+    --------
+    dict : predictions (one row per scored point), folds (origin,
+        train_rows, test_rows, fit_cached, seconds) and metrics (per
+        indicator plus 'ALL', see summarize_backtest)
+    """
+    series = observation_series(observations, by)
+    series['year'] = series['year'].astype(int)
+    origins = fold_origins(series['year'], vintages, min_train_years)
+    
+    args = [(origin, series, impact_with_events, by, horizon, confidence_level, scale,
+             effectiveness, cache_dir) for origin in origins]
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    if n_jobs > 1 and len(args) > 1:
+        with ProcessPoolExecutor(max_workers=min(n_jobs, len(args))) as pool:
+            results = list(pool.map(run_fold, *zip(*args)))
+    else:
+        results = list(itertools.starmap(run_fold, args))
+    
+    predictions = [frame for frame, _ in results]
+    if predictions:
+        predictions = pd.concat(predictions, ignore_index=True)
+    else:
+        predictions = pd.DataFrame(columns=['origin', 'year', 'actual', 'predicted', 'ci_lower',
+                                            'ci_upper', 'pi_lower', 'pi_upper'])
+    folds = pd.DataFrame([info for _, info in results],
+                         columns=['origin', 'train_rows', 'test_rows', 'fit_cached', 'seconds'])
+    
+    group = ('indicator_code',) if 'indicator_code' in predictions.columns else ()
+    metrics = summarize_backtest(predictions, by=group)
+    if model_version is not None:
+        metrics.insert(0, 'model_version', model_version)
+    
+    print(f"Backtested {len(origins)} origins, {len(predictions)} scored points "
+          f"({int(folds['fit_cached'].sum())} fits from cache)")
+    return {'predictions': predictions, 'folds': folds, 'metrics': metrics}
@@ -0,0 +1,172 @@
+# src/correlations.py - Year x indicator matrices, growth rates and NaN-aware (lagged) correlations
+import threading
+
+import numpy as np
+import pandas as pd
+
+# Values of the disaggregation columns that mark national, all-population rows
+AGGREGATE_VALUES = {'gender': ('all',), 'location': ('national', 'all')}
+
+# Overlapping years needed before a correlation is reported
+DEFAULT_MIN_PERIODS = 3
+
+def indicator_matrix(observations, indicator_col='indicator_code', value_col='value_numeric',
+                     date_col='observation_date', aggregate_only=True):
+    """
+    Pivot observations into an aligned year x indicator matrix
+    
+    Parameters:
+    -----------
+    observations : DataFrame
+        Rows with a datetime date_col, indicator_col and value_col
+    aggregate_only : bool
+        Keep only national, all-population rows (see AGGREGATE_VALUES;
+        missing values count as aggregate) so disaggregations are not mixed in
+    
+    Returns:
+    --------
+    DataFrame : Mean value per year (index, every year between the first and
+        last observation) and indicator (columns); NaN where not observed
+    """
+    frame = observations.dropna(subset=[date_col, value_col])
+    if aggregate_only:
+        for col, values in AGGREGATE_VALUES.items():
+            if col in frame.columns:
+                frame = frame[frame[col].isna() | frame[col].isin(values)]
+    
+    years = frame[date_col].dt.year
+    matrix = pd.pivot_table(frame.assign(year=years), index='year', columns=indicator_col,
+                            values=value_col, aggfunc='mean')
+    if matrix.empty:
+        return matrix
+    return matrix.reindex(range(int(matrix.index.min()), int(matrix.index.max()) + 1))
+
+def growth_rates(matrix):
+    """
+    Percentage growth since each indicator's previous observation
+    
+    Gaps are bridged (forward-filled) before pct_change, and the result is
+    kept only for observed years, so sparse survey series still get a
+    growth rate at every observation after their first.
+    """
+    return matrix.ffill().pct_change().where(matrix.notna()) * 100
+
+def lagged_correlations(matrix, lag=0, min_periods=DEFAULT_MIN_PERIODS):
+    """
+    Pairwise Pearson correlations between all columns, optionally lagged
+    
+    Every pair uses only the rows where both values are present, like
+    DataFrame.corr, but all pairs are computed at once with matrix
+    products over the NaN masks instead of pair by pair.
+    
+    Parameters:
+    -----------
+    matrix : DataFrame
+        Rows in time order (e.g. indicator_matrix or growth_rates)
+    lag : int
+        Rows by which the column indicator leads: entry (a, b) correlates
+        a at t with b at t + lag
+    min_periods : int
+        Minimum overlapping rows for a pair; NaN otherwise
+    
+    Returns:
+    --------
+    DataFrame : Columns x columns correlation matrix
+    """
+    values = matrix.to_numpy(dtype=float)
+    n_rows = values.shape[0]
+    if lag < 0 or lag >= max(n_rows, 1):
+        return pd.DataFrame(np.nan, index=matrix.columns, columns=matrix.columns)
+    
+    # Centre each column to keep the sums well conditioned
+    observed = ~np.isnan(values)
+    counts = observed.sum(axis=0)
+    means = np.where(observed, values, 0.0).sum(axis=0) / np.maximum(counts, 1)
+    values = values - means
+    leading = values[:n_rows - lag]
+    lagging = values[lag:]
+    
+    lead_mask = ~np.isnan(leading)
+    lag_mask = ~np.isnan(lagging)
+    lead = np.where(lead_mask, leading, 0.0)
+    lagged = np.where(lag_mask, lagging, 0.0)
+    lead_mask = lead_mask.astype(float)
+    lag_mask = lag_mask.astype(float)
+    
+    # Sums over the rows where both members of each pair are present
+    count = lead_mask.T @ lag_mask
+    sum_lead = lead.T @ lag_mask
+    sum_lag = lead_mask.T @ lagged
+    sum_lead_sq = (lead * lead).T @ lag_mask
+    sum_lag_sq = lead_mask.T @ (lagged * lagged)
+    sum_product = lead.T @ lagged
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        cov = sum_product - sum_lead * sum_lag / count
+        var_lead = sum_lead_sq - sum_lead ** 2 / count
+        var_lag = sum_lag_sq - sum_lag ** 2 / count
+        corr = cov / np.sqrt(var_lead * var_lag)
+    
+    corr[(count < max(min_periods, 2)) | (var_lead <= 0) | (var_lag <= 0)] = np.nan
+    return pd.DataFrame(np.clip(corr, -1.0, 1.0), index=matrix.columns, columns=matrix.columns)
+
+class CorrelationEngine:
+    """
+    Correlations over year windows of one observation table
+    
+    The year x indicator matrix and its growth rates are built once; the
+    correlation matrix of each (start_year, end_year, lag, growth) window
+    is computed on first request and cached.
+    
+    Parameters:
+    -----------
+    observations : DataFrame
+        See indicator_matrix
+    min_periods : int
+        See lagged_correlations
+    """
+    
+    def __init__(self, observations, min_periods=DEFAULT_MIN_PERIODS, **matrix_options):
+        self.levels = indicator_matrix(observations, **matrix_options)
+        self.growth = growth_rates(self.levels)
+        self.min_periods = min_periods
+        self._results = {}
+        self._lock = threading.Lock()
+    
+    def window(self, start_year, end_year, growth=False):
+        """Year x indicator levels (or growth rates) between two years inclusive"""
+        matrix = self.growth if growth else self.levels
+        return matrix.loc[(matrix.index >= start_year) & (matrix.index <= end_year)]
+    
+    def correlations(self, start_year, end_year, lag=0, growth=False):
+        """
+        Cached correlation matrix for a window (see lagged_correlations)
+        
+        Returns:
+        --------
+        DataFrame : Indicator x indicator correlations (do not modify in place)
+        """
+        key = (int(start_year), int(end_year), int(lag), bool(growth))
+        with self._lock:
+            result = self._results.get(key)
+        if result is None:
+            result = lagged_correlations(self.window(start_year, end_year, growth),
+                                         lag=lag, min_periods=self.min_periods)
+            with self._lock:
+                self._results[key] = result
+        return result
+    
+    def top_correlates(self, indicator, start_year, end_year, n=4, lag=0, growth=False):
+        """
+        Indicators most correlated with one indicator in a window
+        
+        Returns:
+        --------
+        Series : Up to n correlations, strongest (by absolute value) first;
+            empty if the indicator is unknown or nothing overlaps enough
+        """
+        corr = self.correlations(start_year, end_year, lag, growth)
+        if indicator not in corr.index:
+            return pd.Series(dtype=float)
+        row = corr.loc[indicator].drop(indicator).dropna()
+        return row.reindex(row.abs().sort_values(ascending=False).index[:n])
@@ -2,10 +2,313 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime
+import hashlib
+import os
+import posixpath
+import zipfile
+import xml.etree.ElementTree as ET
 import warnings
 warnings.filterwarnings('ignore')
 
-def load_financial_inclusion_data(excel_path='data/raw/ethiopia_fi_unified_data.xlsx'):
+from .impact_store import ImpactLinkStore
+from .instrumentation import result_rows, traced
+from .schema import chunk_schema, coerce_frame
+
+try:
+    import pyarrow.feather as feather
+except ImportError:  # pyarrow is optional; the cache falls back to pickle
+    feather = None
+
+# Bump when the cached frame layout changes so stale entries are ignored
+CACHE_VERSION = 1
+
+_XLSX_MAIN_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+_XLSX_REL_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+_XLSX_PKG_REL_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+# Workbook parts shared by every sheet: a change in any of them can alter
+# the parsed values of all sheets (strings, number/date formats)
+_XLSX_SHARED_PARTS = ('xl/sharedStrings.xml', 'xl/styles.xml', 'xl/workbook.xml')
+
+def _hash_member(archive, info, digest, block_size=1 << 20):
+    """Feed the decompressed bytes of one zip member into a hash"""
+    with archive.open(info) as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+
+def get_sheet_fingerprints(excel_path):
+    """
+    Compute a content fingerprint for every sheet of an .xlsx workbook
+    
+    The fingerprint is a SHA-256 of the sheet's own XML part and of the
+    shared workbook parts. The parts are decompressed (streamed in blocks)
+    but not parsed, which is far cheaper than reading the sheet with pandas.
+    
+    Parameters:
+    -----------
+    excel_path : str
+        Path to the Excel file
+        
+    Returns:
+    --------
+    list : [(sheet_name, fingerprint), ...] in workbook order
+    """
+    with zipfile.ZipFile(excel_path) as archive:
+        members = {info.filename: info for info in archive.infolist()}
+        
+        workbook = ET.fromstring(archive.read('xl/workbook.xml'))
+        rels = ET.fromstring(archive.read('xl/_rels/workbook.xml.rels'))
+        
+        targets = {}
+        for rel in rels.iter(f'{_XLSX_PKG_REL_NS}Relationship'):
+            target = rel.get('Target')
+            if target.startswith('/'):
+                target = target.lstrip('/')
+            else:
+                target = posixpath.normpath(posixpath.join('xl', target))
+            targets[rel.get('Id')] = target
+        
+        shared = hashlib.sha256()
+        for part in _XLSX_SHARED_PARTS:
+            info = members.get(part)
+            if info is not None:
+                shared.update(f"{part};".encode())
+                _hash_member(archive, info, shared)
+        shared_digest = shared.hexdigest()
+        
+        fingerprints = []
+        for sheet in workbook.iter(f'{_XLSX_MAIN_NS}sheet'):
+            name = sheet.get('name')
+            part = targets.get(sheet.get(f'{_XLSX_REL_NS}id'))
+            info = members.get(part)
+            
+            digest = hashlib.sha256()
+            digest.update(f"v{CACHE_VERSION};{name};{shared_digest};".encode())
+            if info is not None:
+                _hash_member(archive, info, digest)
+            fingerprints.append((name, digest.hexdigest()))
+    
+    return fingerprints
+
+def _sheet_cache_prefix(excel_path):
+    """File name prefix for the cached sheets of one workbook path"""
+    return hashlib.sha256(os.path.abspath(excel_path).encode()).hexdigest()[:16]
+
+def _prune_sheet_cache(cache_dir, prefix, fingerprints):
+    """Remove cached sheets of a workbook whose content fingerprint is not current"""
+    try:
+        names = os.listdir(cache_dir)
+    except OSError:
+        return 0
+    
+    removed = 0
+    for name in names:
+        if not name.startswith(f"{prefix}-") or name.endswith('.tmp'):
+            continue
+        fingerprint = os.path.splitext(name)[0].rsplit('-', 1)[-1]
+        if fingerprint in fingerprints:
+            continue
+        try:
+            # Readers that still map the old file keep it (unlinked, not truncated)
+            os.remove(os.path.join(cache_dir, name))
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
+def _read_cached_sheet(cache_dir, key):
+    """Return the cached frame for a sheet cache key, or None on a miss"""
+    arrow_path = os.path.join(cache_dir, f"{key}.arrow")
+    if feather is not None and os.path.exists(arrow_path):
+        # The file is memory-mapped; split_blocks lets null-free numeric
+        # columns reference the mapped buffers, while strings and columns
+        # with nulls are still converted (copied) into pandas
+        return feather.read_table(arrow_path, memory_map=True).to_pandas(split_blocks=True)
+    
+    pickle_path = os.path.join(cache_dir, f"{key}.pkl")
+    if os.path.exists(pickle_path):
+        return pd.read_pickle(pickle_path)
+    
+    return None
+
+def _write_cached_sheet(cache_dir, key, frame):
+    """Store a parsed sheet under its cache key, preferring Arrow IPC"""
+    os.makedirs(cache_dir, exist_ok=True)
+    
+    if feather is not None:
+        arrow_path = os.path.join(cache_dir, f"{key}.arrow")
+        tmp_path = f"{arrow_path}.tmp"
+        try:
+            feather.write_feather(frame, tmp_path, compression='uncompressed')
+            os.replace(tmp_path, arrow_path)
+            return
+        except Exception:
+            # Mixed-type object columns (e.g. fiscal_year) are not Arrow-representable
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    pickle_path = os.path.join(cache_dir, f"{key}.pkl")
+    tmp_path = f"{pickle_path}.tmp"
+    frame.to_pickle(tmp_path)
+    os.replace(tmp_path, pickle_path)
+
+def _select_columns(usecols, sheet):
+    """Resolve the requested columns for one sheet (None means all)"""
+    if isinstance(usecols, dict):
+        return usecols.get(sheet)
+    return usecols
+
+def iter_workbook_sheets(excel_path, sheets=None, usecols=None):
+    """
+    Stream sheets from a single read-only handle on the workbook
+    
+    The workbook is opened and unzipped once; each sheet is walked row by
+    row and only the requested columns are materialized.
+    
+    Parameters:
+    -----------
+    excel_path : str
+        Path to the Excel file
+    sheets : list of str, optional
+        Sheet names to read, in workbook order. Defaults to every sheet.
+    usecols : list of str or dict, optional
+        Header names to keep, either for every sheet or as
+        {sheet_name: [columns]}. Unknown names are ignored.
+        
+    Yields:
+    -------
+    tuple : (sheet_name, DataFrame)
+    """
+    from openpyxl import load_workbook
+    
+    workbook = load_workbook(excel_path, read_only=True, data_only=True)
+    try:
+        wanted = set(sheets) if sheets is not None else None
+        for worksheet in workbook.worksheets:
+            if wanted is not None and worksheet.title not in wanted:
+                continue
+            
+            rows = worksheet.iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                yield worksheet.title, pd.DataFrame()
+                continue
+            
+            names = [col if col is not None else f"Unnamed: {i}"
+                     for i, col in enumerate(header)]
+            selected = _select_columns(usecols, worksheet.title)
+            if selected is not None:
+                selected = set(selected)
+                positions = [i for i, name in enumerate(names) if name in selected]
+            else:
+                positions = list(range(len(names)))
+            
+            columns = [[] for _ in positions]
+            n_rows = 0
+            last_non_empty = 0
+            for row in rows:
+                n_rows += 1
+                if any(value is not None for value in row):
+                    last_non_empty = n_rows
+                for values, pos in zip(columns, positions):
+                    value = row[pos] if pos < len(row) else None
+                    # Integral floats become ints, as pd.read_excel does
+                    if isinstance(value, float) and value.is_integer():
+                        value = int(value)
+                    values.append(value)
+            
+            # Trailing blank rows are dropped, matching pd.read_excel
+            frame = pd.DataFrame({
+                names[pos]: values[:last_non_empty]
+                for values, pos in zip(columns, positions)
+            })
+            for col in frame.columns[frame.dtypes == object]:
+                if frame[col].isna().all():
+                    frame[col] = np.nan
+                else:
+                    frame[col] = frame[col].where(frame[col].notna(), np.nan)
+            yield worksheet.title, frame
+    finally:
+        workbook.close()
+
+@traced(rows=result_rows)
+def load_workbook_sheets(excel_path, cache_dir=None, streaming=False,
+                         sheets=None, usecols=None):
+    """
+    Load sheets of a workbook, reusing cached sheets where possible
+    
+    Parameters:
+    -----------
+    excel_path : str
+        Path to the Excel file
+    cache_dir : str, optional
+        Directory holding cached sheets keyed by workbook path, parser
+        (streaming or not) and content fingerprint. Full sheets are cached,
+        so usecols only selects from the cached frame. Cached sheets of this
+        workbook whose content changed are removed. When None every sheet is
+        parsed from the workbook.
+    streaming : bool
+        Parse from one read-only workbook handle (see iter_workbook_sheets)
+        instead of re-opening the file for each sheet.
+    sheets : list of str, optional
+        Sheet names to load. Defaults to every sheet.
+    usecols : list of str or dict, optional
+        Columns to keep, for every sheet or as {sheet_name: [columns]}.
+        
+    Returns:
+    --------
+    dict : {sheet_name: DataFrame} in workbook order
+    """
+    if cache_dir is None:
+        if streaming:
+            return dict(iter_workbook_sheets(excel_path, sheets=sheets, usecols=usecols))
+        
+        excel_file = pd.ExcelFile(excel_path)
+        loaded = {}
+        for sheet in excel_file.sheet_names:
+            if sheets is not None and sheet not in sheets:
+                continue
+            selected = _select_columns(usecols, sheet)
+            frame = pd.read_excel(excel_path, sheet_name=sheet)
+            if selected is not None:
+                frame = frame[[col for col in frame.columns if col in selected]]
+            loaded[sheet] = frame
+        return loaded
+    
+    all_fingerprints = get_sheet_fingerprints(excel_path)
+    prefix = _sheet_cache_prefix(excel_path)
+    parser = 'stream' if streaming else 'excel'
+    
+    loaded = {}
+    misses = {}
+    for sheet, fingerprint in all_fingerprints:
+        if sheets is not None and sheet not in sheets:
+            continue
+        key = f"{prefix}-{parser}-{fingerprint}"
+        frame = _read_cached_sheet(cache_dir, key)
+        if frame is None:
+            misses[sheet] = key
+        loaded[sheet] = frame
+    
+    # Full sheets are cached so later calls can select different columns
+    if misses:
+        parsed = load_workbook_sheets(excel_path, streaming=streaming, sheets=list(misses))
+        for sheet, frame in parsed.items():
+            _write_cached_sheet(cache_dir, misses[sheet], frame)
+            loaded[sheet] = frame
+        _prune_sheet_cache(cache_dir, prefix, {fingerprint for _, fingerprint in all_fingerprints})
+    
+    for sheet, frame in loaded.items():
+        selected = _select_columns(usecols, sheet)
+        if selected is not None:
+            loaded[sheet] = frame[[col for col in frame.columns if col in selected]]
+    
+    print(f"Sheet cache: {len(loaded) - len(misses)} hit(s), {len(misses)} parsed")
+    return loaded
+
+@traced(rows=lambda result: len(result[0]))
+def load_financial_inclusion_data(excel_path='data/raw/ethiopia_fi_unified_data.xlsx',
+                                  cache_dir=None, streaming=False, usecols=None):
     """
     Load financial inclusion data from Excel with sheet structure
     
@@ -13,6 +316,14 @@ def load_financial_inclusion_data(excel_path='data/raw/ethiopia_fi_unified_data.
     -----------
     excel_path : str
         Path to the Excel file
+    cache_dir : str, optional
+        Directory for the per-sheet columnar cache (e.g. 'data/cache').
+        Sheets whose workbook content is unchanged are read from the cache
+        instead of being re-parsed.
+    streaming : bool
+        Read all sheets from a single read-only workbook handle.
+    usecols : list of str or dict, optional
+        Columns to materialize, for every sheet or as {sheet_name: [columns]}.
         
     Returns:
     --------
@@ -23,14 +334,14 @@ def load_financial_inclusion_data(excel_path='data/raw/ethiopia_fi_unified_data.
         # Load Excel file
         print(f"Loading data from: {excel_path}")
         
-        # Read sheet names
-        excel_file = pd.ExcelFile(excel_path)
-        sheet_names = excel_file.sheet_names
+        sheets = load_workbook_sheets(excel_path, cache_dir=cache_dir,
+                                      streaming=streaming, usecols=usecols)
+        sheet_names = list(sheets)
         print(f"Available sheets: {sheet_names}")
         
         # Load main data (sheet 1)
         if len(sheet_names) >= 1:
-            main_data = pd.read_excel(excel_path, sheet_name=sheet_names[0])
+            main_data = sheets[sheet_names[0]]
             print(f"Loaded main data from '{sheet_names[0]}': {main_data.shape}")
         else:
             main_data = pd.DataFrame()
@@ -38,7 +349,7 @@ def load_financial_inclusion_data(excel_path='data/raw/ethiopia_fi_unified_data.
         
         # Load impact links (sheet 2)
         if len(sheet_names) >= 2:
-            impact_links = pd.read_excel(excel_path, sheet_name=sheet_names[1])
+            impact_links = sheets[sheet_names[1]]
             print(f"Loaded impact links from '{sheet_names[1]}': {impact_links.shape}")
         else:
             impact_links = pd.DataFrame()
@@ -48,7 +359,7 @@ def load_financial_inclusion_data(excel_path='data/raw/ethiopia_fi_unified_data.
         additional_data = {}
         if len(sheet_names) > 2:
             for sheet in sheet_names[2:]:
-                additional_data[sheet] = pd.read_excel(excel_path, sheet_name=sheet)
+                additional_data[sheet] = sheets[sheet]
                 print(f"Loaded additional sheet '{sheet}': {additional_data[sheet].shape}")
         
         return main_data, impact_links, additional_data
@@ -65,6 +376,7 @@ def load_financial_inclusion_data(excel_path='data/raw/ethiopia_fi_unified_data.
             print("Could not load CSV files either")
             return pd.DataFrame(), pd.DataFrame(), {}
 
+@traced(rows=result_rows)
 def load_reference_codes(csv_path='data/raw/reference_codes.csv'):
     """
     Load reference codes for data validation
@@ -77,7 +389,14 @@ def load_reference_codes(csv_path='data/raw/reference_codes.csv'):
         print(f"Error loading reference codes: {e}")
         return pd.DataFrame()
 
-def separate_record_types(main_data):
+def _copy_on_write():
+    """Whether pandas copy-on-write is on (always from pandas 3.0)"""
+    if int(pd.__version__.split('.')[0]) >= 3:
+        return True
+    return pd.get_option('mode.copy_on_write') is True
+
+@traced(rows=result_rows)
+def separate_record_types(main_data, verbose=True):
     """
     Separate main data into observations, events, and targets
     
@@ -85,6 +404,8 @@ def separate_record_types(main_data):
     -----------
     main_data : DataFrame
         Combined main data
+    verbose : bool
+        Print the partition sizes
         
     Returns:
     --------
@@ -94,62 +415,89 @@ def separate_record_types(main_data):
     if main_data.empty or 'record_type' not in main_data.columns:
         return pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
     
-    observations = main_data[main_data['record_type'] == 'observation'].copy()
-    events = main_data[main_data['record_type'] == 'event'].copy()
-    targets = main_data[main_data['record_type'] == 'target'].copy()
+    # Stably sort the wanted rows by record type once; each record type is
+    # then a contiguous block, and its iloc slice is a view of the sorted
+    # frame. Copy-on-write keeps edits of one frame from reaching the others
+    # (or main_data); without it the slices are copied.
+    wanted = ['observation', 'event', 'target']
+    codes, uniques = pd.factorize(main_data['record_type'], sort=False)
+    rank = np.array([wanted.index(value) if value in wanted else len(wanted)
+                     for value in uniques] + [len(wanted)], dtype=np.uint8)
+    keys = rank[codes]
+    bounds = np.concatenate([[0], np.cumsum(np.bincount(keys, minlength=len(wanted) + 1))])
+    
+    if bounds[len(wanted)] == len(main_data) and (keys[1:] >= keys[:-1]).all():
+        grouped = main_data
+    else:
+        order = np.argsort(keys, kind='stable')
+        grouped = main_data.take(order[:bounds[len(wanted)]])
+    observations, events, targets = (grouped.iloc[bounds[i]:bounds[i + 1]]
+                                     for i in range(len(wanted)))
+    if not _copy_on_write():
+        observations, events, targets = observations.copy(), events.copy(), targets.copy()
     
-    print(f"Separated: {len(observations)} observations, {len(events)} events, {len(targets)} targets")
+    if verbose:
+        print(f"Separated: {len(observations)} observations, {len(events)} events, {len(targets)} targets")
     return observations, events, targets
 
-def clean_and_prepare_data(observations, events, targets, impact_links):
+@traced(rows=result_rows)
+def clean_and_prepare_data(observations, events, targets, impact_links, schema=None,
+                           report=None, downcast=False, verbose=True):
     """
     Clean and prepare data for analysis
     
+    Every column known to the schema (see src/schema.py) is coerced in one
+    vectorized pass: dates with their exact format, numbers (optionally
+    downcast) and coded/low-cardinality strings to category.
+    
     Parameters:
     -----------
     observations, events, targets, impact_links : DataFrames
+    schema : dict, optional
+        Column schema from schema.build_schema(); defaults to the schema
+        derived from reference_codes.xlsx and data/templates
+    report : dict, optional
+        Filled with {frame_name: {column: failure count}}
+    downcast : bool
+        Downcast numeric columns (see schema.coerce_frame)
+    verbose : bool
+        Print the columns with coercion failures
     
     Returns:
     --------
     tuple : Cleaned DataFrames
     """
-    # Clean observations
-    if not observations.empty:
-        # Convert dates
-        date_cols = ['observation_date', 'start_date', 'end_date']
-        for col in date_cols:
-            if col in observations.columns:
-                observations[col] = pd.to_datetime(observations[col], errors='coerce')
-        
-        # Ensure numeric values
-        if 'value_numeric' in observations.columns:
-            observations['value_numeric'] = pd.to_numeric(observations['value_numeric'], errors='coerce')
-    
-    # Clean events
-    if not events.empty:
-        if 'event_date' in events.columns:
-            events['event_date'] = pd.to_datetime(events['event_date'], errors='coerce')
-    
-    # Clean targets
-    if not targets.empty:
-        date_cols = ['target_date', 'start_date', 'end_date']
-        for col in date_cols:
-            if col in targets.columns:
-                targets[col] = pd.to_datetime(targets[col], errors='coerce')
+    frames = {
+        'observations': observations,
+        'events': events,
+        'targets': targets,
+        'impact_links': impact_links
+    }
     
-    # Clean impact links
-    if not impact_links.empty:
-        # Convert numeric columns
-        numeric_cols = ['impact_magnitude', 'lag_months']
-        for col in numeric_cols:
-            if col in impact_links.columns:
-                impact_links[col] = pd.to_numeric(impact_links[col], errors='coerce')
+    cleaned = []
+    for name, frame in frames.items():
+        if frame.empty:
+            cleaned.append(frame)
+            continue
+        
+        frame, failures = coerce_frame(frame, schema=schema, downcast=downcast)
+        cleaned.append(frame)
+        
+        if report is not None:
+            report[name] = failures
+        failed = {col: count for col, count in failures.items() if count}
+        if failed and verbose:
+            print(f"Coercion failures in {name}: {failed}")
     
-    return observations, events, targets, impact_links
+    return tuple(cleaned)
 
-def get_data_summary(observations, events, targets, impact_links):
+@traced(rows=lambda summary: sum(part['count'] for part in summary.values()))
+def get_data_summary(observations, events, targets, impact_links, impact_store=None):
     """
     Generate summary statistics for the datasets
+    
+    Connected impact links are counted through an ImpactLinkStore; pass
+    impact_store to reuse one already built over impact_links.
     """
     summary = {
         'observations': {
@@ -202,7 +550,303 @@ def get_data_summary(observations, events, targets, impact_links):
     # Impact links summary
     if not impact_links.empty and not events.empty:
         if 'parent_id' in impact_links.columns and 'id' in events.columns:
-            connected = impact_links['parent_id'].isin(events['id']).sum()
-            summary['impact_links']['connected_events'] = connected
+            if impact_store is None:
+                impact_store = ImpactLinkStore(impact_links)
+            summary['impact_links']['connected_events'] = impact_store.connected_count(events['id'])
+    
+    return summary
+
+class HyperLogLog:
+    """
+    Approximate distinct counter with fixed memory (2**precision registers)
+    
+    Relative error is about 1.04 / sqrt(2**precision), i.e. ~0.8% for the
+    default precision of 14 (16 KB of registers).
+    """
+    
+    def __init__(self, precision=14):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+    
+    def update(self, values):
+        values = pd.Series(values).dropna()
+        if values.empty:
+            return
+        hashes = pd.util.hash_pandas_object(values, index=False).to_numpy(dtype=np.uint64)
+        
+        index = (hashes >> np.uint64(64 - self.precision)).astype(np.intp)
+        rest = hashes << np.uint64(self.precision)
+        # Rank = position of the leftmost 1-bit in the remaining bits
+        width = 64 - self.precision
+        rank = np.full(len(rest), width + 1, dtype=np.uint8)
+        nonzero = rest != 0
+        rank[nonzero] = 64 - np.floor(np.log2(rest[nonzero].astype(np.float64))).astype(np.uint8)
+        np.maximum.at(self.registers, index, np.minimum(rank, width + 1))
+    
+    def count(self):
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5 * m and zeros:
+            # Linear counting is more accurate for small cardinalities
+            estimate = m * np.log(m / zeros)
+        return int(round(estimate))
+
+class SummaryAccumulator:
+    """
+    Incrementally maintained equivalent of get_data_summary
+    
+    Each update() costs O(batch): date ranges are running min/max,
+    cardinalities are hash sets (or HyperLogLog sketches when
+    approximate=True), and impact links whose parent event has not been
+    seen yet are parked until it arrives.
+    
+    Parameters:
+    -----------
+    approximate : bool
+        Use HyperLogLog distinct counts instead of exact sets
+    """
+    
+    def __init__(self, approximate=False):
+        self.approximate = approximate
+        self.counts = {'observations': 0, 'events': 0, 'targets': 0, 'impact_links': 0}
+        self.date_ranges = {'observations': None, 'events': None}
+        self.distinct = {
+            'indicators': self._new_distinct(),
+            'pillars': self._new_distinct(),
+            'categories': self._new_distinct()
+        }
+        self.event_ids = set()
+        self.connected_links = 0
+        # parent_id -> number of links still waiting for that event
+        self.pending_links = {}
+    
+    def _new_distinct(self):
+        return HyperLogLog() if self.approximate else set()
+    
+    def _add_distinct(self, name, values):
+        if self.approximate:
+            self.distinct[name].update(values)
+        else:
+            self.distinct[name].update(pd.Series(values).dropna().unique())
+    
+    def _count_distinct(self, name):
+        if self.approximate:
+            return self.distinct[name].count()
+        return len(self.distinct[name])
+    
+    def _update_range(self, name, dates):
+        valid_dates = dates.dropna()
+        if len(valid_dates) == 0:
+            return
+        low, high = valid_dates.min(), valid_dates.max()
+        current = self.date_ranges[name]
+        if current is not None:
+            low, high = min(current[0], low), max(current[1], high)
+        self.date_ranges[name] = (low, high)
+    
+    def update(self, new_observations=None, new_events=None, new_targets=None,
+               new_impact_links=None):
+        """
+        Fold a batch of new records into the summary
+        
+        Parameters:
+        -----------
+        new_observations, new_events, new_targets, new_impact_links : DataFrames, optional
+            Records appended since the last update
+            
+        Returns:
+        --------
+        SummaryAccumulator : self, for chaining
+        """
+        if new_observations is not None and not new_observations.empty:
+            self.counts['observations'] += len(new_observations)
+            if 'observation_date' in new_observations.columns:
+                self._update_range('observations', new_observations['observation_date'])
+            if 'indicator_code' in new_observations.columns:
+                self._add_distinct('indicators', new_observations['indicator_code'])
+            if 'pillar' in new_observations.columns:
+                self._add_distinct('pillars', new_observations['pillar'])
+        
+        if new_events is not None and not new_events.empty:
+            self.counts['events'] += len(new_events)
+            if 'event_date' in new_events.columns:
+                self._update_range('events', new_events['event_date'])
+            if 'category' in new_events.columns:
+                self._add_distinct('categories', new_events['category'])
+            if 'id' in new_events.columns:
+                for event_id in pd.Series(new_events['id']).dropna().unique():
+                    if event_id in self.event_ids:
+                        continue
+                    self.event_ids.add(event_id)
+                    self.connected_links += self.pending_links.pop(event_id, 0)
+        
+        if new_targets is not None and not new_targets.empty:
+            self.counts['targets'] += len(new_targets)
+        
+        if new_impact_links is not None and not new_impact_links.empty:
+            self.counts['impact_links'] += len(new_impact_links)
+            if 'parent_id' in new_impact_links.columns:
+                parents = new_impact_links['parent_id'].dropna().value_counts()
+                for parent_id, n_links in parents.items():
+                    if parent_id in self.event_ids:
+                        self.connected_links += int(n_links)
+                    else:
+                        self.pending_links[parent_id] = self.pending_links.get(parent_id, 0) + int(n_links)
+        
+        return self
+    
+    def summary(self):
+        """Return the current summary in the get_data_summary layout"""
+        return {
+            'observations': {
+                'count': self.counts['observations'],
+                'date_range': self.date_ranges['observations'],
+                'indicators': self._count_distinct('indicators'),
+                'pillars': self._count_distinct('pillars')
+            },
+            'events': {
+                'count': self.counts['events'],
+                'date_range': self.date_ranges['events'],
+                'categories': self._count_distinct('categories')
+            },
+            'targets': {
+                'count': self.counts['targets']
+            },
+            'impact_links': {
+                'count': self.counts['impact_links'],
+                'connected_events': self.connected_links
+            }
+        }
+
+def _iter_source_chunks(path, chunksize, columns=None):
+    """Yield raw DataFrame chunks from a CSV or Parquet file"""
+    if str(path).lower().endswith(('.parquet', '.pq')):
+        import pyarrow.parquet as pq
+        
+        parquet_file = pq.ParquetFile(path)
+        for batch in parquet_file.iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+    else:
+        # low_memory=False keeps dtypes stable within a chunk
+        for chunk in pd.read_csv(path, chunksize=chunksize, usecols=columns,
+                                 low_memory=False):
+            yield chunk
+
+def iter_records(path, chunksize=100_000, columns=None, schema=None, report=None):
+    """
+    Stream a unified-schema extract in bounded-size chunks
+    
+    Each chunk is split by record_type and cleaned with the same conversions
+    as clean_and_prepare_data, so at most one chunk is held in memory. The
+    schema is fixed once before the first chunk (see schema.chunk_schema):
+    coded fields get their reference codes as categories, so every chunk has
+    the same dtypes. Coercion failures are summed over all chunks and
+    printed once, after the last chunk.
+    
+    Parameters:
+    -----------
+    path : str
+        CSV or Parquet file with a record_type column
+    chunksize : int
+        Rows read per chunk
+    columns : list of str, optional
+        Columns to read; record_type is always included
+    schema : dict, optional
+        Column schema from schema.build_schema(); defaults to the schema
+        derived from reference_codes.xlsx and data/templates
+    report : dict, optional
+        Filled with {frame_name: {column: failure count}} over all chunks
+        
+    Yields:
+    -------
+    tuple : (observations, events, targets)
+        Cleaned DataFrames for one chunk (any of them may be empty)
+    """
+    if columns is not None and 'record_type' not in columns:
+        columns = ['record_type'] + list(columns)
+    schema = chunk_schema(schema)
+    if report is None:
+        report = {}
+    
+    for chunk in _iter_source_chunks(path, chunksize, columns=columns):
+        observations, events, targets = separate_record_types(chunk, verbose=False)
+        chunk_report = {}
+        observations, events, targets, _ = clean_and_prepare_data(
+            observations, events, targets, pd.DataFrame(), schema=schema,
+            report=chunk_report, verbose=False
+        )
+        for name, failures in chunk_report.items():
+            totals = report.setdefault(name, {})
+            for col, count in failures.items():
+                totals[col] = totals.get(col, 0) + count
+        yield observations, events, targets
+    
+    for name, failures in report.items():
+        failed = {col: count for col, count in failures.items() if count}
+        if failed:
+            print(f"Coercion failures in {name}: {failed}")
+
+class CsvSink:
+    """
+    Append chunks to a CSV file, writing the header once
+    
+    Parameters:
+    -----------
+    path : str
+        Output CSV path (overwritten on the first write)
+    """
+    
+    def __init__(self, path):
+        self.path = path
+        self.rows_written = 0
+    
+    def __call__(self, chunk):
+        if chunk.empty:
+            return
+        chunk.to_csv(self.path, mode='a' if self.rows_written else 'w',
+                     header=not self.rows_written, index=False)
+        self.rows_written += len(chunk)
+
+@traced(rows=lambda counts: sum(counts.values()))
+def ingest_records(path, sinks, chunksize=100_000, columns=None, schema=None, report=None):
+    """
+    Route a chunked extract into per-record-type sinks
+    
+    Parameters:
+    -----------
+    path : str
+        CSV or Parquet file with a record_type column
+    sinks : dict
+        {'observation': callable, 'event': callable, 'target': callable};
+        each callable receives every non-empty cleaned chunk of its record
+        type. Missing keys discard that record type.
+    chunksize : int
+        Rows read per chunk
+    columns : list of str, optional
+        Columns to read
+    schema : dict, optional
+        Column schema (see iter_records)
+    report : dict, optional
+        Filled with coercion failure counts over all chunks (see iter_records)
+        
+    Returns:
+    --------
+    dict : Row counts routed to each record type
+    """
+    counts = {'observation': 0, 'event': 0, 'target': 0}
+    
+    for chunks in iter_records(path, chunksize=chunksize, columns=columns, schema=schema,
+                               report=report):
+        for record_type, chunk in zip(('observation', 'event', 'target'), chunks):
+            if chunk.empty:
+                continue
+            counts[record_type] += len(chunk)
+            sink = sinks.get(record_type)
+            if sink is not None:
+                sink(chunk)
     
-    return summary
\ No newline at end of file
+    print(f"Ingested: {counts['observation']} observations, {counts['event']} events, "
+          f"{counts['target']} targets")
+    return counts
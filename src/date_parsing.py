@@ -0,0 +1,189 @@
+# src/date_parsing.py - Format-detecting vectorized date parser
+import json
+import os
+import pandas as pd
+
+# Tried in order during detection; month-first slashes come before
+# day-first to match pandas' own format='mixed' behaviour
+CANDIDATE_FORMATS = [
+    '%Y-%m-%d',
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%dT%H:%M:%S',
+    '%Y/%m/%d',
+    '%m/%d/%Y',
+    '%d/%m/%Y',
+    '%d-%m-%Y',
+    '%d %b %Y',
+    '%d %B %Y',
+    '%b %d, %Y',
+    '%B %d, %Y',
+    '%Y-%m',
+    '%Y',
+    'ISO8601',
+]
+
+DEFAULT_CACHE_PATH = 'data/cache/date_formats.json'
+
+def _to_naive(values, **kwargs):
+    """
+    pd.to_datetime on a Series of strings, returning naive timestamps
+    
+    Values with a UTC offset are converted to UTC and the offset dropped,
+    so offset and plain strings can share one datetime64 column.
+    """
+    return pd.to_datetime(values, utc=True, **kwargs).dt.tz_localize(None)
+
+class FormatCache:
+    """
+    Detected date formats per (file, column), persisted as JSON
+    
+    Parameters:
+    -----------
+    path : str
+        JSON file holding {"file::column": [format, ...]}
+    """
+    
+    def __init__(self, path=DEFAULT_CACHE_PATH):
+        self.path = path
+        self._formats = {}
+        self._dirty = False
+        if os.path.exists(path):
+            try:
+                with open(path, 'r') as f:
+                    self._formats = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Ignoring unreadable date format cache {path}: {e}")
+    
+    @staticmethod
+    def key(file, column):
+        return f"{os.path.basename(str(file))}::{column}"
+    
+    def get(self, key):
+        return self._formats.get(key)
+    
+    def set(self, key, formats):
+        if self._formats.get(key) != formats:
+            self._formats[key] = list(formats)
+            self._dirty = True
+    
+    def save(self):
+        """Write the cache if anything changed since it was loaded"""
+        if not self._dirty:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self._formats, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+def detect_formats(values, sample_size=2000, seed=0):
+    """
+    Find the small set of formats that covers a sample of date strings
+    
+    Parameters:
+    -----------
+    values : Series or array of str
+        Distinct (or raw) date strings
+    sample_size : int
+        Maximum number of values inspected
+    seed : int
+        Random state for the sample
+    
+    Returns:
+    --------
+    list : Formats from CANDIDATE_FORMATS in the order they should be tried
+    """
+    sample = pd.Series(values).dropna().astype(str)
+    if len(sample) > sample_size:
+        sample = sample.sample(sample_size, random_state=seed)
+    
+    formats = []
+    remaining = sample
+    for fmt in CANDIDATE_FORMATS:
+        if remaining.empty:
+            break
+        parsed = _to_naive(remaining, format=fmt, errors='coerce')
+        if parsed.notna().any():
+            formats.append(fmt)
+            remaining = remaining[parsed.isna()]
+    
+    return formats
+
+def _parse_with_formats(values, formats):
+    """Parse each format group in one vectorized call; return (parsed, unparsed mask)"""
+    parsed = pd.Series(pd.NaT, index=values.index, dtype='datetime64[ns]')
+    pending = values.notna()
+    
+    for fmt in formats:
+        if not pending.any():
+            break
+        batch = _to_naive(values[pending], format=fmt, errors='coerce')
+        hit = batch.notna()
+        parsed.loc[batch.index[hit]] = batch[hit]
+        pending.loc[batch.index[hit]] = False
+    
+    return parsed, pending
+
+def parse_dates(series, cache=None, cache_key=None, max_miss_ratio=0.01):
+    """
+    Parse a column of date strings using detected per-format batches
+    
+    Distinct strings are parsed once and broadcast back to the column.
+    Formats come from the cache when available; if they leave more than
+    max_miss_ratio of the distinct values unparsed, formats are detected
+    again and the cache entry is replaced. Values no format matches fall
+    back to pandas' element-wise format='mixed' parsing. Strings with a
+    UTC offset are converted to UTC and returned without the offset.
+    
+    Parameters:
+    -----------
+    series : Series
+        Date strings (already-parsed datetime series are returned unchanged)
+    cache : FormatCache, optional
+        Format cache shared between calls
+    cache_key : str, optional
+        Key for this column, e.g. FormatCache.key(path, column)
+    max_miss_ratio : float
+        Tolerated share of distinct values left for the slow fallback
+    
+    Returns:
+    --------
+    Series : naive datetime64 values (NaT where unparseable), same index as input
+    """
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series
+    
+    codes, uniques = pd.factorize(series.astype(object).where(series.notna(), None))
+    uniques = pd.Series(uniques, dtype=object).astype(str)
+    
+    formats = None
+    if cache is not None and cache_key is not None:
+        formats = cache.get(cache_key)
+    
+    if formats:
+        parsed, pending = _parse_with_formats(uniques, formats)
+        if pending.sum() > max_miss_ratio * max(len(uniques), 1):
+            formats = None
+    
+    if not formats:
+        formats = detect_formats(uniques)
+        parsed, pending = _parse_with_formats(uniques, formats)
+        if cache is not None and cache_key is not None:
+            cache.set(cache_key, formats)
+    
+    if pending.any():
+        leftovers = uniques[pending]
+        fallback = _to_naive(leftovers, format='mixed', errors='coerce')
+        missing = fallback.isna()
+        if missing.any():
+            extracted = leftovers[missing].str.extract(r'(\d{4}-\d{2}-\d{2})')[0]
+            fallback[missing] = _to_naive(extracted, format='%Y-%m-%d', errors='coerce')
+        parsed.loc[fallback.index] = fallback
+    
+    values = parsed.to_numpy()
+    result = pd.Series(values.take(codes), index=series.index, name=series.name)
+    result[codes < 0] = pd.NaT
+    return result
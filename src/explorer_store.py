@@ -0,0 +1,232 @@
+# src/explorer_store.py - Parquet-backed table with filter pushdown and paging for the Data Explorer
+import hashlib
+import os
+import shutil
+import tempfile
+import weakref
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is optional elsewhere; the store needs it
+    pa = ds = pq = None
+
+DEFAULT_ROW_GROUP_SIZE = 65_536
+
+# Rows per record batch when streaming matches out of the store
+DEFAULT_BATCH_SIZE = 50_000
+
+def frame_fingerprint(frame):
+    """Content hash of a frame (values and column names), for cache file names"""
+    digest = hashlib.sha256(','.join(map(str, frame.columns)).encode())
+    digest.update(pd.util.hash_pandas_object(frame, index=False).to_numpy().tobytes())
+    return digest.hexdigest()[:16]
+
+def arrow_table(frame):
+    """Arrow table of a frame; mixed-type object columns are stored as strings"""
+    try:
+        return pa.Table.from_pandas(frame, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        frame = frame.copy()
+        for col in frame.columns:
+            if frame[col].dtype == object:
+                frame[col] = frame[col].where(frame[col].isna(), frame[col].astype(str))
+        return pa.Table.from_pandas(frame, preserve_index=False)
+
+class ExplorerStore:
+    """
+    Read-only table served page by page from a Parquet file
+    
+    The frame is written once, sorted by the index columns, so row-group
+    min/max statistics let filters on those columns skip whole row groups.
+    Row counts per combination of index column values are kept in memory:
+    they give the multiselect options and exact totals for any filter
+    without touching the file. Each combination is one contiguous run of
+    rows, so a page filtered on index columns maps to file positions and
+    only the row groups holding them are decoded; within each combination
+    rows keep their original order.
+    
+    Parameters:
+    -----------
+    frame : DataFrame
+        Table to serve
+    index_columns : list of str
+        Low-cardinality columns users filter on (e.g. pillar, indicator_code);
+        missing columns are ignored
+    cache_dir : str, optional
+        Directory for the Parquet file, named after the frame's content hash
+        so rebuilds for unchanged data reuse it. A temporary directory,
+        removed with the store, is used when omitted.
+    row_group_size : int
+        Rows per Parquet row group
+    """
+    
+    def __init__(self, frame, index_columns, cache_dir=None, row_group_size=DEFAULT_ROW_GROUP_SIZE):
+        if pa is None:
+            raise ImportError("ExplorerStore requires pyarrow")
+        
+        self.index_columns = [col for col in index_columns if col in frame.columns]
+        self.columns = list(frame.columns)
+        self.num_rows = len(frame)
+        
+        if cache_dir is None:
+            cache_dir = tempfile.mkdtemp(prefix='explorer_store_')
+            weakref.finalize(self, shutil.rmtree, cache_dir, ignore_errors=True)
+        os.makedirs(cache_dir, exist_ok=True)
+        self.path = os.path.join(cache_dir, f"{frame_fingerprint(frame)}.parquet")
+        
+        if self.index_columns:
+            frame = frame.sort_values(self.index_columns, kind='stable', na_position='last')
+        if not os.path.exists(self.path):
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            pq.write_table(arrow_table(frame), tmp_path, row_group_size=row_group_size)
+            os.replace(tmp_path, self.path)
+        self.dataset = ds.dataset(self.path, format='parquet')
+        metadata = pq.read_metadata(self.path)
+        self._row_group_starts = np.cumsum(
+            [0] + [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)])
+        
+        # Distinct-value index: rows per combination of index column values,
+        # in file order, with the file position where each combination starts
+        if self.index_columns:
+            counts = frame.groupby(self.index_columns, dropna=False, sort=False, observed=True).size()
+            self.counts = counts.rename('rows').reset_index()
+        else:
+            self.counts = pd.DataFrame({'rows': [self.num_rows]})
+        self.counts['start'] = np.cumsum(self.counts['rows'].to_numpy()) - self.counts['rows'].to_numpy()
+        self.distinct = {col: sorted(self.counts[col].dropna().unique().tolist())
+                         for col in self.index_columns}
+    
+    def options(self, column):
+        """Distinct non-null values of an index column, sorted"""
+        return list(self.distinct.get(column, []))
+    
+    def _active(self, filters):
+        return {col: list(values) for col, values in (filters or {}).items() if len(values)}
+    
+    def _expression(self, filters):
+        expression = None
+        for col, values in self._active(filters).items():
+            condition = ds.field(col).isin(values)
+            expression = condition if expression is None else expression & condition
+        return expression
+    
+    def count(self, filters=None):
+        """
+        Number of rows matching the filters
+        
+        Filters on index columns are answered from the in-memory counts;
+        other columns need a scan of the (pruned) file.
+        
+        Parameters:
+        -----------
+        filters : dict, optional
+            {column: values}; rows match if every non-empty column filter
+            contains their value
+        
+        Returns:
+        --------
+        int : Matching rows
+        """
+        filters = self._active(filters)
+        if any(col not in self.index_columns for col in filters):
+            return self.dataset.count_rows(filter=self._expression(filters))
+        return int(self.counts.loc[self._matching(filters), 'rows'].sum())
+    
+    def _matching(self, filters):
+        """Mask of the index combinations matching filters on index columns"""
+        mask = np.ones(len(self.counts), dtype=bool)
+        for col, values in filters.items():
+            mask &= self.counts[col].isin(values).to_numpy()
+        return mask
+    
+    def _schema(self, columns):
+        if columns is None:
+            return self.dataset.schema
+        return pa.schema([self.dataset.schema.field(col) for col in columns],
+                         metadata=self.dataset.schema.metadata)
+    
+    def page(self, filters=None, page=0, page_size=100, columns=None):
+        """
+        One page of the rows matching the filters
+        
+        With filters on index columns only, the page's file positions come
+        from the in-memory counts and just the row groups holding them are
+        read, whatever the page number. Other filters scan the matches up to
+        the page.
+        
+        Parameters:
+        -----------
+        filters : dict, optional
+            See count
+        page : int
+            Zero-based page number
+        page_size : int
+            Rows per page
+        columns : list of str, optional
+            Columns to read (all by default)
+        
+        Returns:
+        --------
+        DataFrame : At most page_size rows
+        """
+        skip = max(int(page), 0) * page_size
+        active = self._active(filters)
+        if all(col in self.index_columns for col in active):
+            return self._seek(active, skip, page_size, columns)
+        
+        needed = page_size
+        batches = []
+        
+        for batch in self.dataset.to_batches(columns=columns, filter=self._expression(filters)):
+            if skip >= batch.num_rows:
+                skip -= batch.num_rows
+                continue
+            batch = batch.slice(skip, needed)
+            skip = 0
+            batches.append(batch)
+            needed -= batch.num_rows
+            if needed <= 0:
+                break
+        
+        table = pa.Table.from_batches(batches, schema=self._schema(columns))
+        return table.to_pandas()
+    
+    def _seek(self, filters, skip, page_size, columns):
+        """Rows skip..skip + page_size of the matches, read by file position"""
+        matching = self.counts.loc[self._matching(filters), ['start', 'rows']].to_numpy()
+        ends = np.cumsum(matching[:, 1])
+        first = np.searchsorted(ends, skip, side='right')
+        last = np.searchsorted(ends, skip + page_size, side='left')
+        
+        positions = []
+        for start, rows, end in zip(*matching[first:last + 1].T, ends[first:last + 1]):
+            begin = max(skip - (end - rows), 0)
+            stop = min(skip + page_size - (end - rows), rows)
+            positions.append(np.arange(start + begin, start + stop))
+        if not positions:
+            return self._schema(columns).empty_table().to_pandas()
+        positions = np.concatenate(positions)
+        
+        # Read the row groups holding the positions, then take them
+        groups = np.searchsorted(self._row_group_starts, positions, side='right') - 1
+        selected = np.unique(groups)
+        sizes = self._row_group_starts[selected + 1] - self._row_group_starts[selected]
+        offsets = np.cumsum(sizes) - sizes
+        local = positions - self._row_group_starts[groups] + offsets[np.searchsorted(selected, groups)]
+        table = pq.ParquetFile(self.path).read_row_groups(selected.tolist(), columns=columns)
+        return table.take(local).to_pandas()
+    
+    def read(self, filters=None, columns=None):
+        """All rows matching the filters, read with pushdown"""
+        return self.dataset.to_table(columns=columns, filter=self._expression(filters)).to_pandas()
+    
+    def reader(self, filters=None, columns=None, batch_size=DEFAULT_BATCH_SIZE):
+        """Record batch reader streaming the rows matching the filters"""
+        scanner = self.dataset.scanner(columns=columns, filter=self._expression(filters),
+                                       batch_size=batch_size)
+        return scanner.to_reader()
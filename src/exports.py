@@ -0,0 +1,165 @@
+# src/exports.py - Streamed, compressed table exports with a shared cache of the generated files
+import gzip
+import io
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is optional elsewhere; Parquet exports need it
+    pq = None
+
+from .explorer_store import DEFAULT_BATCH_SIZE, arrow_table
+
+# Download formats by file extension: button label and MIME type
+EXPORT_FORMATS = {
+    'csv.gz': {'label': 'CSV (gzip)', 'mime': 'application/gzip'},
+    'parquet': {'label': 'Parquet', 'mime': 'application/vnd.apache.parquet'},
+}
+
+# Total size of the cached export files kept per process
+DEFAULT_EXPORT_CACHE_MB = 256
+
+def frame_reader(frame, batch_size=DEFAULT_BATCH_SIZE):
+    """Record batch reader over an in-memory frame"""
+    return arrow_table(frame).to_reader(max_chunksize=batch_size)
+
+def filter_key(filters):
+    """Hashable, order-insensitive form of {column: values} filters"""
+    return tuple(sorted((col, tuple(sorted(map(str, values))))
+                        for col, values in (filters or {}).items() if len(values)))
+
+def write_export(reader, fileobj, fmt, compresslevel=6):
+    """
+    Write a record batch stream as gzip CSV or Parquet, batch by batch
+    
+    Only one batch is held as a DataFrame (CSV) or buffered for a row
+    group (Parquet) at a time.
+    
+    Parameters:
+    -----------
+    reader : pyarrow.RecordBatchReader
+        Rows to export (ExplorerStore.reader or frame_reader)
+    fileobj : binary file-like
+        Destination
+    fmt : str
+        'csv.gz' or 'parquet'
+    compresslevel : int
+        gzip level for CSV
+    """
+    if fmt == 'csv.gz':
+        # mtime=0 keeps the bytes identical for identical data
+        with gzip.GzipFile(fileobj=fileobj, mode='wb', compresslevel=compresslevel, mtime=0) as gz:
+            header = True
+            for batch in reader:
+                gz.write(batch.to_pandas().to_csv(index=False, header=header).encode('utf-8'))
+                header = False
+            if header:
+                gz.write(pd.DataFrame(columns=reader.schema.names).to_csv(index=False).encode('utf-8'))
+    elif fmt == 'parquet':
+        if pq is None:
+            raise ImportError("Parquet exports require pyarrow")
+        with pq.ParquetWriter(fileobj, reader.schema, compression='zstd') as writer:
+            for batch in reader:
+                writer.write_batch(batch)
+    else:
+        raise ValueError(f"Unknown export format: {fmt}")
+
+def export_bytes(reader, fmt):
+    """Contents of an export file (see write_export)"""
+    buffer = io.BytesIO()
+    write_export(reader, buffer, fmt)
+    return buffer.getvalue()
+
+class ExportCache:
+    """
+    Process-wide LRU cache of generated export files
+    
+    Entries are keyed by what identifies the exported rows (data version
+    and filter state) plus the format. Requests for the same key wait for
+    a single generation and then share its bytes, so concurrent users
+    exporting the same selection hold one copy.
+    
+    Parameters:
+    -----------
+    max_mb : float
+        Size limit of the cached files; least recently used entries are
+        dropped beyond it, and a file larger than the limit is returned
+        without being cached
+    """
+    
+    def __init__(self, max_mb=DEFAULT_EXPORT_CACHE_MB):
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._bytes = 0
+        # Locks of keys being generated; removed once the entry is stored
+        self._locks = {}
+        self._lock = threading.Lock()
+    
+    def _entry_lock(self, key):
+        with self._lock:
+            return self._locks.setdefault(key, threading.Lock())
+    
+    def _lookup(self, key):
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+    
+    def get(self, key, make_reader, fmt):
+        """
+        Export file for a key, generating it on a miss
+        
+        Parameters:
+        -----------
+        key : hashable
+            Identifies the exported rows, e.g. (data fingerprint, filter_key(filters))
+        make_reader : callable
+            Returns the record batch reader to export; only called on a miss
+        fmt : str
+            See EXPORT_FORMATS
+        
+        Returns:
+        --------
+        bytes : File contents
+        """
+        key = (key, fmt)
+        data = self._lookup(key)
+        if data is not None:
+            return data
+        
+        entry_lock = self._entry_lock(key)
+        with entry_lock:
+            # Another request may have generated it while we waited
+            data = self._lookup(key)
+            if data is not None:
+                return data
+            
+            data = export_bytes(make_reader(), fmt)
+            with self._lock:
+                self.misses += 1
+                if len(data) <= self.max_bytes:
+                    self._entries[key] = data
+                    self._bytes += len(data)
+                    while self._bytes > self.max_bytes:
+                        _, evicted = self._entries.popitem(last=False)
+                        self._bytes -= len(evicted)
+                if self._locks.get(key) is entry_lock:
+                    del self._locks[key]
+            return data
+    
+    def size(self):
+        """Bytes held by cached exports"""
+        with self._lock:
+            return self._bytes
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
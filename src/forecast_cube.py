@@ -0,0 +1,86 @@
+# src/forecast_cube.py - Dense (scenario, year, metric) array over forecast results
+import numpy as np
+import pandas as pd
+
+class ForecastCube:
+    """
+    Forecast results packed into a dense NumPy cube with dict-based indexes
+    
+    Built once from the long forecast table (one row per scenario and
+    year); every lookup is then a couple of dict accesses and an array
+    index instead of boolean masks over the DataFrame. Combinations
+    missing from the table hold NaN.
+    
+    Parameters:
+    -----------
+    forecast : DataFrame
+        Rows with scenario, year and numeric metric columns
+        (access_forecast, access_ci_lower, ...). For duplicate
+        (scenario, year) rows the first one is kept, like .iloc[0].
+    """
+    
+    def __init__(self, forecast):
+        forecast = forecast.drop_duplicates(['scenario', 'year'], keep='first')
+        self.metrics = [col for col in forecast.columns
+                        if col not in ('scenario', 'year')
+                        and pd.api.types.is_numeric_dtype(forecast[col])]
+        
+        scenario_codes, scenarios = pd.factorize(forecast['scenario'])
+        years = np.sort(forecast['year'].astype(int).unique())
+        year_codes = np.searchsorted(years, forecast['year'].astype(int).to_numpy())
+        
+        self.scenarios = list(scenarios)
+        self.years = [int(y) for y in years]
+        self._scenario_index = {s: i for i, s in enumerate(self.scenarios)}
+        self._year_index = {y: j for j, y in enumerate(self.years)}
+        self._metric_index = {m: k for k, m in enumerate(self.metrics)}
+        
+        self.values = np.full((len(self.scenarios), len(self.years), len(self.metrics)), np.nan)
+        self.values[scenario_codes, year_codes, :] = forecast[self.metrics].to_numpy(dtype=float)
+        self._present = np.zeros((len(self.scenarios), len(self.years)), dtype=bool)
+        self._present[scenario_codes, year_codes] = True
+    
+    def __len__(self):
+        return int(self._present.sum())
+    
+    def has(self, scenario, year):
+        """True if the table had a row for this scenario and year"""
+        i = self._scenario_index.get(scenario)
+        j = self._year_index.get(int(year))
+        return i is not None and j is not None and bool(self._present[i, j])
+    
+    def value(self, scenario, year, metric, default=None):
+        """One metric for one scenario and year, or default if absent"""
+        if not self.has(scenario, year) or metric not in self._metric_index:
+            return default
+        return float(self.values[self._scenario_index[scenario], self._year_index[int(year)],
+                                 self._metric_index[metric]])
+    
+    def years_of(self, scenario):
+        """Years with a row for the scenario, ascending"""
+        i = self._scenario_index.get(scenario)
+        if i is None:
+            return []
+        return [y for y, present in zip(self.years, self._present[i]) if present]
+    
+    def series(self, scenario, metric):
+        """Metric values over years_of(scenario), as an array"""
+        i = self._scenario_index.get(scenario)
+        if i is None or metric not in self._metric_index:
+            return np.empty(0)
+        return self.values[i, self._present[i], self._metric_index[metric]]
+    
+    def across_scenarios(self, scenarios, year, metric):
+        """
+        One metric for several scenarios in a given year
+        
+        Returns:
+        --------
+        dict : {scenario: value} for the scenarios that have the year
+        """
+        values = {}
+        for sc in scenarios:
+            value = self.value(sc, year, metric)
+            if value is not None:
+                values[sc] = value
+        return values
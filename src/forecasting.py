@@ -0,0 +1,354 @@
+# src/forecasting.py - Batched linear trend forecasts with confidence and prediction intervals
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from .impact_model import DEFAULT_LAG_MONTHS, DIRECTION_SIGNS
+from .impact_store import ImpactLinkStore
+
+FORECAST_COLUMNS = ['predicted', 'ci_lower', 'ci_upper', 'pi_lower', 'pi_upper']
+
+DEFAULT_SERIES_KEYS = ['indicator_code', 'gender', 'location']
+
+DEFAULT_FORECAST_YEARS = [2025, 2026, 2027]
+
+# Interval shifts applied with an event adjustment, as in the Task 4 notebook
+CI_LOWER_SHARE = 0.8
+CI_UPPER_SHARE = 1.2
+
+def observation_series(observations, by=DEFAULT_SERIES_KEYS):
+    """
+    Long year/value frame from cleaned observations, one series per key combination
+    
+    Parameters:
+    -----------
+    observations : DataFrame
+        Observations with observation_date and value_numeric
+    by : list of str
+        Columns identifying a series (missing ones are ignored)
+    
+    Returns:
+    --------
+    DataFrame : key columns plus year and value, rows without either dropped
+    """
+    keys = [col for col in by if col in observations.columns]
+    frame = observations[keys].copy()
+    frame['year'] = pd.to_datetime(observations['observation_date'], errors='coerce').dt.year
+    frame['value'] = pd.to_numeric(observations['value_numeric'], errors='coerce')
+    return frame.dropna(subset=['year', 'value'])
+
+def stack_series(frame, by, x='year', y='value'):
+    """
+    Pack a long frame into padded (series, observations) arrays
+    
+    Returns:
+    --------
+    tuple : (keys DataFrame, x array, y array, mask array)
+        Padding cells hold 0 and are False in mask
+    """
+    if by:
+        group = frame.groupby(list(by), sort=True, observed=True, dropna=False).ngroup().to_numpy()
+    else:
+        group = np.zeros(len(frame), dtype=np.intp)
+    
+    order = np.argsort(group, kind='stable')
+    group = group[order]
+    n_series = int(group.max()) + 1 if len(group) else 0
+    counts = np.bincount(group, minlength=n_series)
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    slot = np.arange(len(group)) - starts[group]
+    
+    width = int(counts.max()) if n_series else 0
+    xs = np.zeros((n_series, width))
+    ys = np.zeros((n_series, width))
+    mask = np.zeros((n_series, width), dtype=bool)
+    xs[group, slot] = frame[x].to_numpy(dtype=float)[order]
+    ys[group, slot] = frame[y].to_numpy(dtype=float)[order]
+    mask[group, slot] = True
+    
+    if by:
+        keys = frame.iloc[order[starts]][list(by)].reset_index(drop=True)
+    else:
+        keys = pd.DataFrame(index=range(n_series))
+    return keys, xs, ys, mask
+
+def fit_trends(xs, ys, mask):
+    """
+    Solve y = b0 + b1 * x for every row of padded arrays at once
+    
+    For a single regressor the normal equations reduce to centred sums,
+    so each series costs a handful of vectorized reductions.
+    
+    Returns:
+    --------
+    dict : intercept, slope, n, x_mean, sxx and sigma2 (residual variance)
+        per series; NaN where a series has fewer than 2 distinct x values
+        (slope) or fewer than 3 points (sigma2)
+    """
+    weight = mask.astype(float)
+    n = weight.sum(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        x_mean = (xs * weight).sum(axis=1) / n
+        y_mean = (ys * weight).sum(axis=1) / n
+        dx = (xs - x_mean[:, None]) * weight
+        dy = (ys - y_mean[:, None]) * weight
+        sxx = (dx * dx).sum(axis=1)
+        sxy = (dx * dy).sum(axis=1)
+        
+        slope = np.where(sxx > 0, sxy / sxx, np.nan)
+        intercept = y_mean - slope * x_mean
+        
+        residuals = (ys - intercept[:, None] - slope[:, None] * xs) * weight
+        dof = n - 2
+        sigma2 = np.where(dof > 0, (residuals * residuals).sum(axis=1) / dof, np.nan)
+    
+    return {'intercept': intercept, 'slope': slope, 'n': n, 'x_mean': x_mean,
+            'sxx': sxx, 'sigma2': sigma2}
+
+def predict_trends(fit, x_new, confidence_level=0.95):
+    """
+    Point predictions with confidence (mean) and prediction (observation) intervals
+    
+    Parameters:
+    -----------
+    fit : dict
+        Output of fit_trends
+    x_new : ndarray
+        (series, points) array of x values to predict
+    confidence_level : float
+        Interval coverage, as in statsmodels summary_frame(alpha=1-confidence_level)
+    
+    Returns:
+    --------
+    dict : FORECAST_COLUMNS -> (series, points) arrays
+    """
+    n = fit['n'][:, None]
+    predicted = fit['intercept'][:, None] + fit['slope'][:, None] * x_new
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        sigma2 = fit['sigma2'][:, None]
+        se_mean = np.sqrt(sigma2 * (1.0 / n + (x_new - fit['x_mean'][:, None]) ** 2
+                                    / fit['sxx'][:, None]))
+        se_obs = np.sqrt(sigma2 + se_mean ** 2)
+        dof = np.where(fit['n'] > 2, fit['n'] - 2, np.nan)
+        t_crit = stats.t.ppf(1 - (1 - confidence_level) / 2, dof)[:, None]
+    
+    return {
+        'predicted': predicted,
+        'ci_lower': predicted - t_crit * se_mean,
+        'ci_upper': predicted + t_crit * se_mean,
+        'pi_lower': predicted - t_crit * se_obs,
+        'pi_upper': predicted + t_crit * se_obs,
+    }
+
+def forecast_trends(frame, forecast_years, by=DEFAULT_SERIES_KEYS, x='year', y='value',
+                    confidence_level=0.95):
+    """
+    Linear trend forecasts for every series of a long frame in one call
+    
+    Equivalent to running the Task 4 forecast_trend (statsmodels OLS plus
+    get_prediction().summary_frame) on each series separately.
+    
+    Parameters:
+    -----------
+    frame : DataFrame
+        Long data with the key columns, x and y (see observation_series)
+    forecast_years : list of int
+        Years to forecast for every series
+    by : list of str
+        Columns identifying a series (missing ones are ignored)
+    x, y : str
+        Regressor and target columns
+    confidence_level : float
+        Coverage of both interval types
+    
+    Returns:
+    --------
+    DataFrame : key columns, year, FORECAST_COLUMNS and is_forecast;
+        each series' historical years followed by forecast_years
+    """
+    by = [col for col in by if col in frame.columns]
+    keys, xs, ys, mask = stack_series(frame, by, x, y)
+    fit = fit_trends(xs, ys, mask)
+    
+    future = np.asarray(list(forecast_years), dtype=float)
+    x_all = np.concatenate([xs, np.broadcast_to(future, (len(xs), len(future)))], axis=1)
+    keep = np.concatenate([mask, np.ones((len(xs), len(future)), dtype=bool)], axis=1)
+    bands = predict_trends(fit, x_all, confidence_level)
+    
+    series_idx = np.nonzero(keep)[0]
+    results = keys.take(series_idx).reset_index(drop=True)
+    results[x] = x_all[keep].astype(int)
+    for col in FORECAST_COLUMNS:
+        results[col] = bands[col][keep]
+    results['is_forecast'] = np.nonzero(keep)[1] >= xs.shape[1]
+    return results
+
+def forecast_trend(historical_data, forecast_years, confidence_level=0.95):
+    """
+    Forecast one series using linear trend with confidence intervals
+    
+    Drop-in for the Task 4 notebook function, computed with fit_trends
+    instead of statsmodels; 'model' holds the fitted coefficients.
+    
+    Returns:
+    --------
+    dict : model, historical, future and all_results DataFrames
+    """
+    _, xs, ys, mask = stack_series(historical_data, [])
+    fit = fit_trends(xs, ys, mask)
+    
+    all_years = np.array(list(historical_data['year']) + list(forecast_years))
+    bands = predict_trends(fit, all_years[None, :].astype(float), confidence_level)
+    all_results = pd.DataFrame({'year': all_years})
+    for col in FORECAST_COLUMNS:
+        all_results[col] = bands[col][0]
+    
+    return {
+        'model': {name: float(values[0]) for name, values in fit.items()},
+        'historical': all_results[all_results['year'].isin(historical_data['year'])],
+        'future': all_results[all_results['year'].isin(forecast_years)],
+        'all_results': all_results,
+    }
+
+def link_contributions(impact_with_events, forecast_years=DEFAULT_FORECAST_YEARS,
+                       default_lag=DEFAULT_LAG_MONTHS):
+    """
+    Signed impact of every (event, indicator) link in every forecast year
+    
+    Links are averaged per (event, indicator) as the Task 3 impact matrix
+    does, but keep their own lag_months. An impact starts once
+    year - event year reaches the lag (in years) and builds up linearly
+    over the following year, evaluated for every link and year at once.
+    
+    Parameters:
+    -----------
+    impact_with_events : DataFrame
+        Output of impact_model.join_impact_links
+    forecast_years : list of int
+        Years to evaluate
+    default_lag : float
+        Lag in months for links without lag_months
+    
+    Returns:
+    --------
+    tuple : (links DataFrame with parent_id and related_indicator,
+             (links, years) array of signed proportions)
+    """
+    links = impact_with_events.dropna(subset=['related_indicator', 'event_date'])
+    links = links.assign(
+        sign=links['impact_direction'].astype(object).map(DIRECTION_SIGNS).fillna(0.0),
+        lag_months=pd.to_numeric(links['lag_months'], errors='coerce').fillna(default_lag),
+        event_year=pd.to_datetime(links['event_date']).dt.year,
+    )
+    links = links.groupby(['parent_id', 'related_indicator'], sort=False, observed=True).agg(
+        sign=('sign', 'first'),
+        impact_magnitude=('impact_magnitude', 'mean'),
+        lag_months=('lag_months', 'mean'),
+        event_year=('event_year', 'first'),
+    ).reset_index()
+    
+    years = np.asarray(list(forecast_years), dtype=float)
+    years_since = years[None, :] - links['event_year'].to_numpy(dtype=float)[:, None]
+    build_up = np.clip(years_since - links['lag_months'].to_numpy(dtype=float)[:, None] / 12,
+                       0.0, 1.0)
+    effect = (links['sign'] * links['impact_magnitude'].fillna(0.0)).to_numpy(dtype=float)
+    return links, effect[:, None] * build_up
+
+def event_adjustments(impact_with_events, forecast_years=DEFAULT_FORECAST_YEARS,
+                      default_lag=DEFAULT_LAG_MONTHS):
+    """
+    Summed event impact per (indicator, forecast year)
+    
+    Parameters:
+    -----------
+    See link_contributions
+    
+    Returns:
+    --------
+    DataFrame : related_indicator, year and adjustment (signed proportion)
+    """
+    links, contributions = link_contributions(impact_with_events, forecast_years, default_lag)
+    years = np.asarray(list(forecast_years), dtype=int)
+    
+    codes, indicators = pd.factorize(links['related_indicator'].astype(object))
+    totals = np.zeros((len(indicators), len(years)))
+    np.add.at(totals, codes, contributions)
+    
+    return pd.DataFrame({
+        'related_indicator': np.repeat(np.asarray(indicators, dtype=object), len(years)),
+        'year': np.tile(years, len(indicators)),
+        'adjustment': totals.ravel(),
+    })
+
+def event_adjustment_matrices(impact_with_events, indicators, forecast_years=DEFAULT_FORECAST_YEARS,
+                              default_lag=DEFAULT_LAG_MONTHS):
+    """
+    Per-event impact on each of several indicators, for switching events on and off
+    
+    Link contributions are computed once and indexed by indicator in an
+    ImpactLinkStore, so each indicator is one hash lookup, not a scan.
+    
+    Returns:
+    --------
+    dict : {indicator: (event ids, (events, years) array of signed proportions)}
+    """
+    links, contributions = link_contributions(impact_with_events, forecast_years, default_lag)
+    store = ImpactLinkStore(links)
+    parent_ids = links['parent_id'].to_numpy(dtype=object)
+    
+    # link_contributions leaves one row per (event, indicator)
+    matrices = {}
+    for indicator in indicators:
+        positions = store.positions('related_indicator', indicator)
+        matrices[indicator] = list(parent_ids[positions]), contributions[positions]
+    return matrices
+
+def event_adjustment_matrix(impact_with_events, indicator, forecast_years=DEFAULT_FORECAST_YEARS,
+                            default_lag=DEFAULT_LAG_MONTHS):
+    """
+    Per-event impact on one indicator (see event_adjustment_matrices)
+    
+    Returns:
+    --------
+    tuple : (event ids, (events, years) array of signed proportions)
+    """
+    return event_adjustment_matrices(impact_with_events, [indicator], forecast_years,
+                                     default_lag)[indicator]
+
+def apply_event_impacts(forecasts, adjustments, indicator_col='indicator_code', scale=100.0,
+                        effectiveness=1.0):
+    """
+    Shift forecasts by precomputed event adjustments in one join
+    
+    Replaces the Task 4 per-row event search: every (indicator, year) row
+    picks up its adjustment through a single hash lookup, so one
+    event_adjustments table can serve all indicators and scenarios.
+    
+    Parameters:
+    -----------
+    forecasts : DataFrame
+        Output of forecast_trends (indicator_col, year, predicted, ci_lower, ci_upper)
+    adjustments : DataFrame
+        Output of event_adjustments
+    indicator_col : str
+        Forecast column matched against related_indicator
+    scale : float
+        Converts proportions to forecast units (100 = percentage points)
+    effectiveness : float
+        Multiplier on every adjustment (scenario event_effectiveness)
+    
+    Returns:
+    --------
+    DataFrame : Copy of forecasts with predicted and the confidence bounds shifted
+    """
+    lookup = adjustments.set_index(['related_indicator', 'year'])['adjustment']
+    keys = pd.MultiIndex.from_arrays([forecasts[indicator_col].astype(object),
+                                      forecasts['year'].astype(int)])
+    shift = lookup.reindex(keys).fillna(0.0).to_numpy() * scale * effectiveness
+    
+    results = forecasts.copy()
+    results['predicted'] = results['predicted'] + shift
+    results['ci_lower'] = results['ci_lower'] + shift * CI_LOWER_SHARE
+    results['ci_upper'] = results['ci_upper'] + shift * CI_UPPER_SHARE
+    return results
@@ -0,0 +1,236 @@
+# src/impact_model.py - Event impact simulation over an event x indicator x time grid
+import numpy as np
+import pandas as pd
+
+# Average month length used to convert day offsets to months
+DAYS_PER_MONTH = 30.44
+
+# Months over which an impact builds up linearly once its lag has passed
+BUILD_UP_MONTHS = 12
+
+DEFAULT_LAG_MONTHS = 12
+
+# Sign applied for each impact_direction; shared by the point model, the
+# Monte Carlo bands and the forecast adjustments ('mixed', 'stabilize' and
+# 'none' have no effect)
+DIRECTION_SIGNS = {'increase': 1.0, 'positive': 1.0, 'decrease': -1.0, 'negative': -1.0}
+
+def join_impact_links(impact_links, events):
+    """
+    Attach event_name, event_date and category to impact links
+    
+    Same join as the Task 3 notebook: links and events without an id are
+    dropped, ids are compared as strings and impact_magnitude is numeric.
+    
+    Parameters:
+    -----------
+    impact_links : DataFrame
+        Links with parent_id
+    events : DataFrame
+        Events with id, event_name, event_date and category
+    
+    Returns:
+    --------
+    DataFrame : impact_with_events
+    """
+    valid_events = events[events['id'].notna()].copy()
+    valid_events['id'] = valid_events['id'].astype(str)
+    valid_links = impact_links[impact_links['parent_id'].notna()].copy()
+    valid_links['parent_id'] = valid_links['parent_id'].astype(str)
+    
+    impact_with_events = pd.merge(
+        valid_links,
+        valid_events[['id', 'event_name', 'event_date', 'category']],
+        left_on='parent_id',
+        right_on='id',
+        how='left',
+        suffixes=('', '_event')
+    )
+    impact_with_events['impact_magnitude'] = pd.to_numeric(
+        impact_with_events['impact_magnitude'], errors='coerce')
+    return impact_with_events
+
+def build_lag_matrix(impact_with_events, impact_matrix, default_lag=DEFAULT_LAG_MONTHS):
+    """
+    Mean lag_months per (event, indicator), aligned to an impact matrix
+    
+    Lags are matched on event_name and related_indicator, as the Task 3
+    model does; pairs without a link get default_lag.
+    
+    Parameters:
+    -----------
+    impact_with_events : DataFrame
+        Impact links joined with events (event_name, related_indicator, lag_months)
+    impact_matrix : DataFrame
+        Event x indicator magnitudes indexed by (event_name, category, event_date)
+    default_lag : float
+        Lag for pairs with no matching link
+    
+    Returns:
+    --------
+    DataFrame : Lags with the same index and columns as impact_matrix
+    """
+    mean_lags = impact_with_events.groupby(['event_name', 'related_indicator'])['lag_months'].mean()
+    event_names = impact_matrix.index.get_level_values(0)
+    
+    lags = np.full(impact_matrix.shape, float(default_lag))
+    for (event_name, indicator), lag in mean_lags.items():
+        if indicator not in impact_matrix.columns:
+            continue
+        col = impact_matrix.columns.get_loc(indicator)
+        lags[np.asarray(event_names == event_name), col] = lag
+    
+    return pd.DataFrame(lags, index=impact_matrix.index, columns=impact_matrix.columns)
+
+class EventImpactModel:
+    """
+    Model to simulate event impacts on indicators
+    
+    Parameters:
+    -----------
+    impact_matrix : DataFrame
+        Event x indicator impact magnitudes, indexed by
+        (event_name, category, event_date)
+    direction_matrix : DataFrame
+        Same shape, holding a direction from DIRECTION_SIGNS or 'none'
+    lag_matrix : DataFrame, optional
+        Same shape, lag in months per pair (see build_lag_matrix);
+        missing lags default to 12 months
+    """
+    
+    def __init__(self, impact_matrix, direction_matrix, lag_matrix=None):
+        self.impact_matrix = impact_matrix
+        self.direction_matrix = direction_matrix.reindex_like(impact_matrix)
+        if lag_matrix is None:
+            lag_matrix = pd.DataFrame(float(DEFAULT_LAG_MONTHS), index=impact_matrix.index,
+                                      columns=impact_matrix.columns)
+        self.lag_matrix = lag_matrix.reindex_like(impact_matrix)
+        self.events = impact_matrix.index.tolist()
+        self.indicators = impact_matrix.columns.tolist()
+    
+    def apply_event_impact(self, baseline_value, impact_magnitude, direction,
+                           current_time, event_time, lag_months):
+        """Apply event impact to a baseline value"""
+        # Calculate time since event
+        months_since_event = ((current_time - event_time).days / DAYS_PER_MONTH)
+        
+        # Check if impact should be applied (considering lag)
+        if months_since_event < 0 or months_since_event < lag_months:
+            return baseline_value
+        
+        # Calculate impact
+        sign = DIRECTION_SIGNS.get(direction, 0.0)
+        if sign > 0:
+            impact = baseline_value * impact_magnitude
+        elif sign < 0:
+            impact = -baseline_value * impact_magnitude
+        else:
+            impact = 0
+        
+        # Apply impact (simplified linear build-up)
+        if months_since_event < lag_months + BUILD_UP_MONTHS:  # Build-up phase
+            build_up_factor = min(1.0, (months_since_event - lag_months) / BUILD_UP_MONTHS)
+            impact *= build_up_factor
+        
+        return baseline_value + impact
+    
+    def simulate_impacts_scalar(self, baseline_values, start_date, end_date, frequency='ME'):
+        """
+        Reference implementation: one apply_event_impact call per
+        event x indicator x date cell
+        """
+        dates = pd.date_range(start=start_date, end=end_date, freq=frequency)
+        results = pd.DataFrame(index=dates, columns=self.indicators, dtype=float)
+        
+        for indicator in self.indicators:
+            results[indicator] = float(baseline_values.get(indicator, 0))
+        
+        for event_idx in self.impact_matrix.index:
+            event_date = event_idx[2]
+            
+            for indicator in self.indicators:
+                impact_magnitude = self.impact_matrix.loc[event_idx, indicator]
+                direction = self.direction_matrix.loc[event_idx, indicator]
+                
+                if impact_magnitude > 0 and direction != 'none':
+                    lag_months = self.lag_matrix.loc[event_idx, indicator]
+                    
+                    for date in dates:
+                        if date >= event_date:
+                            baseline = results.loc[date, indicator]
+                            results.loc[date, indicator] = self.apply_event_impact(
+                                baseline, impact_magnitude, direction,
+                                date, event_date, lag_months
+                            )
+        
+        return results
+    
+    def months_since_events(self, dates):
+        """
+        Months elapsed between every event and every date
+        
+        Returns:
+        --------
+        ndarray : (events, dates) array, negative before the event
+        """
+        event_dates = pd.DatetimeIndex(self.impact_matrix.index.get_level_values(2))
+        offsets = dates.values[None, :] - event_dates.values[:, None]
+        # Whole days, floored like Timedelta.days
+        days = offsets // np.timedelta64(1, 'D')
+        return days / DAYS_PER_MONTH
+    
+    def simulate_impacts(self, baseline_values, start_date, end_date, frequency='ME'):
+        """
+        Simulate impacts over time with array operations
+        
+        Months-since-event (events x dates) is computed once. Each event
+        then updates the whole dates x indicators surface in one step, in
+        the same order and with the same floating-point operations as
+        simulate_impacts_scalar, so results are identical. Events compound
+        multiplicatively on the running value, so the event axis cannot be
+        collapsed into a single matrix product without changing results.
+        
+        Parameters:
+        -----------
+        baseline_values : dict
+            Starting value per indicator (missing indicators start at 0)
+        start_date, end_date : date-like
+            Simulation window
+        frequency : str
+            pandas date_range frequency ('ME' monthly, 'YE' yearly)
+        
+        Returns:
+        --------
+        DataFrame : dates x indicators simulated values
+        """
+        dates = pd.date_range(start=start_date, end=end_date, freq=frequency)
+        values = np.tile(
+            np.array([float(baseline_values.get(ind, 0)) for ind in self.indicators]),
+            (len(dates), 1)
+        )
+        
+        magnitudes = self.impact_matrix.to_numpy(dtype=float)
+        directions = self.direction_matrix.astype(object).to_numpy()
+        signs = np.vectorize(lambda d: DIRECTION_SIGNS.get(d, 0.0), otypes=[float])(directions)
+        # NaN magnitudes fail the > 0 test, as in the scalar model
+        applies = (magnitudes > 0) & (directions != 'none') & (signs != 0)
+        
+        months_since = self.months_since_events(dates)
+        lags = self.lag_matrix.to_numpy(dtype=float)
+        
+        for e in np.flatnonzero(applies.any(axis=1)):
+            cols = np.flatnonzero(applies[e])
+            months = months_since[e][:, None]
+            lag = lags[e, cols][None, :]
+            
+            active = ~((months < 0) | (months < lag))
+            building = months < lag + BUILD_UP_MONTHS
+            ramp = np.minimum(1.0, (months - lag) / BUILD_UP_MONTHS)
+            
+            current = values[:, cols]
+            impact = current * magnitudes[e, cols]
+            impact = np.where(signs[e, cols] < 0, -current * magnitudes[e, cols], impact)
+            impact = np.where(building, impact * ramp, impact)
+            values[:, cols] = np.where(active, current + impact, current)
+        
+        return pd.DataFrame(values, index=dates, columns=self.indicators)
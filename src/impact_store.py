@@ -0,0 +1,136 @@
+# src/impact_store.py - Hash-indexed in-memory store for event impact links
+import numpy as np
+import pandas as pd
+
+from .impact_model import DIRECTION_SIGNS
+
+_EMPTY = np.empty(0, dtype=np.intp)
+
+class ImpactLinkStore:
+    """
+    Impact links with hash indexes on parent_id, related_indicator and pillar
+    
+    Each index maps a key to the row positions holding it, so lookups cost
+    one dict access plus the size of the answer instead of a scan.
+    
+    Parameters:
+    -----------
+    impact_links : DataFrame
+        Impact links with parent_id, related_indicator and (optionally)
+        pillar, impact_direction, impact_magnitude and lag_months columns
+    events : DataFrame, optional
+        Events with id and event_name, enabling lookups by event name
+    """
+    
+    INDEXED_COLUMNS = ('parent_id', 'related_indicator', 'pillar')
+    
+    def __init__(self, impact_links, events=None):
+        self.links = impact_links.reset_index(drop=True)
+        self._indexes = {}
+        for col in self.INDEXED_COLUMNS:
+            if col in self.links.columns:
+                self._indexes[col] = self.links.groupby(col, sort=False, observed=True).indices
+            else:
+                self._indexes[col] = {}
+        
+        self._event_ids_by_name = {}
+        if events is not None and {'id', 'event_name'}.issubset(events.columns):
+            for event_id, name in zip(events['id'], events['event_name']):
+                if pd.notna(event_id) and pd.notna(name):
+                    self._event_ids_by_name.setdefault(name, []).append(event_id)
+    
+    def __len__(self):
+        return len(self.links)
+    
+    def positions(self, column, key):
+        """Row positions whose column equals key (empty array if none)"""
+        return self._indexes[column].get(key, _EMPTY)
+    
+    def keys(self, column):
+        """Distinct values present in an indexed column"""
+        return list(self._indexes[column])
+    
+    def impacts_of_event(self, event_id):
+        """All impact links of one event"""
+        return self.links.take(self.positions('parent_id', event_id))
+    
+    def impacts_of_event_name(self, event_name):
+        """All impact links of the events with this name"""
+        ids = self._event_ids_by_name.get(event_name, [])
+        if not ids:
+            return self.links.iloc[:0]
+        positions = np.concatenate([self.positions('parent_id', i) for i in ids])
+        return self.links.take(np.sort(positions))
+    
+    def impacts_on_indicator(self, indicator):
+        """All impact links targeting one indicator"""
+        return self.links.take(self.positions('related_indicator', indicator))
+    
+    def impacts_in_pillar(self, pillar):
+        """All impact links in one pillar"""
+        return self.links.take(self.positions('pillar', pillar))
+    
+    def events_touching(self, indicator):
+        """Distinct parent_ids with at least one link to the indicator"""
+        positions = self.positions('related_indicator', indicator)
+        return list(pd.unique(self.links['parent_id'].to_numpy()[positions]))
+    
+    def link(self, event_id, indicator):
+        """Links between one event and one indicator"""
+        by_event = self.positions('parent_id', event_id)
+        by_indicator = self.positions('related_indicator', indicator)
+        return self.links.take(np.intersect1d(by_event, by_indicator, assume_unique=True))
+    
+    def connected_count(self, event_ids):
+        """Number of links whose parent_id is among event_ids"""
+        index = self._indexes['parent_id']
+        return int(sum(len(index[e]) for e in set(event_ids) if e in index))
+    
+    def signed_magnitudes(self):
+        """impact_magnitude signed by impact_direction (0 for other directions)"""
+        if 'impact_magnitude' not in self.links.columns:
+            return np.zeros(len(self.links))
+        magnitude = pd.to_numeric(self.links['impact_magnitude'], errors='coerce')
+        if 'impact_direction' in self.links.columns:
+            sign = self.links['impact_direction'].astype(object).map(DIRECTION_SIGNS)
+        else:
+            sign = pd.Series(1.0, index=self.links.index)
+        return (magnitude * sign).fillna(0.0).to_numpy(dtype=float)
+    
+    def to_sparse_matrix(self, values=None):
+        """
+        Export an event x indicator sparse matrix
+        
+        Duplicate (event, indicator) links are summed.
+        
+        Parameters:
+        -----------
+        values : array-like, optional
+            One value per link; defaults to signed_magnitudes()
+        
+        Returns:
+        --------
+        tuple : (scipy.sparse.csr_matrix, event_ids, indicators)
+        """
+        from scipy import sparse
+        
+        event_ids = self.keys('parent_id')
+        indicators = self.keys('related_indicator')
+        if values is None:
+            values = self.signed_magnitudes()
+        values = np.asarray(values, dtype=float)
+        
+        rows = np.full(len(self.links), -1, dtype=np.intp)
+        cols = np.full(len(self.links), -1, dtype=np.intp)
+        for i, key in enumerate(event_ids):
+            rows[self._indexes['parent_id'][key]] = i
+        for j, key in enumerate(indicators):
+            cols[self._indexes['related_indicator'][key]] = j
+        
+        keep = (rows >= 0) & (cols >= 0)
+        matrix = sparse.coo_matrix(
+            (values[keep], (rows[keep], cols[keep])),
+            shape=(len(event_ids), len(indicators))
+        ).tocsr()
+        matrix.sum_duplicates()
+        return matrix, event_ids, indicators
@@ -0,0 +1,327 @@
+# src/instrumentation.py - Nested timing spans (wall, CPU, rows, peak memory) with a JSON-lines trace
+import functools
+import itertools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections import deque
+
+import pandas as pd
+
+# Finished spans kept in memory for the dashboard's Performance panel
+DEFAULT_KEEP_SPANS = 5000
+
+SPAN_COLUMNS = ['trace', 'id', 'parent', 'depth', 'name', 'thread', 'start', 'wall_seconds',
+                'cpu_seconds', 'rows', 'peak_memory_mb', 'error']
+
+class _NullSpan:
+    """Stands in for a span while tracing is disabled"""
+    __slots__ = ()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        return False
+    
+    def set(self, **attrs):
+        pass
+
+_NULL_SPAN = _NullSpan()
+
+class Span:
+    """One timed block; use through Tracer.span, span or traced"""
+    __slots__ = ('tracer', 'name', 'rows', 'attrs', 'id', 'parent', 'trace', 'depth', 'start',
+                 '_wall', '_cpu', '_memory', '_peak', '_overlaps')
+    
+    def __init__(self, tracer, name, rows=None, attrs=None):
+        self.tracer = tracer
+        self.name = name
+        self.rows = rows
+        self.attrs = attrs or {}
+    
+    def set(self, rows=None, **attrs):
+        """Record rows processed and other attributes while the span is open"""
+        if rows is not None:
+            self.rows = rows
+        self.attrs.update(attrs)
+    
+    def __enter__(self):
+        self.tracer._open(self)
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.tracer._close(self, exc_type)
+        return False
+
+class Tracer:
+    """
+    Records nested spans of work with their cost
+    
+    Each span measures wall time, CPU time of its thread and, when it is
+    given, the number of rows processed. Spans opened inside another span
+    on the same thread become its children, and all spans under one root
+    (e.g. one dashboard rerun) share a trace id. With memory tracing, the
+    peak of traced (tracemalloc) allocations above the span's starting
+    level is recorded too. tracemalloc has a single process-wide peak that
+    each span resets, so the peak is only recorded for spans during which
+    no other thread had spans open (others get None); allocations by
+    untraced threads still count. Memory tracing slows allocation-heavy
+    code noticeably.
+    
+    Finished spans are kept in memory (the last `keep`) and, with a path,
+    appended to a JSON-lines file when their root span closes. While the
+    tracer is disabled, span() returns a shared no-op object and traced
+    functions are called directly, so instrumentation can stay in place.
+    
+    Parameters:
+    -----------
+    enabled : bool
+        Record spans
+    path : str, optional
+        JSON-lines trace file (one span per line)
+    memory : bool
+        Record peak memory deltas with tracemalloc
+    keep : int
+        Finished spans kept in memory
+    """
+    
+    def __init__(self, enabled=False, path=None, memory=False, keep=DEFAULT_KEEP_SPANS):
+        self.enabled = False
+        self.path = None
+        self.memory = False
+        self._spans = deque(maxlen=keep)
+        self._ids = itertools.count(1)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # Threads with open spans, and how often a thread started spans
+        # while another had some open (invalidates memory peaks)
+        self._tracing_threads = 0
+        self._overlaps = 0
+        self._started_tracemalloc = False
+        self.configure(enabled=enabled, path=path, memory=memory)
+    
+    def configure(self, enabled=None, path=None, memory=None):
+        """Change settings; arguments left as None are unchanged"""
+        if path is not None:
+            self.path = path or None
+        if memory is not None:
+            if memory and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+            elif not memory and self._started_tracemalloc:
+                tracemalloc.stop()
+                self._started_tracemalloc = False
+            self.memory = bool(memory)
+        if enabled is not None:
+            self.enabled = bool(enabled)
+        return self
+    
+    def span(self, name, rows=None, **attrs):
+        """
+        Context manager timing a block
+        
+        Parameters:
+        -----------
+        name : str
+            Span name, e.g. 'loader.clean_and_prepare_data' or 'page.Overview'
+        rows : int, optional
+            Rows processed; can also be set inside the block with .set(rows=...)
+        **attrs :
+            Extra JSON-serializable attributes written with the span
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return Span(self, name, rows, attrs)
+    
+    def _stack(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+            self._local.finished = []
+        return stack
+    
+    def _open(self, span):
+        stack = self._stack()
+        parent = stack[-1] if stack else None
+        span.id = next(self._ids)
+        span.parent = parent.id if parent is not None else None
+        span.trace = parent.trace if parent is not None else span.id
+        span.depth = len(stack)
+        span._memory = span._peak = None
+        if not stack:
+            with self._lock:
+                self._tracing_threads += 1
+                if self._tracing_threads > 1:
+                    self._overlaps += 1
+        if self.memory and tracemalloc.is_tracing() and self._tracing_threads == 1:
+            # Fold the peak so far into the parent before restarting peak tracking
+            current, peak = tracemalloc.get_traced_memory()
+            if parent is not None and parent._peak is not None:
+                parent._peak = max(parent._peak, peak)
+            tracemalloc.reset_peak()
+            span._memory = span._peak = current
+            span._overlaps = self._overlaps
+        stack.append(span)
+        span.start = time.time()
+        span._cpu = time.thread_time()
+        span._wall = time.perf_counter()
+    
+    def _close(self, span, exc_type):
+        wall = time.perf_counter() - span._wall
+        cpu = time.thread_time() - span._cpu
+        stack = self._stack()
+        if stack and stack[-1] is span:
+            stack.pop()
+        
+        peak_mb = None
+        if span._memory is not None and tracemalloc.is_tracing():
+            span._peak = max(span._peak, tracemalloc.get_traced_memory()[1])
+            parent = stack[-1] if stack else None
+            if parent is not None and parent._peak is not None:
+                parent._peak = max(parent._peak, span._peak)
+            # Another thread's spans may have reset the peak meanwhile
+            if span._overlaps == self._overlaps:
+                peak_mb = (span._peak - span._memory) / 1e6
+        if not stack:
+            with self._lock:
+                self._tracing_threads -= 1
+        
+        record = {
+            'trace': span.trace,
+            'id': span.id,
+            'parent': span.parent,
+            'depth': span.depth,
+            'name': span.name,
+            'thread': threading.current_thread().name,
+            'start': span.start,
+            'wall_seconds': wall,
+            'cpu_seconds': cpu,
+            'rows': span.rows,
+            'peak_memory_mb': peak_mb,
+            'error': exc_type.__name__ if exc_type is not None else None,
+        }
+        record.update(span.attrs)
+        self._spans.append(record)
+        
+        # The trace file is written once per root span, not per span
+        if self.path is not None:
+            self._local.finished.append(record)
+            if not stack:
+                self._write(self._local.finished)
+                self._local.finished = []
+    
+    def _write(self, records):
+        lines = ''.join(json.dumps(record, default=str) + '\n' for record in records)
+        directory = os.path.dirname(self.path)
+        with self._lock:
+            try:
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.write(lines)
+            except OSError as e:
+                print(f"Could not write trace to {self.path}: {e}")
+    
+    def current_trace(self):
+        """Trace id of the root span open on this thread, or None"""
+        stack = getattr(self._local, 'stack', None)
+        return stack[0].trace if stack else None
+    
+    def spans(self, trace=None):
+        """
+        Recent finished spans
+        
+        Parameters:
+        -----------
+        trace : int, optional
+            Only the spans of one trace (e.g. current_trace())
+        
+        Returns:
+        --------
+        DataFrame : SPAN_COLUMNS plus span attributes, in finishing order
+        """
+        records = list(self._spans)
+        if trace is not None:
+            records = [record for record in records if record['trace'] == trace]
+        return pd.DataFrame(records, columns=None if records else SPAN_COLUMNS)
+    
+    def summary(self):
+        """
+        Recent spans aggregated by name
+        
+        Returns:
+        --------
+        DataFrame : name, calls, total/mean/max wall seconds, total CPU
+            seconds, rows and max peak memory, slowest total first
+        """
+        spans = self.spans()
+        if spans.empty:
+            return pd.DataFrame(columns=['name', 'calls', 'total_seconds', 'mean_seconds', 'max_seconds',
+                                         'cpu_seconds', 'rows', 'peak_memory_mb'])
+        table = spans.groupby('name', sort=False).agg(
+            calls=('wall_seconds', 'size'),
+            total_seconds=('wall_seconds', 'sum'),
+            mean_seconds=('wall_seconds', 'mean'),
+            max_seconds=('wall_seconds', 'max'),
+            cpu_seconds=('cpu_seconds', 'sum'),
+            rows=('rows', 'sum'),
+            peak_memory_mb=('peak_memory_mb', 'max'),
+        )
+        return table.sort_values('total_seconds', ascending=False).reset_index()
+    
+    def clear(self):
+        self._spans.clear()
+
+# Process-wide tracer used by the module-level helpers
+TRACER = Tracer()
+
+def configure(enabled=None, path=None, memory=None):
+    """Configure the process-wide tracer (see Tracer.configure)"""
+    return TRACER.configure(enabled=enabled, path=path, memory=memory)
+
+def span(name, rows=None, **attrs):
+    """Timing span on the process-wide tracer (see Tracer.span)"""
+    if not TRACER.enabled:
+        return _NULL_SPAN
+    return Span(TRACER, name, rows, attrs)
+
+def result_rows(result):
+    """Rows of a frame, or summed over a tuple, list or dict of frames (None if there are none)"""
+    if isinstance(result, (pd.DataFrame, pd.Series)):
+        return len(result)
+    if isinstance(result, dict):
+        result = list(result.values())
+    if isinstance(result, (tuple, list)):
+        counts = [len(item) for item in result if isinstance(item, (pd.DataFrame, pd.Series))]
+        return sum(counts) if counts else None
+    return None
+
+def traced(name=None, rows=None):
+    """
+    Decorator running every call of a function in a span
+    
+    Parameters:
+    -----------
+    name : str, optional
+        Span name; defaults to the function's module and name
+    rows : callable, optional
+        Called with the return value to give the rows processed (e.g.
+        result_rows)
+    """
+    def decorate(func):
+        span_name = name or f"{func.__module__.rsplit('.', 1)[-1]}.{func.__qualname__}"
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not TRACER.enabled:
+                return func(*args, **kwargs)
+            with Span(TRACER, span_name) as s:
+                result = func(*args, **kwargs)
+                if rows is not None:
+                    s.rows = rows(result)
+                return result
+        return wrapper
+    return decorate
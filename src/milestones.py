@@ -0,0 +1,107 @@
+# src/milestones.py - First-crossing search for forecast targets over a ForecastCube
+import numpy as np
+import pandas as pd
+
+MONTH_NAMES = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+               'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+def first_crossings(cube, milestones, start=None):
+    """
+    First forecast year (and interpolated month) each target is reached
+    
+    All milestones and scenarios are searched at once: the cube is
+    gathered into a (milestones, scenarios, years) array, compared with
+    the targets and argmax finds the first True along the year axis.
+    Yearly values are read as year-end points; the crossing month comes
+    from linear interpolation between the last value below the target
+    and the first value at or above it.
+    
+    Parameters:
+    -----------
+    cube : ForecastCube
+        Forecast results
+    milestones : list of dict
+        Each with name, metric (cube metric, e.g. 'access_forecast') and target
+    start : dict, optional
+        {metric: (year, value)} last actual value before the forecast,
+        used to interpolate crossings in the first forecast year
+    
+    Returns:
+    --------
+    DataFrame : one row per milestone and scenario with milestone, metric,
+        target, scenario, year (first year at or above target, NaN if never),
+        crossing_year and crossing_month (interpolated, NaN when unknown)
+    """
+    start = start or {}
+    names = [m['name'] for m in milestones]
+    metrics = [m['metric'] for m in milestones]
+    targets = np.array([float(m['target']) for m in milestones])
+    years = np.array(cube.years, dtype=float)
+    n_scenarios = len(cube.scenarios)
+    
+    # (milestones, scenarios, years); unknown metrics stay all-NaN
+    values = np.full((len(milestones), n_scenarios, len(years)), np.nan)
+    for i, metric in enumerate(metrics):
+        if metric in cube.metrics:
+            values[i] = cube.values[:, :, cube.metrics.index(metric)]
+    
+    if not len(years):
+        # No forecast years: nothing can be reached
+        values = np.full((len(milestones), n_scenarios, 1), np.nan)
+        years = np.array([np.nan])
+    
+    reached = values >= targets[:, None, None]
+    ever = reached.any(axis=2)
+    first = reached.argmax(axis=2)
+    
+    # Previous point: the year before the crossing, or the start value
+    start_years = np.array([start.get(m, (np.nan, np.nan))[0] for m in metrics], dtype=float)
+    start_values = np.array([start.get(m, (np.nan, np.nan))[1] for m in metrics], dtype=float)
+    prev_index = np.maximum(first - 1, 0)
+    prev_value = np.take_along_axis(values, prev_index[:, :, None], axis=2)[:, :, 0]
+    prev_year = years[prev_index]
+    at_start = first == 0
+    prev_value = np.where(at_start, start_values[:, None], prev_value)
+    prev_year = np.where(at_start, start_years[:, None], prev_year)
+    
+    cur_value = np.take_along_axis(values, first[:, :, None], axis=2)[:, :, 0]
+    cur_year = years[first]
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        fraction = (targets[:, None] - prev_value) / (cur_value - prev_value)
+        # Already at or above the target before the previous point
+        fraction = np.where(prev_value >= targets[:, None], np.nan, fraction)
+        elapsed_months = np.clip(fraction, 0.0, 1.0) * (cur_year - prev_year) * 12
+        offset_years = np.maximum(np.ceil(elapsed_months / 12), 1)
+        crossing_year = prev_year + offset_years
+        crossing_month = np.clip(np.ceil(elapsed_months - 12 * (offset_years - 1)), 1, 12)
+    
+    unknown = ~ever | np.isnan(elapsed_months)
+    return pd.DataFrame({
+        'milestone': np.repeat(names, n_scenarios),
+        'metric': np.repeat(metrics, n_scenarios),
+        'target': np.repeat(targets, n_scenarios),
+        'scenario': np.tile(np.asarray(cube.scenarios, dtype=object), len(milestones)),
+        'year': np.where(ever, cur_year, np.nan).ravel(),
+        'crossing_year': np.where(unknown, np.nan, crossing_year).ravel(),
+        'crossing_month': np.where(unknown, np.nan, crossing_month).ravel(),
+    })
+
+def not_reached_label(cube):
+    """Label for targets not reached within the cube's years, e.g. 'Not by 2027'"""
+    if not cube.years:
+        return 'Not reached'
+    return f"Not by {int(max(cube.years))}"
+
+def format_crossing(row, horizon_label='Not reached'):
+    """
+    Table label for one first_crossings row, e.g. 'Mar 2026' or '2025'
+    
+    Rows that never cross get horizon_label; pass not_reached_label(cube)
+    to name the cube's last forecast year.
+    """
+    if pd.isna(row['year']):
+        return horizon_label
+    if pd.isna(row['crossing_month']):
+        return str(int(row['year']))
+    return f"{MONTH_NAMES[int(row['crossing_month']) - 1]} {int(row['crossing_year'])}"
@@ -0,0 +1,263 @@
+# src/monte_carlo.py - Monte Carlo uncertainty bands for event impacts
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .impact_model import BUILD_UP_MONTHS, DIRECTION_SIGNS
+
+# Relative spread per link, following the methodology report's ratings:
+# magnitude uncertainty "Medium", lag uncertainty "High"
+DEFAULT_MAGNITUDE_CV = 0.25
+DEFAULT_LAG_CV = 0.5
+
+DEFAULT_PERCENTILES = (5, 25, 50, 75, 95)
+
+# Smallest multiplicative factor a single event can apply; keeps large
+# sampled 'decrease' magnitudes from pushing an indicator below zero
+MIN_FACTOR = 1e-9
+
+# Draws are reduced chunk by chunk into a fixed-bin histogram per indicator
+# and year. The bins span the range of a pilot of at least PILOT_DRAWS draws
+# (the leading chunks, whatever the chunk size) widened by HISTOGRAM_MARGIN
+# of it on each side; later values outside it fall into the edge bins.
+DEFAULT_HISTOGRAM_BINS = 2048
+HISTOGRAM_MARGIN = 0.5
+PILOT_DRAWS = 1000
+
+def _active_links(model):
+    """Flatten the (event, indicator) pairs the model actually applies"""
+    magnitudes = model.impact_matrix.to_numpy(dtype=float)
+    directions = model.direction_matrix.astype(object).to_numpy()
+    signs = np.vectorize(lambda d: DIRECTION_SIGNS.get(d, 0.0), otypes=[float])(directions)
+    applies = (magnitudes > 0) & (signs != 0)
+    
+    # Grouped by indicator so per-indicator products are contiguous slices
+    indicator_idx, event_idx = np.nonzero(applies.T)
+    lags = model.lag_matrix.to_numpy(dtype=float)[event_idx, indicator_idx]
+    return {
+        'event': event_idx,
+        'indicator': indicator_idx,
+        'magnitude': magnitudes[event_idx, indicator_idx].astype(np.float32),
+        'sign': signs[event_idx, indicator_idx].astype(np.float32),
+        # NaN lags stay NaN: the point model then applies the full impact
+        # from the event date on, without a build-up
+        'lag': lags.astype(np.float32),
+    }
+
+def _simulate_chunk(n_draws, seed, links, months_since, n_indicators,
+                    magnitude_cv, lag_cv):
+    """
+    Evaluate one chunk of draws
+    
+    Returns:
+    --------
+    ndarray : (draws, indicators, dates) multiplicative impact factors
+    """
+    rng = np.random.default_rng(seed)
+    n_links = len(links['magnitude'])
+    
+    # Lognormal keeps magnitudes positive with the requested coefficient of
+    # variation; float32 halves the memory traffic of the (draws, links, dates) arrays
+    sigma = float(np.sqrt(np.log1p(magnitude_cv ** 2)))
+    noise = rng.standard_normal((n_draws, n_links), dtype=np.float32)
+    magnitude = links['magnitude'] * np.exp(sigma * noise - np.float32(0.5 * sigma ** 2))
+    lag_sd = lag_cv * np.maximum(links['lag'], 1.0)
+    lag = links['lag'] + lag_sd * rng.standard_normal((n_draws, n_links), dtype=np.float32)
+    np.maximum(lag, 0.0, out=lag)
+    
+    # (draws, links, dates); with lag >= 0 the clip also zeroes dates before
+    # the event or inside the lag, as apply_event_impact does
+    months = months_since[links['event']][None, :, :]
+    ramp = months - lag[:, :, None]
+    ramp *= np.float32(1.0 / BUILD_UP_MONTHS)
+    np.clip(ramp, 0.0, 1.0, out=ramp)
+    no_lag = np.isnan(links['lag'])
+    if no_lag.any():
+        ramp[:, no_lag, :] = months[:, no_lag, :] >= 0
+    
+    factor = ramp
+    factor *= (links['sign'] * magnitude)[:, :, None]
+    factor += 1.0
+    np.maximum(factor, MIN_FACTOR, out=factor)
+    
+    # Events compound multiplicatively, so each indicator's factor is the
+    # product over its (contiguous) links
+    result = np.ones((n_draws, n_indicators, months_since.shape[1]), dtype=np.float32)
+    if n_links:
+        targets, starts = np.unique(links['indicator'], return_index=True)
+        result[:, targets, :] = np.multiply.reduceat(factor, starts, axis=1)
+    return result
+
+def _summarize_chunk(factors, lower, width, n_bins):
+    """
+    Reduce one chunk of factors to per-cell histograms and moments
+    
+    Returns:
+    --------
+    tuple : (counts (cells, bins), sums, minima, maxima) over the chunk's draws
+    """
+    n_draws = factors.shape[0]
+    flat = factors.reshape(n_draws, -1)
+    
+    bins = flat - lower
+    bins /= width
+    np.clip(bins, 0, n_bins - 1, out=bins)
+    index = bins.astype(np.intp)
+    index += np.arange(flat.shape[1], dtype=np.intp) * n_bins
+    counts = np.bincount(index.ravel(), minlength=flat.shape[1] * n_bins)
+    
+    return (counts.reshape(flat.shape[1], n_bins), flat.sum(axis=0, dtype=np.float64),
+            flat.min(axis=0), flat.max(axis=0))
+
+def _simulate_summary(n_draws, seed, links, months_since, n_indicators,
+                      magnitude_cv, lag_cv, lower, width, n_bins):
+    """Evaluate one chunk of draws and keep only its summary (see _summarize_chunk)"""
+    factors = _simulate_chunk(n_draws, seed, links, months_since, n_indicators,
+                              magnitude_cv, lag_cv)
+    return _summarize_chunk(factors, lower, width, n_bins)
+
+def _histogram_percentiles(counts, lower, width, minima, maxima, percentiles):
+    """
+    Percentiles from per-cell histograms, interpolating within bins
+    
+    Ranks follow np.percentile's linear method; results are clamped to the
+    exact minimum and maximum, so cells with a single value are exact.
+    """
+    n = counts[0].sum()
+    cumulative = np.cumsum(counts, axis=1)
+    cells = np.arange(len(counts))
+    
+    bands = []
+    for q in percentiles:
+        rank = q / 100 * (n - 1)
+        b = np.minimum((cumulative <= rank).sum(axis=1), counts.shape[1] - 1)
+        below = cumulative[cells, b] - counts[cells, b]
+        inside = (rank - below + 0.5) / np.maximum(counts[cells, b], 1)
+        bands.append(np.clip(lower + width * (b + inside), minima, maxima))
+    return bands
+
+def simulate_impact_bands(model, baseline_values, years=(2025, 2026, 2027), n_draws=100_000,
+                          magnitude_cv=DEFAULT_MAGNITUDE_CV, lag_cv=DEFAULT_LAG_CV,
+                          percentiles=DEFAULT_PERCENTILES, seed=0,
+                          memory_budget_mb=256, n_jobs=1, n_bins=DEFAULT_HISTOGRAM_BINS):
+    """
+    Percentile bands of event-adjusted indicator values under sampled
+    impact magnitudes and lags
+    
+    Every applied link draws its magnitude from a lognormal centred on
+    the point estimate and its lag from a normal truncated at 0 (links
+    without a lag apply fully from the event date, as in the point model).
+    Draws are evaluated in chunks sized to memory_budget_mb; each chunk is
+    one batch of array operations, is reduced to a fixed-bin histogram,
+    sum, minimum and maximum per indicator and year, and is then dropped,
+    so memory does not grow with n_draws. The leading chunks covering
+    PILOT_DRAWS draws are held until they fix the histogram bins; the
+    chunks after them can run in a process pool. Results are reproducible
+    for a given seed whatever n_jobs is.
+    
+    Means are exact. Percentiles are interpolated within histogram bins
+    (about 1/n_bins of each cell's range) and clamped to the exact range,
+    so a zero-spread run returns the point model's values.
+    
+    Parameters:
+    -----------
+    model : EventImpactModel
+        Point-estimate model (magnitudes, directions, lags)
+    baseline_values : dict
+        Baseline value per indicator; missing indicators start at 0
+    years : iterable of int
+        Years evaluated at 31 December
+    n_draws : int
+        Number of Monte Carlo samples
+    magnitude_cv, lag_cv : float
+        Relative standard deviation of magnitudes and lags
+    percentiles : iterable of float
+        Percentiles reported per indicator and year
+    seed : int
+        Seed for the draws
+    memory_budget_mb : float
+        Approximate working memory per chunk
+    n_jobs : int
+        Worker processes (-1 for all CPUs, 1 runs in-process)
+    n_bins : int
+        Histogram bins per indicator and year
+    
+    Returns:
+    --------
+    DataFrame : indicator, year, mean and one p{q} column per percentile
+    """
+    dates = pd.DatetimeIndex([pd.Timestamp(year=int(y), month=12, day=31) for y in years])
+    indicators = model.indicators
+    baseline = np.array([float(baseline_values.get(ind, 0)) for ind in indicators])
+    
+    links = _active_links(model)
+    months_since = model.months_since_events(dates).astype(np.float32)
+    
+    # Three (draws, links, dates) float32 temporaries, then the (draws,
+    # indicators, dates) float32 factors with their float32 and intp bin indices
+    n_cells = len(indicators) * len(dates)
+    bytes_per_draw = 4 * 3 * max(len(links['magnitude']), 1) * len(dates) + (4 + 4 + 8) * n_cells
+    chunk_size = max(1, min(n_draws, int(memory_budget_mb * 1024 ** 2 // bytes_per_draw)))
+    sizes = [min(chunk_size, n_draws - start) for start in range(0, n_draws, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    
+    args = [(size, child, links, months_since, len(indicators), magnitude_cv, lag_cv)
+            for size, child in zip(sizes, seeds)]
+    
+    # The pilot chunks fix the histogram bins of every (indicator, year) cell
+    n_pilot = int(np.searchsorted(np.cumsum(sizes), min(PILOT_DRAWS, n_draws))) + 1
+    pilot = [_simulate_chunk(*a).reshape(a[0], -1) for a in args[:n_pilot]]
+    lowest = np.min([chunk.min(axis=0) for chunk in pilot], axis=0).astype(float)
+    highest = np.max([chunk.max(axis=0) for chunk in pilot], axis=0).astype(float)
+    spread = np.maximum(highest - lowest, 1e-6 * np.maximum(np.abs(highest), 1.0))
+    lower = (lowest - HISTOGRAM_MARGIN * spread).astype(np.float32)
+    width = (spread * (1 + 2 * HISTOGRAM_MARGIN) / n_bins).astype(np.float32)
+    
+    counts = np.zeros((n_cells, n_bins), dtype=np.intp)
+    sums = np.zeros(n_cells)
+    minima = np.full(n_cells, np.inf, dtype=np.float32)
+    maxima = np.full(n_cells, -np.inf, dtype=np.float32)
+    
+    def add(summary):
+        chunk_counts, chunk_sums, chunk_min, chunk_max = summary
+        np.add(counts, chunk_counts, out=counts)
+        np.add(sums, chunk_sums, out=sums)
+        np.minimum(minima, chunk_min, out=minima)
+        np.maximum(maxima, chunk_max, out=maxima)
+    
+    for chunk in pilot:
+        add(_summarize_chunk(chunk, lower, width, n_bins))
+    del pilot
+    
+    rest = [a + (lower, width, n_bins) for a in args[n_pilot:]]
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    if n_jobs > 1 and len(rest) > 1:
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            for summary in pool.map(_simulate_summary, *zip(*rest)):
+                add(summary)
+    else:
+        for a in rest:
+            add(_simulate_summary(*a))
+    
+    # Factors are scaled by the baseline; a negative baseline reverses their order
+    factor_bands = _histogram_percentiles(counts, lower, width, minima, maxima,
+                                          list(percentiles) + [100 - q for q in percentiles])
+    scale = np.repeat(baseline, len(dates))
+    means = (scale * sums / n_draws).reshape(len(indicators), len(dates))
+    bands = []
+    for k in range(len(factor_bands) // 2):
+        band = np.where(scale < 0, factor_bands[len(factor_bands) // 2 + k], factor_bands[k])
+        bands.append((scale * band).reshape(len(indicators), len(dates)))
+    
+    rows = []
+    for t, year in enumerate(years):
+        for i, indicator in enumerate(indicators):
+            row = {'indicator': indicator, 'year': int(year), 'mean': float(means[i, t])}
+            for q, band in zip(percentiles, bands):
+                row[f"p{q:g}"] = float(band[i, t])
+            rows.append(row)
+    
+    return pd.DataFrame(rows)
@@ -0,0 +1,239 @@
+# src/scenarios.py - Broadcasted scenario grids over access/usage forecasts
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .forecasting import CI_LOWER_SHARE, CI_UPPER_SHARE
+
+# Task 4 scenarios; ci_adjustment scales the width of the confidence interval
+SCENARIOS = {
+    'optimistic': {
+        'description': 'Rapid adoption with successful policy implementation',
+        'access_multiplier': 1.3,
+        'usage_multiplier': 1.5,
+        'event_effectiveness': 1.2,
+        'ci_adjustment': 0.8,
+    },
+    'base': {
+        'description': 'Current trend continuation with moderate event impacts',
+        'access_multiplier': 1.0,
+        'usage_multiplier': 1.0,
+        'event_effectiveness': 1.0,
+        'ci_adjustment': 1.0,
+    },
+    'pessimistic': {
+        'description': 'Slow adoption due to economic or regulatory challenges',
+        'access_multiplier': 0.7,
+        'usage_multiplier': 0.6,
+        'event_effectiveness': 0.8,
+        'ci_adjustment': 1.3,
+    },
+}
+
+METRICS = ('access', 'usage')
+
+PARAMETER_COLUMNS = ['access_multiplier', 'usage_multiplier', 'event_effectiveness', 'ci_adjustment']
+
+# Grid columns with this prefix switch one event's impact on (True) or off
+EVENT_TOGGLE_PREFIX = 'event_on:'
+
+# Same columns as data/processed/forecast_results_2025_2027.csv
+FORECAST_RESULT_COLUMNS = ['year', 'scenario', 'access_forecast', 'access_ci_lower',
+                           'access_ci_upper', 'usage_forecast', 'usage_ci_lower', 'usage_ci_upper']
+
+# Interval widening per unit of event shift (see forecasting.apply_event_impacts)
+CI_WIDENING = CI_UPPER_SHARE - CI_LOWER_SHARE
+
+SCENARIO_INDEX_FILE = '_scenarios.parquet'
+
+def named_scenarios(scenarios=SCENARIOS):
+    """Grid holding the hand-written scenarios, one row each"""
+    grid = pd.DataFrame.from_dict(scenarios, orient='index')[PARAMETER_COLUMNS]
+    return grid.rename_axis('scenario').reset_index()
+
+def scenario_grid(access_multipliers, usage_multipliers, event_effectiveness,
+                  ci_adjustments=(1.0,), event_ids=()):
+    """
+    Cartesian product of scenario parameters and event on/off toggles
+    
+    Parameters:
+    -----------
+    access_multipliers, usage_multipliers, event_effectiveness, ci_adjustments : iterables
+        Values swept for each parameter
+    event_ids : iterable
+        Events whose impact is toggled; every on/off combination is included
+    
+    Returns:
+    --------
+    DataFrame : scenario name, PARAMETER_COLUMNS and one boolean
+        EVENT_TOGGLE_PREFIX column per toggled event
+    """
+    event_ids = list(event_ids)
+    values = [np.asarray(list(v), dtype=float) for v in
+              (access_multipliers, usage_multipliers, event_effectiveness, ci_adjustments)]
+    values += [np.array([True, False])] * len(event_ids)
+    
+    mesh = np.meshgrid(*values, indexing='ij')
+    grid = pd.DataFrame({col: m.ravel() for col, m in
+                         zip(PARAMETER_COLUMNS + [f"{EVENT_TOGGLE_PREFIX}{e}" for e in event_ids], mesh)})
+    for e in event_ids:
+        grid[f"{EVENT_TOGGLE_PREFIX}{e}"] = grid[f"{EVENT_TOGGLE_PREFIX}{e}"].astype(bool)
+    grid.insert(0, 'scenario', [f"grid_{i:06d}" for i in range(len(grid))])
+    return grid
+
+def _toggle_matrix(grid, event_ids):
+    """(scenarios, events) 0/1 array; events without a toggle column stay on"""
+    toggles = np.ones((len(grid), len(event_ids)))
+    for j, event_id in enumerate(event_ids):
+        col = f"{EVENT_TOGGLE_PREFIX}{event_id}"
+        if col in grid.columns:
+            toggles[:, j] = grid[col].to_numpy(dtype=float)
+    return toggles
+
+def evaluate_scenarios(grid, baseline, adjustments, scale=100.0):
+    """
+    Forecast every scenario of a grid in one broadcasted computation
+    
+    For each metric, as in the Task 4 generate_scenario_forecasts:
+    forecast = baseline * multiplier + event shift * event_effectiveness,
+    with the event-adjusted confidence interval width scaled by
+    ci_adjustment around it. The event shift is the sum of the switched-on
+    events' impacts.
+    
+    Parameters:
+    -----------
+    grid : DataFrame
+        Output of scenario_grid or named_scenarios
+    baseline : dict
+        {'access': frame, 'usage': frame}, each with year, predicted,
+        ci_lower and ci_upper for the forecast years (forecast_trend()['future'])
+    adjustments : dict
+        {'access': (event_ids, array), 'usage': ...} from
+        forecasting.event_adjustment_matrices for the same years
+    scale : float
+        Converts impact proportions to forecast units (100 = percentage points)
+    
+    Returns:
+    --------
+    DataFrame : FORECAST_RESULT_COLUMNS, scenario-major then year
+    """
+    years = baseline['access']['year'].to_numpy(dtype=int)
+    n_scenarios = len(grid)
+    results = {
+        'year': np.tile(years, n_scenarios),
+        'scenario': np.repeat(grid['scenario'].to_numpy(dtype=object), len(years)),
+    }
+    
+    effectiveness = grid['event_effectiveness'].to_numpy(dtype=float)[:, None]
+    ci_adjustment = grid['ci_adjustment'].to_numpy(dtype=float)[:, None]
+    
+    for metric in METRICS:
+        frame = baseline[metric]
+        predicted = frame['predicted'].to_numpy(dtype=float)[None, :]
+        ci_range = (frame['ci_upper'] - frame['ci_lower']).to_numpy(dtype=float)[None, :]
+        
+        event_ids, per_event = adjustments[metric]
+        # (scenarios, events) @ (events, years) -> event shift per scenario and year
+        shift = _toggle_matrix(grid, event_ids) @ per_event * scale
+        
+        multiplier = grid[f"{metric}_multiplier"].to_numpy(dtype=float)[:, None]
+        forecast = predicted * multiplier + shift * effectiveness
+        half_width = (ci_range + shift * CI_WIDENING) * ci_adjustment / 2
+        
+        results[f"{metric}_forecast"] = forecast.ravel()
+        results[f"{metric}_ci_lower"] = (forecast - half_width).ravel()
+        results[f"{metric}_ci_upper"] = (forecast + half_width).ravel()
+    
+    return pd.DataFrame(results, columns=FORECAST_RESULT_COLUMNS)
+
+def _evaluate_chunk(chunk_id, grid, baseline, adjustments, scale, output_dir):
+    """Evaluate one slice of the grid and write it as a year-partitioned Parquet part"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    
+    results = evaluate_scenarios(grid, baseline, adjustments, scale)
+    pq.write_to_dataset(pa.Table.from_pandas(results, preserve_index=False), output_dir,
+                        partition_cols=['year'],
+                        basename_template=f"part-{chunk_id:05d}-{{i}}.parquet")
+    return len(results)
+
+def run_scenario_grid(grid, baseline, adjustments, output_dir=None, chunk_size=10_000,
+                      n_jobs=1, scale=100.0, verbose=True):
+    """
+    Evaluate a scenario grid chunk by chunk, optionally streaming to Parquet
+    
+    The per-event adjustments are computed once, before the grid runs
+    (forecasting.event_adjustment_matrices), and shared by every scenario;
+    a scenario only toggles and scales them in evaluate_scenarios. The
+    process pool therefore parallelizes the chunked evaluation and the
+    Parquet writes, which grow with the grid, rather than the adjustment
+    step.
+    
+    Parameters:
+    -----------
+    grid, baseline, adjustments, scale :
+        See evaluate_scenarios
+    output_dir : str, optional
+        Root of a Parquet dataset partitioned by year (year=2025/...), with
+        the grid itself in _scenarios.parquet. Use a fresh directory: parts
+        left by a larger earlier grid are not removed. When omitted the
+        results are returned as one DataFrame instead.
+    chunk_size : int
+        Scenarios evaluated (and written) per chunk
+    n_jobs : int
+        Worker processes for the chunks when writing (-1 for all CPUs)
+    verbose : bool
+        Print the number of rows written
+    
+    Returns:
+    --------
+    DataFrame or int : the results, or the number of rows written
+    """
+    chunks = [grid.iloc[start:start + chunk_size] for start in range(0, len(grid), chunk_size)]
+    
+    if output_dir is None:
+        return pd.concat([evaluate_scenarios(chunk, baseline, adjustments, scale)
+                          for chunk in chunks], ignore_index=True)
+    
+    os.makedirs(output_dir, exist_ok=True)
+    grid.to_parquet(os.path.join(output_dir, SCENARIO_INDEX_FILE), index=False)
+    
+    args = [(i, chunk, baseline, adjustments, scale, output_dir) for i, chunk in enumerate(chunks)]
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    if n_jobs > 1 and len(args) > 1:
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            written = sum(pool.map(_evaluate_chunk, *zip(*args)))
+    else:
+        written = sum(itertools.starmap(_evaluate_chunk, args))
+    
+    if verbose:
+        print(f"Wrote {written} scenario rows to {output_dir}")
+    return written
+
+def read_scenario_results(output_dir, scenarios=None, years=None):
+    """
+    Load scenario results written by run_scenario_grid
+    
+    Parameters:
+    -----------
+    output_dir : str
+        Dataset root
+    scenarios, years : list, optional
+        Filters pushed down to the Parquet reader
+    
+    Returns:
+    --------
+    DataFrame : FORECAST_RESULT_COLUMNS
+    """
+    filters = []
+    if scenarios is not None:
+        filters.append(('scenario', 'in', list(scenarios)))
+    if years is not None:
+        filters.append(('year', 'in', [int(y) for y in years]))
+    results = pd.read_parquet(output_dir, filters=filters or None)
+    results['year'] = results['year'].astype(int)
+    return results[FORECAST_RESULT_COLUMNS]
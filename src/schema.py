@@ -0,0 +1,246 @@
+# src/schema.py - Declarative column schema and vectorized type coercion
+import os
+import pandas as pd
+
+# Candidate formats tried against template sample values, most specific first
+DATE_FORMATS = ['%Y-%m-%d %H:%M:%S', '%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y', '%Y/%m/%d']
+
+# Columns that hold numbers even though reference_codes.xlsx lists coded
+# values for them (impact_magnitude has high/medium/low labels there)
+NUMERIC_COLUMNS = ['value_numeric', 'impact_magnitude', 'impact_estimate', 'lag_months']
+
+# Low-cardinality free-text columns converted to category in addition to
+# the coded fields from reference_codes.xlsx
+CATEGORY_COLUMNS = ['indicator_code', 'related_indicator', 'source_name']
+
+# Coded fields kept as plain strings because downstream code compares and
+# splits on them (record_type drives separate_record_types)
+STRING_COLUMNS = ['record_type']
+
+# Date columns cleaned by the original pipeline; templates only refine their
+# formats, so other *_date columns (e.g. free-text collection_date) are untouched
+DEFAULT_DATE_COLUMNS = {
+    'observation_date': '%Y-%m-%d',
+    'start_date': '%Y-%m-%d',
+    'end_date': '%Y-%m-%d',
+    'event_date': '%Y-%m-%d',
+    'target_date': '%Y-%m-%d',
+}
+
+# A date column is left unchanged when more than this share of its present
+# values cannot be parsed (the column probably holds something else)
+MAX_DATE_FAILURE_RATIO = 0.5
+
+def detect_date_format(values):
+    """
+    Return the first candidate format that parses every sample value
+    
+    Parameters:
+    -----------
+    values : iterable of str
+        Non-empty sample strings
+    
+    Returns:
+    --------
+    str or None : strptime format, or None if no candidate fits
+    """
+    sample = pd.Series([str(v) for v in values if pd.notna(v)])
+    if sample.empty:
+        return None
+    
+    for fmt in DATE_FORMATS:
+        parsed = pd.to_datetime(sample, format=fmt, errors='coerce')
+        if parsed.notna().all():
+            return fmt
+    return None
+
+def build_schema(reference_path='data/raw/reference_codes.xlsx',
+                 template_dir='data/templates'):
+    """
+    Derive a column -> type mapping from reference codes and CSV templates
+    
+    Coded fields listed in reference_codes.xlsx become categories (except
+    STRING_COLUMNS). DEFAULT_DATE_COLUMNS become datetimes, with the exact
+    format detected from template samples where a template has the column;
+    NUMERIC_COLUMNS become numeric. Missing inputs are skipped, so the
+    built-in defaults are always present.
+    
+    Parameters:
+    -----------
+    reference_path : str
+        Path to reference_codes.xlsx (a field/code table)
+    template_dir : str
+        Directory of new_*_template.csv files
+    
+    Returns:
+    --------
+    dict : {column: {'dtype': 'datetime' | 'numeric' | 'category', 'format': str,
+        'codes': list of str}}; 'codes' lists the reference codes of a coded field
+    """
+    schema = {col: {'dtype': 'datetime', 'format': fmt}
+              for col, fmt in DEFAULT_DATE_COLUMNS.items()}
+    
+    for col in CATEGORY_COLUMNS:
+        schema[col] = {'dtype': 'category'}
+    
+    if os.path.exists(reference_path):
+        try:
+            reference_codes = pd.read_excel(reference_path).dropna(subset=['field', 'code'])
+            for field, codes in reference_codes.groupby('field', sort=False)['code']:
+                if field not in STRING_COLUMNS:
+                    schema[field] = {'dtype': 'category',
+                                     'codes': list(dict.fromkeys(codes.astype(str)))}
+        except Exception as e:
+            print(f"Could not read reference codes for schema: {e}")
+    
+    if os.path.isdir(template_dir):
+        for name in sorted(os.listdir(template_dir)):
+            if not name.endswith('.csv'):
+                continue
+            try:
+                template = pd.read_csv(os.path.join(template_dir, name), dtype=str)
+            except Exception as e:
+                print(f"Could not read template {name}: {e}")
+                continue
+            
+            for col in template.columns:
+                if col in DEFAULT_DATE_COLUMNS:
+                    fmt = detect_date_format(template[col])
+                    if fmt is not None:
+                        schema[col] = {'dtype': 'datetime', 'format': fmt}
+    
+    for col in NUMERIC_COLUMNS:
+        schema[col] = {'dtype': 'numeric'}
+    
+    return schema
+
+_DEFAULT_SCHEMA = None
+
+def get_default_schema():
+    """Build the schema from the repository data files once and reuse it"""
+    global _DEFAULT_SCHEMA
+    if _DEFAULT_SCHEMA is None:
+        _DEFAULT_SCHEMA = build_schema()
+    return _DEFAULT_SCHEMA
+
+def chunk_schema(schema=None):
+    """
+    Schema for data coerced chunk by chunk
+    
+    Coded fields get their reference codes as fixed categories, so every
+    chunk has the same categorical dtype and chunks concatenate without
+    falling back to object. Category columns without a code list are left
+    as strings, since their categories would differ from chunk to chunk.
+    Values outside a code list are kept: coerce_frame appends them to the
+    categories and stores the extended dtype back in this schema, so later
+    chunks coerced with it share the longer list.
+    
+    Parameters:
+    -----------
+    schema : dict, optional
+        Output of build_schema(); defaults to get_default_schema()
+    
+    Returns:
+    --------
+    dict : Schema for coerce_frame
+    """
+    if schema is None:
+        schema = get_default_schema()
+    
+    fixed = {}
+    for col, spec in schema.items():
+        if spec['dtype'] == 'category':
+            if spec.get('codes') is None:
+                continue
+            spec = dict(spec, categories=pd.CategoricalDtype(spec['codes']))
+        fixed[col] = spec
+    return fixed
+
+def _coerce_dates(series, fmt):
+    """Parse with the exact format, retrying only the misses as ISO 8601"""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series
+    
+    parsed = pd.to_datetime(series, format=fmt, errors='coerce')
+    retry = parsed.isna() & series.notna()
+    if retry.any():
+        parsed[retry] = pd.to_datetime(series[retry].astype(str), format='ISO8601',
+                                       errors='coerce')
+    return parsed
+
+def _coerce_numeric(series, downcast):
+    """Convert to numbers, downcasting within the integer or float kind"""
+    numeric = pd.to_numeric(series, errors='coerce')
+    if not downcast:
+        return numeric
+    
+    if pd.api.types.is_integer_dtype(numeric):
+        return pd.to_numeric(numeric, downcast='integer')
+    return pd.to_numeric(numeric, downcast='float')
+
+def coerce_frame(frame, schema=None, downcast=False, max_category_ratio=0.5):
+    """
+    Coerce every schema column of a frame in one pass
+    
+    Parameters:
+    -----------
+    frame : DataFrame
+        Frame to convert (not modified)
+    schema : dict, optional
+        Output of build_schema(); defaults to get_default_schema()
+    downcast : bool
+        Downcast numeric columns (float64 -> float32, integers to the
+        smallest integer type). Off by default: float32 keeps only about
+        7 significant digits.
+    max_category_ratio : float
+        Category columns with more distinct values than this fraction of
+        rows are left as strings, where a category would not save memory
+        (not applied to columns with fixed categories, see chunk_schema,
+        whose category lists are extended in place with unseen values)
+    
+    Returns:
+    --------
+    tuple : (coerced DataFrame, {column: failure count})
+        Failures count values that were present but could not be converted;
+        a date column where they exceed MAX_DATE_FAILURE_RATIO of the
+        present values is returned unchanged
+    """
+    if schema is None:
+        schema = get_default_schema()
+    
+    converted = {}
+    failures = {}
+    
+    for col in frame.columns.intersection(list(schema)):
+        spec = schema[col]
+        series = frame[col]
+        
+        if spec['dtype'] == 'datetime':
+            result = _coerce_dates(series, spec.get('format'))
+        elif spec['dtype'] == 'numeric':
+            result = _coerce_numeric(series, downcast)
+        elif spec['dtype'] == 'category' and 'categories' in spec:
+            values = series.astype(str).where(series.notna())
+            known = spec['categories'].categories
+            unseen = pd.Index(values.dropna().unique()).difference(known)
+            if len(unseen):
+                spec['categories'] = pd.CategoricalDtype(known.append(unseen))
+            result = values.astype(spec['categories'])
+        elif spec['dtype'] == 'category':
+            if (isinstance(series.dtype, pd.CategoricalDtype)
+                    or series.nunique() > max_category_ratio * max(len(series), 1)):
+                continue
+            result = series.astype('category')
+        else:
+            continue
+        
+        present = series.notna()
+        failures[col] = int((present & result.isna()).sum())
+        if spec['dtype'] == 'datetime' and failures[col] > MAX_DATE_FAILURE_RATIO * present.sum():
+            continue
+        converted[col] = result
+    
+    if not converted:
+        return frame.copy(), failures
+    
+    return frame.assign(**converted), failures
@@ -0,0 +1,155 @@
+# src/series_index.py - Sorted per-indicator slices of observation dates and values
+import numpy as np
+import pandas as pd
+
+# Disaggregation columns that, with the indicator, identify one series
+DEFAULT_DISAGGREGATIONS = ('gender', 'location')
+
+def _slices(codes):
+    """{code: (start, stop)} for runs of equal values in an already sorted array"""
+    if not len(codes):
+        return {}
+    boundaries = np.flatnonzero(codes[1:] != codes[:-1]) + 1
+    starts = np.concatenate([[0], boundaries])
+    stops = np.concatenate([boundaries, [len(codes)]])
+    return {int(codes[start]): (int(start), int(stop)) for start, stop in zip(starts, stops)}
+
+class SeriesIndex:
+    """
+    Observations indexed by indicator (and disaggregation) for range queries
+    
+    Built once from the observation table: rows are sorted by key and
+    date, and each indicator, and each (indicator, *disaggregations) key,
+    maps to a contiguous slice of NumPy arrays of dates, years, values
+    and original row positions. A year range within a series is then two
+    binary searches, with no scan of the table and no change to it.
+    
+    Parameters:
+    -----------
+    observations : DataFrame
+        Rows with indicator_col, a datetime date_col and value_col; rows
+        without a date are not indexed
+    indicator_col, date_col, value_col : str
+        Column names
+    disaggregations : tuple of str
+        Columns of the full series key; missing columns are ignored
+    """
+    
+    def __init__(self, observations, indicator_col='indicator_code', date_col='observation_date',
+                 value_col='value_numeric', disaggregations=DEFAULT_DISAGGREGATIONS):
+        self.indicator_col = indicator_col
+        self.date_col = date_col
+        self.value_col = value_col
+        self.disaggregations = [col for col in disaggregations if col in observations.columns]
+        
+        dated = np.flatnonzero(observations[date_col].notna().to_numpy())
+        frame = observations.iloc[dated]
+        dates = frame[date_col].to_numpy(dtype='datetime64[ns]')
+        values = pd.to_numeric(frame[value_col], errors='coerce').to_numpy(dtype=float)
+        
+        # Level 0: indicator; level 1: indicator and disaggregations
+        columns = [indicator_col] + self.disaggregations
+        codes, uniques = [], []
+        for col in columns:
+            col_codes, col_uniques = pd.factorize(frame[col], use_na_sentinel=False)
+            codes.append(col_codes)
+            uniques.append([None if pd.isna(u) else u for u in col_uniques])
+        
+        self._levels = {0: self._build_level(codes[:1], uniques[:1], dates, values, dated)}
+        if self.disaggregations:
+            self._levels[1] = self._build_level(codes, uniques, dates, values, dated)
+    
+    @staticmethod
+    def _build_level(codes, uniques, dates, values, positions):
+        """Arrays sorted by key then date, and the slice of every key"""
+        shape = tuple(max(len(u), 1) for u in uniques)
+        key_codes = np.ravel_multi_index(codes, shape) if codes[0].size else codes[0]
+        
+        # Stable, so rows with equal dates keep their table order
+        order = np.lexsort((dates, key_codes))
+        sorted_dates = dates[order]
+        slices = {}
+        for code, span in _slices(key_codes[order]).items():
+            parts = np.unravel_index(code, shape)
+            slices[tuple(u[i] for u, i in zip(uniques, parts))] = span
+        
+        return {
+            'dates': sorted_dates,
+            'years': sorted_dates.astype('datetime64[Y]').astype(int) + 1970,
+            'values': values[order],
+            'positions': positions[order],
+            'slices': slices,
+        }
+    
+    def _level(self, key):
+        """Level arrays and the (start, stop) slice of a key, or None"""
+        key = (key,) if not isinstance(key, tuple) else key
+        level = self._levels.get(0 if len(key) == 1 else 1)
+        if level is None or key not in level['slices']:
+            return level, None
+        return level, level['slices'][key]
+    
+    def keys(self, disaggregated=False):
+        """Indexed indicators, or full (indicator, *disaggregations) keys"""
+        level = self._levels.get(1 if disaggregated else 0, {'slices': {}})
+        keys = list(level['slices'])
+        return keys if disaggregated else [key[0] for key in keys]
+    
+    def _span(self, key, start_year=None, end_year=None):
+        level, span = self._level(key)
+        if span is None:
+            return level, 0, 0
+        start, stop = span
+        years = level['years'][start:stop]
+        if start_year is not None:
+            start += int(np.searchsorted(years, start_year, side='left'))
+        if end_year is not None:
+            stop = span[0] + int(np.searchsorted(years, end_year, side='right'))
+        return level, start, max(start, stop)
+    
+    def arrays(self, key, start_year=None, end_year=None):
+        """
+        Dates and values of one series between two years (inclusive), by date
+        
+        Parameters:
+        -----------
+        key : str or tuple
+            Indicator code (all its disaggregations), or a full
+            (indicator, *disaggregations) tuple; NaN disaggregations are None
+        start_year, end_year : int, optional
+            Year bounds; open when omitted
+        
+        Returns:
+        --------
+        tuple : (dates, values) NumPy views; empty when the key is unknown
+        """
+        level, start, stop = self._span(key, start_year, end_year)
+        if level is None:
+            return np.empty(0, dtype='datetime64[ns]'), np.empty(0)
+        return level['dates'][start:stop], level['values'][start:stop]
+    
+    def positions(self, key, start_year=None, end_year=None):
+        """Row positions in the indexed table (for .iloc) of a series range, by date"""
+        level, start, stop = self._span(key, start_year, end_year)
+        if level is None:
+            return np.empty(0, dtype=int)
+        return level['positions'][start:stop]
+    
+    def series(self, key, start_year=None, end_year=None):
+        """
+        One series range as a small frame
+        
+        Returns:
+        --------
+        DataFrame : date_col, year and value_col, sorted by date
+        """
+        level, start, stop = self._span(key, start_year, end_year)
+        if level is None:
+            start = stop = 0
+            level = {'dates': np.empty(0, dtype='datetime64[ns]'), 'years': np.empty(0, dtype=int),
+                     'values': np.empty(0)}
+        return pd.DataFrame({
+            self.date_col: level['dates'][start:stop],
+            'year': level['years'][start:stop],
+            self.value_col: level['values'][start:stop],
+        })
@@ -0,0 +1,139 @@
+# src/shared_store.py - Process-wide, read-only store of derived frames backed by memory-mapped Feather
+import os
+import threading
+
+import pandas as pd
+
+try:
+    import pyarrow.feather as feather
+except ImportError:  # pyarrow is optional; frames are then kept in memory only
+    feather = None
+
+from .explorer_store import arrow_table
+
+class SharedFrameStore:
+    """
+    Derived frames computed once and shared by every session
+    
+    Frames are keyed by name and a version string (e.g. the fingerprint of
+    the data they were derived from). The first request for a key computes
+    the frame and writes it as an uncompressed Feather (Arrow IPC) file;
+    every later request, from any session, gets the same pandas object,
+    which is read from the memory-mapped file so its pages can also be
+    shared with other server processes through the OS page cache. Only the
+    latest version of each name is kept.
+    
+    Frames are shared: callers must treat them as read-only (with pandas
+    copy-on-write, modifying a derived copy never touches the original).
+    
+    Parameters:
+    -----------
+    directory : str, optional
+        Where the Feather files are written; frames stay in memory only
+        when omitted or when pyarrow is unavailable
+    """
+    
+    def __init__(self, directory=None):
+        self.directory = directory if feather is not None else None
+        self.hits = 0
+        self.misses = 0
+        self._frames = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+        if self.directory is not None:
+            os.makedirs(self.directory, exist_ok=True)
+    
+    def _entry_lock(self, name):
+        with self._lock:
+            return self._locks.setdefault(name, threading.Lock())
+    
+    def _path(self, name, version):
+        return os.path.join(self.directory, f"{name}-{version}.arrow")
+    
+    def _lookup(self, name, version):
+        with self._lock:
+            entry = self._frames.get(name)
+            if entry is not None and entry['version'] == version:
+                self.hits += 1
+                return entry['frame']
+        return None
+    
+    def _materialize(self, name, version, frame):
+        """Round-trip a frame through a memory-mapped Feather file"""
+        if self.directory is None:
+            return frame
+        path = self._path(name, version)
+        if not os.path.exists(path):
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                feather.write_feather(arrow_table(frame), tmp_path, compression='uncompressed')
+                os.replace(tmp_path, path)
+            except Exception:
+                # Not Arrow-representable: share the in-memory frame instead
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                return frame
+        # split_blocks lets null-free numeric columns reference the mapped buffers
+        return feather.read_table(path, memory_map=True).to_pandas(split_blocks=True)
+    
+    def get(self, name, version, compute):
+        """
+        Shared frame for a name and version, computing it on a miss
+        
+        Parameters:
+        -----------
+        name : str
+            Frame name (also the Feather file prefix)
+        version : str
+            Identifies the inputs; a new version replaces the old frame
+        compute : callable
+            Called without arguments to build the frame on a miss
+        
+        Returns:
+        --------
+        DataFrame : The shared frame (do not modify in place)
+        """
+        frame = self._lookup(name, version)
+        if frame is not None:
+            return frame
+        
+        with self._entry_lock(name):
+            frame = self._lookup(name, version)
+            if frame is not None:
+                return frame
+            
+            frame = self._materialize(name, version, compute())
+            with self._lock:
+                previous = self._frames.get(name)
+                self._frames[name] = {'version': version, 'frame': frame}
+                self.misses += 1
+            
+            # Older files stay valid for processes that still map them (unlinked, not truncated)
+            if previous is not None and self.directory is not None:
+                old_path = self._path(name, previous['version'])
+                if os.path.exists(old_path):
+                    os.remove(old_path)
+            return frame
+    
+    def stats(self):
+        """
+        Shared frames currently held
+        
+        Returns:
+        --------
+        DataFrame : name, version, rows, memory_mb (pandas estimate) and
+            mapped (backed by a Feather file)
+        """
+        with self._lock:
+            entries = list(self._frames.items())
+        rows = [{'name': name,
+                 'version': entry['version'],
+                 'rows': len(entry['frame']),
+                 'memory_mb': entry['frame'].memory_usage(deep=True).sum() / 1e6,
+                 'mapped': self.directory is not None and os.path.exists(self._path(name, entry['version']))}
+                for name, entry in entries]
+        return pd.DataFrame(rows, columns=['name', 'version', 'rows', 'memory_mb', 'mapped'])
+    
+    def clear(self):
+        with self._lock:
+            self._frames.clear()
@@ -0,0 +1,18 @@
+import pytest
+
+from benchmarks.synthetic import make_findex_observations, make_model, make_observations
+
+
+@pytest.fixture(scope='module')
+def impact_model():
+    return make_model(12, 8, nan_lags=0.2)
+
+
+@pytest.fixture(scope='module')
+def observations():
+    return make_observations(5000)
+
+
+@pytest.fixture(scope='module')
+def findex_observations():
+    return make_findex_observations(20)
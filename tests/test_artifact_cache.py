@@ -0,0 +1,110 @@
+import os
+
+import pandas as pd
+
+from src.artifact_cache import ArtifactCache, LazyArtifacts
+
+
+def write_csv(path, values):
+    pd.DataFrame({'year': [2025, 2026], 'value': values}).to_csv(path, index=False)
+
+
+def touch(path, seconds):
+    info = os.stat(path)
+    os.utime(path, ns=(info.st_atime_ns, info.st_mtime_ns + int(seconds * 1e9)))
+
+
+def test_hits_until_the_file_changes(tmp_path):
+    path = str(tmp_path / 'forecast.csv')
+    write_csv(path, [1.0, 2.0])
+    cache = ArtifactCache()
+    loads = []
+    
+    def loader():
+        loads.append(path)
+        return pd.read_csv(path)
+    
+    first = cache.get('forecast', path, loader)
+    assert cache.get('forecast', path, loader) is first
+    version = cache.version('forecast')
+    
+    # Touched but identical content is still a hit
+    touch(path, 5)
+    assert cache.get('forecast', path, loader) is first
+    assert len(loads) == 1
+    
+    write_csv(path, [1.0, 3.0])
+    touch(path, 10)
+    reloaded = cache.get('forecast', path, loader)
+    assert reloaded['value'].tolist() == [1.0, 3.0]
+    assert cache.version('forecast') != version
+    
+    stats = cache.stats().set_index('artifact').loc['forecast']
+    assert (stats['hits'], stats['misses'], stats['reason']) == (2, 2, 'forecast.csv changed')
+
+
+def test_ttl_and_invalidate_reload(tmp_path):
+    path = str(tmp_path / 'summary.csv')
+    write_csv(path, [1.0, 2.0])
+    loads = []
+    
+    def loader():
+        loads.append(path)
+        return pd.read_csv(path)
+    
+    expiring = ArtifactCache(ttl=0)
+    expiring.get('summary', path, loader)
+    expiring.get('summary', path, loader)
+    assert len(loads) == 2
+    
+    cache = ArtifactCache()
+    cache.get('summary', path, loader)
+    cache.invalidate('summary')
+    cache.get('summary', path, loader)
+    assert len(loads) == 4
+
+
+def test_lazy_artifacts_load_on_access_and_fall_back(tmp_path):
+    path = str(tmp_path / 'forecast.csv')
+    write_csv(path, [1.0, 2.0])
+    errors = []
+    artifacts = LazyArtifacts(ArtifactCache(), {
+        'forecast': {'paths': path, 'loader': lambda _: pd.read_csv(path)},
+        'missing': {'paths': str(tmp_path / 'missing.csv'),
+                    'loader': lambda _: pd.read_csv(tmp_path / 'missing.csv'),
+                    'fallback': lambda _: pd.DataFrame({'value': [0.0]})},
+    }, on_error=lambda name, e: errors.append(name))
+    
+    assert artifacts.loaded() == []
+    assert artifacts['forecast']['value'].tolist() == [1.0, 2.0]
+    assert artifacts['missing']['value'].tolist() == [0.0]
+    assert artifacts.version('missing') == 'fallback'
+    assert errors == ['missing']
+    assert artifacts.loaded() == ['forecast', 'missing']
+
+
+def test_lazy_versions_change_with_the_source_file(tmp_path):
+    path = str(tmp_path / 'forecast.csv')
+    write_csv(path, [1.0, 2.0])
+    cache = ArtifactCache()
+    specs = {
+        'forecast': {'paths': path, 'loader': lambda _: pd.read_csv(path)},
+        'total': {'paths': path, 'loader': lambda data: data['forecast']['value'].sum()},
+    }
+    
+    first = LazyArtifacts(cache, specs)
+    assert first['total'] == 3.0
+    assert first.loaded() == ['forecast', 'total']
+    version = first.version('forecast')
+    
+    # A rerun over the unchanged file sees the same version
+    rerun = LazyArtifacts(cache, specs)
+    assert rerun.version('forecast') == version
+    assert rerun.loaded() == ['forecast']
+    
+    write_csv(path, [1.0, 5.0])
+    touch(path, 10)
+    changed = LazyArtifacts(cache, specs)
+    assert changed.version('forecast') != version
+    assert changed['total'] == 6.0
+    assert first['total'] == 3.0
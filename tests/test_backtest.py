@@ -0,0 +1,33 @@
+import numpy as np
+import pandas as pd
+
+from src.backtest import run_backtest
+
+MERGE_ON = ['indicator_code', 'gender', 'location', 'origin', 'year']
+
+
+def test_cached_fits_are_reused(findex_observations, tmp_path):
+    observations = findex_observations
+    through_2021 = observations[observations['observation_date'].dt.year <= 2021]
+    cache_dir = str(tmp_path)
+    
+    cold = run_backtest(through_2021, cache_dir=cache_dir)
+    assert not cold['folds']['fit_cached'].any()
+    warm = run_backtest(through_2021, cache_dir=cache_dir)
+    assert warm['folds']['fit_cached'].all()
+    pd.testing.assert_frame_equal(warm['predictions'], cold['predictions'])
+    
+    # A new vintage only adds a fold; earlier folds come from the cache unchanged
+    extended = run_backtest(observations, cache_dir=cache_dir)
+    folds = extended['folds'].set_index('origin')['fit_cached']
+    assert not folds.loc[2021] and folds.drop(2021).all()
+    common = cold['predictions'].merge(extended['predictions'], on=MERGE_ON, suffixes=('_old', '_new'))
+    assert len(common) > 0
+    np.testing.assert_allclose(common['predicted_old'], common['predicted_new'])
+
+
+def test_uncached_run_matches_cached(findex_observations, tmp_path):
+    cached = run_backtest(findex_observations, cache_dir=str(tmp_path))
+    uncached = run_backtest(findex_observations)
+    pd.testing.assert_frame_equal(cached['predictions'], uncached['predictions'])
+    pd.testing.assert_frame_equal(cached['metrics'], uncached['metrics'])
@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.correlations import CorrelationEngine, indicator_matrix, lagged_correlations
+
+
+@pytest.fixture(scope='module')
+def engine(observations):
+    return CorrelationEngine(observations)
+
+
+def test_level_correlations_match_dataframe_corr(engine):
+    matrix = engine.window(2011, 2024)
+    np.testing.assert_allclose(lagged_correlations(matrix).to_numpy(),
+                               matrix.corr(min_periods=3).to_numpy(), atol=1e-9, equal_nan=True)
+
+
+@pytest.mark.parametrize('lag', [1, 2])
+def test_lagged_correlations_match_pairwise_loop(engine, lag):
+    matrix = engine.window(2011, 2024)
+    corr = engine.correlations(2011, 2024, lag=lag)
+    
+    expected = pd.DataFrame(index=matrix.columns, columns=matrix.columns, dtype=float)
+    for a in matrix.columns:
+        leading = matrix[a].iloc[:len(matrix) - lag].reset_index(drop=True)
+        for b in matrix.columns:
+            lagging = matrix[b].iloc[lag:].reset_index(drop=True)
+            expected.loc[a, b] = leading.corr(lagging, min_periods=3)
+    np.testing.assert_allclose(corr.to_numpy(), expected.to_numpy(), atol=1e-9, equal_nan=True)
+
+
+def test_window_results_are_cached(engine):
+    first = engine.correlations(2013, 2020, lag=1, growth=True)
+    assert engine.correlations(2013, 2020, lag=1, growth=True) is first
+    assert engine.correlations(2013, 2021, lag=1, growth=True) is not first
+
+
+def test_matrix_keeps_only_aggregate_rows(observations):
+    matrix = indicator_matrix(observations)
+    aggregate = observations[observations['gender'] == 'all'].dropna(subset=['value_numeric'])
+    expected = aggregate.groupby([aggregate['observation_date'].dt.year, 'indicator_code'])[
+        'value_numeric'].mean().unstack()
+    pd.testing.assert_frame_equal(matrix.loc[expected.index, expected.columns], expected,
+                                  check_names=False, check_index_type=False)
@@ -0,0 +1,169 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import make_events, make_impact_links, make_main_data
+from benchmarks.synthetic import write_workbook as write_synthetic_workbook
+from src.data_loader import (SummaryAccumulator, get_data_summary, ingest_records, iter_records,
+                             iter_workbook_sheets, load_workbook_sheets, separate_record_types)
+from src.schema import build_schema
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+REFERENCE_PATH = os.path.join(ROOT, 'data', 'raw', 'reference_codes.xlsx')
+TEMPLATE_DIR = os.path.join(ROOT, 'data', 'templates')
+
+
+@pytest.fixture(scope='module')
+def schema():
+    return build_schema(REFERENCE_PATH, TEMPLATE_DIR)
+
+
+@pytest.fixture
+def extract(tmp_path):
+    # Each chunk of two rows sees different pillars and one bad number
+    frame = pd.DataFrame({
+        'record_type': ['observation'] * 6,
+        'pillar': ['ACCESS', 'ACCESS', 'USAGE', 'USAGE', 'ACCESS', 'USAGE'],
+        'indicator_code': ['ACC_OWNERSHIP', 'ACC_MM_ACCOUNT', 'USG_P2P', 'USG_P2P',
+                           'ACC_OWNERSHIP', 'USG_WAGES'],
+        'value_numeric': ['46.5', 'pending', '12', 'pending', '49', '7.25'],
+        'observation_date': ['2021-12-31', '2022-12-31', '2023-06-30', '2024-01-31',
+                             '2024-11-29', '2025-01-15'],
+    })
+    path = tmp_path / 'extract.csv'
+    frame.to_csv(path, index=False)
+    return str(path)
+
+
+def test_chunks_share_dtypes(extract, schema):
+    chunks = [observations for observations, _, _ in
+              iter_records(extract, chunksize=2, schema=schema)]
+    assert len(chunks) == 3
+    assert len({str(chunk['pillar'].dtype) for chunk in chunks}) == 1
+    
+    # Categorical columns concatenate without falling back to object
+    combined = pd.concat(chunks, ignore_index=True)
+    assert isinstance(combined['pillar'].dtype, pd.CategoricalDtype)
+    assert combined['pillar'].tolist() == ['ACCESS', 'ACCESS', 'USAGE', 'USAGE', 'ACCESS', 'USAGE']
+    assert combined['indicator_code'].tolist()[-1] == 'USG_WAGES'
+
+
+def test_failures_are_reported_once(extract, schema, capsys):
+    report = {}
+    counts = ingest_records(extract, {}, chunksize=2, schema=schema, report=report)
+    assert counts['observation'] == 6
+    assert report['observations']['value_numeric'] == 2
+    
+    output = capsys.readouterr().out
+    assert output.count('Coercion failures in observations') == 1
+
+
+def test_separate_record_types_matches_masks():
+    main_data = pd.DataFrame({
+        'record_type': ['event', 'observation', 'baseline', 'target', None, 'observation', 'event'],
+        'value_numeric': np.arange(7, dtype=float),
+    }, index=list('abcdefg'))
+    separated = separate_record_types(main_data, verbose=False)
+    for record_type, frame in zip(('observation', 'event', 'target'), separated):
+        pd.testing.assert_frame_equal(frame, main_data[main_data['record_type'] == record_type])
+    
+    # Edits to one partition reach neither the others nor the input
+    observations, events, _ = separated
+    observations.loc['b', 'value_numeric'] = -1.0
+    assert main_data.loc['b', 'value_numeric'] == 1.0
+    assert events['value_numeric'].tolist() == [0.0, 6.0]
+
+
+def test_separate_record_types_slices_grouped_input():
+    main_data = pd.DataFrame({
+        'record_type': ['observation'] * 3 + ['event'] * 2 + ['target'],
+        'value_numeric': np.arange(6, dtype=float),
+    })
+    observations, events, targets = separate_record_types(main_data, verbose=False)
+    assert np.shares_memory(events['value_numeric'].to_numpy(), main_data['value_numeric'].to_numpy())
+    assert (len(observations), len(events), len(targets)) == (3, 2, 1)
+
+
+def test_separate_record_types_copies_without_copy_on_write(monkeypatch):
+    from src import data_loader
+    
+    monkeypatch.setattr(data_loader, '_copy_on_write', lambda: False)
+    main_data = pd.DataFrame({
+        'record_type': ['observation'] * 3 + ['event'] * 2 + ['target'],
+        'value_numeric': np.arange(6, dtype=float),
+    })
+    observations, events, targets = separate_record_types(main_data, verbose=False)
+    assert not np.shares_memory(events['value_numeric'].to_numpy(), main_data['value_numeric'].to_numpy())
+    assert events['value_numeric'].tolist() == [3.0, 4.0]
+
+
+def write_workbook(path, values):
+    with pd.ExcelWriter(path) as writer:
+        pd.DataFrame({'record_type': ['observation'] * len(values),
+                      'value_numeric': values}).to_excel(writer, sheet_name='main', index=False)
+        pd.DataFrame({'parent_id': ['EVT_0001'], 'lag_months': [12]}).to_excel(
+            writer, sheet_name='links', index=False)
+
+
+def test_sheet_cache_hits_and_prunes(tmp_path, capsys):
+    workbook = str(tmp_path / 'workbook.xlsx')
+    cache_dir = str(tmp_path / 'cache')
+    write_workbook(workbook, [1.0, 2.5])
+    
+    cold = load_workbook_sheets(workbook, cache_dir=cache_dir)
+    warm = load_workbook_sheets(workbook, cache_dir=cache_dir, usecols=['value_numeric'])
+    output = capsys.readouterr().out
+    assert 'Sheet cache: 0 hit(s), 2 parsed' in output
+    assert 'Sheet cache: 2 hit(s), 0 parsed' in output
+    pd.testing.assert_frame_equal(warm['main'], cold['main'][['value_numeric']])
+    files = set(os.listdir(cache_dir))
+    assert len(files) == 2
+    
+    # Editing one sheet re-parses only that sheet and removes its stale file
+    write_workbook(workbook, [1.0, 3.5])
+    edited = load_workbook_sheets(workbook, cache_dir=cache_dir)
+    assert 'Sheet cache: 1 hit(s), 1 parsed' in capsys.readouterr().out
+    assert edited['main']['value_numeric'].tolist() == [1.0, 3.5]
+    remaining = set(os.listdir(cache_dir))
+    assert len(remaining) == 2 and len(remaining & files) == 1
+
+
+def test_streamed_sheets_match_read_excel(tmp_path):
+    workbook = write_synthetic_workbook(str(tmp_path / 'unified.xlsx'), 300, n_extra_sheets=1)
+    expected = pd.read_excel(workbook, sheet_name=None)
+    
+    streamed = dict(iter_workbook_sheets(workbook))
+    assert list(streamed) == list(expected)
+    for name, frame in expected.items():
+        pd.testing.assert_frame_equal(streamed[name], frame, check_dtype=False)
+    
+    loaded = load_workbook_sheets(workbook, streaming=True, sheets=['Impact_sheet'],
+                                  usecols={'Impact_sheet': ['parent_id', 'lag_months', 'unknown']})
+    assert list(loaded) == ['Impact_sheet']
+    pd.testing.assert_frame_equal(loaded['Impact_sheet'],
+                                  expected['Impact_sheet'][['parent_id', 'lag_months']], check_dtype=False)
+
+
+def test_summary_accumulator_matches_full_summary():
+    main_data = make_main_data(3000, n_indicators=40)
+    main_data['observation_date'] = pd.to_datetime(main_data['observation_date'])
+    observations = main_data[main_data['record_type'] == 'observation']
+    targets = main_data[main_data['record_type'] == 'target']
+    events = make_events(30)
+    # Links arrive before some of their events, and some never find one
+    impact_links = make_impact_links(500, n_events=35)
+    
+    accumulator = SummaryAccumulator()
+    for batch in np.array_split(np.arange(len(observations)), 4):
+        accumulator.update(new_observations=observations.iloc[batch])
+    accumulator.update(new_impact_links=impact_links.iloc[:300], new_events=events.iloc[:10])
+    accumulator.update(new_events=events.iloc[10:], new_targets=targets)
+    accumulator.update(new_impact_links=impact_links.iloc[300:])
+    
+    expected = get_data_summary(observations, events, targets, impact_links)
+    assert accumulator.summary() == expected
+    
+    approximate = SummaryAccumulator(approximate=True).update(observations, events, targets, impact_links)
+    assert abs(approximate.summary()['observations']['indicators'] - 40) <= 1
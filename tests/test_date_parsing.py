@@ -0,0 +1,73 @@
+import warnings
+
+import pandas as pd
+
+from src import date_parsing
+from src.date_parsing import FormatCache, parse_dates
+
+MIXED = ['2020-01-15', '2020/02/03', '03/04/2020', '25/12/2020', '5 Jan 2021', 'March 3, 2019',
+         '2018-07', '2017', None, '2021-05-01T10:00:00', '2021-05-01 10:30:00', 'not a date']
+
+
+def count_detections(monkeypatch):
+    calls = []
+    detect_formats = date_parsing.detect_formats
+    
+    def counting(values, *args, **kwargs):
+        calls.append(len(values))
+        return detect_formats(values, *args, **kwargs)
+    
+    monkeypatch.setattr(date_parsing, 'detect_formats', counting)
+    return calls
+
+
+def test_mixed_formats_match_pandas_mixed():
+    series = pd.Series(MIXED * 3)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        expected = pd.to_datetime(series, format='mixed', errors='coerce')
+    pd.testing.assert_series_equal(parse_dates(series), expected.astype('datetime64[ns]'))
+
+
+def test_utc_offsets_are_normalized():
+    series = pd.Series(['2021-05-01T10:00:00+03:00', '2021-05-02', '2021-05-01 10:00:00-05:00', None])
+    expected = pd.to_datetime(series, format='mixed', utc=True).dt.tz_localize(None)
+    pd.testing.assert_series_equal(parse_dates(series), expected.astype('datetime64[ns]'))
+
+
+def test_cached_formats_skip_detection(tmp_path, monkeypatch):
+    path = str(tmp_path / 'formats.json')
+    series = pd.Series(['2020-01-15', '15/01/2021', '2019-06-30'])
+    key = FormatCache.key('observations.csv', 'observation_date')
+    cache = FormatCache(path)
+    expected = parse_dates(series, cache=cache, cache_key=key)
+    cache.save()
+    
+    calls = count_detections(monkeypatch)
+    reloaded = FormatCache(path)
+    assert reloaded.get(key) == ['%Y-%m-%d', '%d/%m/%Y']
+    pd.testing.assert_series_equal(parse_dates(series, cache=reloaded, cache_key=key), expected)
+    assert calls == []
+
+
+def test_stale_formats_are_detected_again(tmp_path, monkeypatch):
+    cache = FormatCache(str(tmp_path / 'formats.json'))
+    cache.set('events.csv::event_date', ['%d/%m/%Y'])
+    calls = count_detections(monkeypatch)
+    
+    parsed = parse_dates(pd.Series(['2020-01-15', '2021-03-01']), cache=cache,
+                         cache_key='events.csv::event_date')
+    assert parsed.tolist() == [pd.Timestamp('2020-01-15'), pd.Timestamp('2021-03-01')]
+    assert len(calls) == 1
+    assert cache.get('events.csv::event_date') == ['%Y-%m-%d']
+
+
+def test_unreadable_cache_file_is_ignored(tmp_path):
+    path = tmp_path / 'formats.json'
+    path.write_text('{not json')
+    cache = FormatCache(str(path))
+    assert cache.get('events.csv::event_date') is None
+    
+    parse_dates(pd.Series(['2020-01-15']), cache=cache, cache_key='events.csv::event_date')
+    cache.save()
+    assert FormatCache(str(path)).get('events.csv::event_date') == ['%Y-%m-%d']
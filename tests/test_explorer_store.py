@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import make_main_data
+from src.explorer_store import ExplorerStore
+
+INDEX_COLUMNS = ['pillar', 'indicator_code']
+
+
+@pytest.fixture(scope='module')
+def frame():
+    frame = make_main_data(3000, n_indicators=12)
+    frame.loc[frame.index[::97], 'pillar'] = None
+    return frame
+
+
+@pytest.fixture(scope='module')
+def store(frame, tmp_path_factory):
+    return ExplorerStore(frame, INDEX_COLUMNS + ['not_a_column'],
+                         cache_dir=str(tmp_path_factory.mktemp('explorer')), row_group_size=200)
+
+
+def expected_rows(frame, filters):
+    rows = frame.sort_values(INDEX_COLUMNS, kind='stable', na_position='last')
+    for col, values in filters.items():
+        if len(values):
+            rows = rows[rows[col].isin(values)]
+    return rows.reset_index(drop=True)
+
+
+FILTERS = [{}, {'pillar': ['ACCESS']}, {'pillar': ['USAGE', 'TRUST'], 'indicator_code': ['IND_0003']},
+           {'indicator_code': ['IND_0007', 'IND_0000'], 'pillar': []}, {'pillar': ['missing']}]
+
+
+@pytest.mark.parametrize('filters', FILTERS)
+def test_pages_match_pandas_filtering(frame, store, filters):
+    expected = expected_rows(frame, filters)
+    assert store.count(filters) == len(expected)
+    for page, page_size in [(0, 50), (3, 50), (7, 130), (len(expected) // 40, 40), (10_000, 50)]:
+        rows = store.page(filters, page=page, page_size=page_size)
+        pd.testing.assert_frame_equal(rows, expected.iloc[page * page_size:(page + 1) * page_size]
+                                      .reset_index(drop=True), check_dtype=False)
+
+
+def test_non_index_filters_scan(frame, store):
+    filters = {'pillar': ['GENDER'], 'confidence': ['high', 'low']}
+    expected = expected_rows(frame, filters)
+    assert store.count(filters) == len(expected)
+    pd.testing.assert_frame_equal(store.page(filters, page=2, page_size=30, columns=['record_id']),
+                                  expected[['record_id']].iloc[60:90].reset_index(drop=True))
+
+
+def test_options_and_totals(frame, store):
+    assert store.index_columns == INDEX_COLUMNS
+    assert store.options('pillar') == sorted(frame['pillar'].dropna().unique())
+    assert store.options('indicator_code') == sorted(frame['indicator_code'].unique())
+    assert store.options('confidence') == []
+    assert store.count() == len(frame)
+    totals = store.counts.groupby('pillar', dropna=False)['rows'].sum()
+    assert totals.sum() == len(frame)
+    assert totals['ACCESS'] == (frame['pillar'] == 'ACCESS').sum()
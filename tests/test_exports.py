@@ -0,0 +1,52 @@
+import gzip
+import io
+import threading
+
+import numpy as np
+import pandas as pd
+
+from src.exports import ExportCache, frame_reader
+
+
+def make_frame(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({'indicator_code': rng.choice(['ACC_OWNERSHIP', 'USG_P2P'], rows),
+                         'value_numeric': rng.random(rows)})
+
+
+def test_concurrent_requests_share_one_file():
+    cache = ExportCache()
+    frame = make_frame(1000)
+    results = []
+    
+    def download():
+        results.append(cache.get('all', lambda: frame_reader(frame), 'csv.gz'))
+    
+    threads = [threading.Thread(target=download) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert cache.misses == 1 and cache.hits == 7
+    assert all(data is results[0] for data in results)
+    pd.testing.assert_frame_equal(pd.read_csv(io.BytesIO(gzip.decompress(results[0]))), frame)
+    assert cache.size() == len(results[0])
+    assert not cache._locks
+
+
+def test_cache_is_capped_by_bytes():
+    frames = {name: make_frame(5000, seed) for seed, name in enumerate('abcd')}
+    size = len(ExportCache().get('a', lambda: frame_reader(frames['a']), 'parquet'))
+    cache = ExportCache(max_mb=2.5 * size / 1024 ** 2)
+    for name, frame in frames.items():
+        cache.get(name, lambda: frame_reader(frame), 'parquet')
+        assert cache.size() <= cache.max_bytes
+    
+    # Least recently used entries went first
+    assert [key for key, _ in cache._entries] == ['c', 'd']
+    
+    # A file larger than the whole cache is returned but not kept
+    small = ExportCache(max_mb=size / 2 / 1024 ** 2)
+    assert len(small.get('a', lambda: frame_reader(frames['a']), 'parquet')) == size
+    assert small.size() == 0
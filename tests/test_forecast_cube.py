@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import make_forecasts
+from src.forecast_cube import ForecastCube
+
+
+@pytest.fixture(scope='module')
+def forecast():
+    forecast = make_forecasts(5).drop(index=[4, 12]).reset_index(drop=True)
+    # A duplicate (scenario, year) row after the original, as in a re-appended table
+    duplicate = forecast.iloc[[0]].assign(access_forecast=-1.0)
+    return pd.concat([forecast, duplicate], ignore_index=True)
+
+
+def test_lookups_match_the_frame(forecast):
+    cube = ForecastCube(forecast)
+    assert cube.scenarios == list(forecast['scenario'].unique())
+    assert cube.years == [2025, 2026, 2027]
+    assert len(cube) == len(forecast) - 1
+    
+    for scenario in cube.scenarios:
+        rows = forecast[forecast['scenario'] == scenario]
+        assert cube.years_of(scenario) == sorted(rows['year'].unique())
+        first = rows.drop_duplicates('year').sort_values('year')
+        np.testing.assert_array_equal(cube.series(scenario, 'usage_ci_upper'), first['usage_ci_upper'])
+        for year in cube.years:
+            matches = rows[rows['year'] == year]
+            assert cube.has(scenario, year) == (not matches.empty)
+            for metric in ['access_forecast', 'usage_ci_lower']:
+                expected = matches[metric].iloc[0] if not matches.empty else None
+                assert cube.value(scenario, year, metric) == expected
+    
+    by_scenario = cube.across_scenarios(['base', 'optimistic', 'unknown'], 2026, 'usage_forecast')
+    expected = forecast[forecast['year'] == 2026].drop_duplicates('scenario').set_index('scenario')
+    assert by_scenario == expected.loc[expected.index.isin(['base', 'optimistic']), 'usage_forecast'].to_dict()
+
+
+def test_missing_keys_return_defaults(forecast):
+    cube = ForecastCube(forecast)
+    assert cube.value('base', 2030, 'access_forecast') is None
+    assert cube.value('unknown', 2025, 'access_forecast', default=0.0) == 0.0
+    assert cube.value('base', 2025, 'scenario') is None
+    assert cube.years_of('unknown') == []
+    assert len(cube.series('base', 'not_a_metric')) == 0
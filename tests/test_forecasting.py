@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+
+from benchmarks.reference import FORECAST_YEARS, notebook_adjust, statsmodels_forecast
+from benchmarks.synthetic import make_adjustment_inputs, make_series
+from src.forecasting import (FORECAST_COLUMNS, apply_event_impacts, event_adjustments, forecast_trend,
+                             forecast_trends)
+from src.impact_model import join_impact_links
+
+
+def test_batched_trends_match_statsmodels():
+    frame = make_series(30)
+    batched = forecast_trends(frame, FORECAST_YEARS)
+    np.testing.assert_allclose(batched[FORECAST_COLUMNS].to_numpy(), statsmodels_forecast(frame),
+                               rtol=1e-9, atol=1e-8)
+    assert batched['is_forecast'].sum() == 30 * len(FORECAST_YEARS)
+
+
+def test_single_series_forecast_matches_batched():
+    frame = make_series(5, seed=1)
+    batched = forecast_trends(frame, FORECAST_YEARS)
+    for code, group in frame.groupby('indicator_code'):
+        single = forecast_trend(group[['year', 'value']], FORECAST_YEARS)['all_results']
+        rows = batched[batched['indicator_code'] == code]
+        np.testing.assert_allclose(single[FORECAST_COLUMNS].to_numpy(),
+                                   rows[FORECAST_COLUMNS].to_numpy(), rtol=1e-12)
+
+
+def test_event_adjustments_match_notebook_loop():
+    events, impact_links, forecasts = make_adjustment_inputs(30, 6, 60)
+    # The notebook always uses a 12 month lag
+    impact_with_events = join_impact_links(impact_links, events).assign(lag_months=12)
+    impact_matrix = impact_with_events.pivot_table(index=['event_name', 'category', 'event_date'],
+                                                   columns='related_indicator',
+                                                   values='impact_magnitude', aggfunc='mean').fillna(0)
+    indicators = list(impact_matrix.columns)
+    expected = pd.concat([
+        notebook_adjust(forecasts[forecasts['indicator_code'] == ind], impact_matrix, events, ind)
+        for ind in indicators
+    ])
+    
+    adjusted = apply_event_impacts(forecasts, event_adjustments(impact_with_events, FORECAST_YEARS))
+    columns = ['predicted', 'ci_lower', 'ci_upper']
+    np.testing.assert_allclose(adjusted.loc[expected.index, columns].to_numpy(),
+                               expected[columns].to_numpy())
+    assert not np.allclose(expected['predicted'], forecasts.loc[expected.index, 'predicted'])
+    history = forecasts['year'] < FORECAST_YEARS[0]
+    pd.testing.assert_frame_equal(adjusted.loc[history, columns], forecasts.loc[history, columns])
@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+
+from src import forecasting, impact_store, monte_carlo
+from src.impact_model import DIRECTION_SIGNS
+from src.monte_carlo import simulate_impact_bands
+
+
+def test_direction_signs_are_shared():
+    assert impact_store.DIRECTION_SIGNS is DIRECTION_SIGNS
+    assert forecasting.DIRECTION_SIGNS is DIRECTION_SIGNS
+    assert monte_carlo.DIRECTION_SIGNS is DIRECTION_SIGNS
+
+
+def test_positive_and_negative_directions_apply(impact_model):
+    model, baseline = impact_model
+    renamed = model.direction_matrix.replace({'increase': 'positive', 'decrease': 'negative'})
+    aliased = type(model)(model.impact_matrix, renamed, model.lag_matrix)
+    
+    expected = model.simulate_impacts(baseline, '2020-01-01', '2027-12-31', frequency='YE')
+    for surface in (aliased.simulate_impacts(baseline, '2020-01-01', '2027-12-31', frequency='YE'),
+                    aliased.simulate_impacts_scalar(baseline, '2020-01-01', '2027-12-31',
+                                                    frequency='YE')):
+        pd.testing.assert_frame_equal(surface, expected)
+    
+    bands = simulate_impact_bands(aliased, baseline, (2024, 2027), n_draws=4, magnitude_cv=0.0,
+                                  lag_cv=0.0)
+    actual = bands.pivot(index='year', columns='indicator', values='p50')[model.indicators]
+    np.testing.assert_allclose(actual.to_numpy(), expected.iloc[[-4, -1]].to_numpy(), rtol=1e-5)
+
+
+def test_vectorized_simulation_matches_scalar(impact_model):
+    model, baseline = impact_model
+    scalar = model.simulate_impacts_scalar(baseline, '2014-01-01', '2027-12-31')
+    vectorized = model.simulate_impacts(baseline, '2014-01-01', '2027-12-31')
+    assert np.array_equal(scalar.to_numpy(), vectorized.to_numpy())
+    assert not np.array_equal(vectorized.iloc[-1].to_numpy(), vectorized.iloc[0].to_numpy())
@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import make_events, make_impact_links
+from src.data_loader import get_data_summary
+from src.forecasting import event_adjustment_matrices, link_contributions
+from src.impact_model import join_impact_links
+from src.impact_store import ImpactLinkStore
+
+
+@pytest.fixture(scope='module')
+def events():
+    # The last events have no links; one link points at an unknown event
+    return make_events(25)
+
+
+@pytest.fixture(scope='module')
+def impact_links():
+    links = make_impact_links(400, n_events=20, n_indicators=15)
+    links.loc[0, 'parent_id'] = 'EVT_9999'
+    return links
+
+
+@pytest.fixture(scope='module')
+def store(impact_links, events):
+    return ImpactLinkStore(impact_links, events)
+
+
+def test_lookups_match_pandas_filters(store, impact_links, events):
+    links = impact_links.reset_index(drop=True)
+    for event_id in ['EVT_0003', 'EVT_0024', 'EVT_9999']:
+        pd.testing.assert_frame_equal(store.impacts_of_event(event_id),
+                                      links[links['parent_id'] == event_id])
+    for indicator in ['IND_0000', 'IND_0014', 'IND_0099']:
+        pd.testing.assert_frame_equal(store.impacts_on_indicator(indicator),
+                                      links[links['related_indicator'] == indicator])
+        touching = links.loc[links['related_indicator'] == indicator, 'parent_id'].unique()
+        assert store.events_touching(indicator) == list(touching)
+    pd.testing.assert_frame_equal(store.impacts_in_pillar('ACCESS'), links[links['pillar'] == 'ACCESS'])
+    pd.testing.assert_frame_equal(store.link('EVT_0003', 'IND_0007'),
+                                  links[(links['parent_id'] == 'EVT_0003')
+                                        & (links['related_indicator'] == 'IND_0007')])
+    
+    event_id = events.loc[events['event_name'] == 'event_5', 'id']
+    pd.testing.assert_frame_equal(store.impacts_of_event_name('event_5'),
+                                  links[links['parent_id'].isin(event_id)])
+    assert store.connected_count(events['id']) == links['parent_id'].isin(events['id']).sum()
+
+
+def test_sparse_export_matches_pivot(store, impact_links):
+    matrix, event_ids, indicators = store.to_sparse_matrix()
+    sign = impact_links['impact_direction'].map({'increase': 1.0, 'decrease': -1.0})
+    expected = (impact_links.assign(signed=impact_links['impact_magnitude'] * sign)
+                .pivot_table(index='parent_id', columns='related_indicator', values='signed',
+                             aggfunc='sum', fill_value=0.0)
+                .reindex(index=event_ids, columns=indicators))
+    np.testing.assert_allclose(matrix.toarray(), expected.to_numpy())
+
+
+def test_data_summary_counts_connected_links(store, impact_links, events):
+    empty = pd.DataFrame()
+    expected = int(impact_links['parent_id'].isin(events['id']).sum())
+    assert get_data_summary(empty, events, empty, impact_links)['impact_links']['connected_events'] == expected
+    summary = get_data_summary(empty, events, empty, impact_links, impact_store=store)
+    assert summary['impact_links']['connected_events'] == expected
+
+
+def test_adjustment_matrices_match_masks(impact_links, events):
+    impact_with_events = join_impact_links(impact_links, events)
+    links, contributions = link_contributions(impact_with_events)
+    indicators = ['IND_0000', 'IND_0014', 'IND_0099']
+    matrices = event_adjustment_matrices(impact_with_events, indicators)
+    for indicator in indicators:
+        on_indicator = (links['related_indicator'] == indicator).to_numpy()
+        event_ids, totals = matrices[indicator]
+        assert event_ids == links.loc[on_indicator, 'parent_id'].tolist()
+        np.testing.assert_array_equal(totals, contributions[on_indicator])
@@ -0,0 +1,53 @@
+import threading
+
+import numpy as np
+import pytest
+
+from src.instrumentation import Tracer
+
+
+@pytest.fixture
+def tracer():
+    tracer = Tracer(enabled=True, memory=True)
+    yield tracer
+    tracer.configure(memory=False)
+
+
+def test_nested_spans_record_peak_memory(tracer):
+    with tracer.span('outer'):
+        with tracer.span('inner', rows=10):
+            block = np.ones(2_000_000)
+            del block
+    
+    spans = tracer.spans().set_index('name')
+    assert spans.loc['inner', 'parent'] == spans.loc['outer', 'id']
+    assert spans.loc['inner', 'rows'] == 10
+    assert spans.loc['inner', 'peak_memory_mb'] >= 16
+    assert spans.loc['outer', 'peak_memory_mb'] >= spans.loc['inner', 'peak_memory_mb']
+
+
+def test_concurrent_spans_do_not_report_memory(tracer):
+    started = threading.Event()
+    release = threading.Event()
+    
+    def worker():
+        with tracer.span('worker'):
+            started.set()
+            release.wait(5)
+    
+    with tracer.span('main'):
+        thread = threading.Thread(target=worker)
+        thread.start()
+        started.wait(5)
+        block = np.ones(1_000_000)
+        del block
+        release.set()
+        thread.join()
+    
+    with tracer.span('alone'):
+        block = np.ones(1_000_000)
+        del block
+    
+    peaks = tracer.spans().set_index('name')['peak_memory_mb']
+    assert np.isnan(peaks['main']) and np.isnan(peaks['worker'])
+    assert peaks['alone'] >= 8
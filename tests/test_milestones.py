@@ -0,0 +1,36 @@
+import pandas as pd
+
+from src.forecast_cube import ForecastCube
+from src.milestones import first_crossings, format_crossing, not_reached_label
+
+
+def make_cube(years):
+    steps = list(range(len(years)))
+    return ForecastCube(pd.DataFrame({
+        'year': list(years) * 2,
+        'scenario': ['base'] * len(steps) + ['optimistic'] * len(steps),
+        'access_forecast': [50.0 + i for i in steps] + [50.0 + 3 * i for i in steps],
+        'usage_forecast': [30.0 + i for i in steps] * 2,
+    }))
+
+
+def test_crossings_and_labels_follow_cube_years():
+    cube = make_cube(range(2025, 2031))
+    milestones = [{'name': '60% Account Ownership', 'metric': 'access_forecast', 'target': 60}]
+    crossings = first_crossings(cube, milestones, start={'access_forecast': (2024, 49.0)})
+    crossings = crossings.set_index('scenario')
+    
+    # Optimistic: 56 at end-2027, 59 at end-2028, 62 at end-2029 -> a third of 2029, Apr 2029
+    assert crossings.loc['optimistic', 'year'] == 2029
+    assert format_crossing(crossings.loc['optimistic']) == 'Apr 2029'
+    
+    label = not_reached_label(cube)
+    assert label == 'Not by 2030'
+    assert format_crossing(crossings.loc['base'], horizon_label=label) == label
+
+
+def test_empty_cube_has_no_crossings():
+    cube = ForecastCube(pd.DataFrame(columns=['year', 'scenario', 'access_forecast']))
+    milestones = [{'name': '60% Account Ownership', 'metric': 'access_forecast', 'target': 60}]
+    assert not_reached_label(cube) == 'Not reached'
+    assert first_crossings(cube, milestones, start={'access_forecast': (2024, 49.0)}).empty
@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.monte_carlo import simulate_impact_bands
+
+YEARS = (2020, 2024, 2027)
+
+
+def point_surface(model, baseline):
+    surface = model.simulate_impacts(baseline, '2020-01-01', '2027-12-31', frequency='YE')
+    return surface[surface.index.year.isin(YEARS)]
+
+
+def test_zero_spread_matches_point_model(impact_model):
+    model, baseline = impact_model
+    assert model.lag_matrix.isna().to_numpy().any()
+    
+    bands = simulate_impact_bands(model, baseline, YEARS, n_draws=8, magnitude_cv=0.0, lag_cv=0.0)
+    expected = point_surface(model, baseline).to_numpy()
+    for column in ['mean', 'p5', 'p50', 'p95']:
+        actual = bands.pivot(index='year', columns='indicator', values=column)[model.indicators]
+        np.testing.assert_allclose(actual.to_numpy(), expected, rtol=1e-5)
+
+
+# About 40 and 8 draws per chunk
+@pytest.mark.parametrize('memory_budget_mb', [0.05, 0.01])
+def test_chunked_bands_agree(impact_model, memory_budget_mb):
+    model, baseline = impact_model
+    options = {'years': YEARS, 'n_draws': 20_000, 'seed': 3}
+    whole = simulate_impact_bands(model, baseline, **options)
+    chunked = simulate_impact_bands(model, baseline, memory_budget_mb=memory_budget_mb, **options)
+    
+    # Different chunking draws different samples; bands agree to sampling error
+    for column in ['mean', 'p5', 'p50', 'p95']:
+        np.testing.assert_allclose(chunked[column], whole[column], rtol=0.02)
+    assert (whole['p5'] <= whole['p50']).all() and (whole['p50'] <= whole['p95']).all()
+
+
+@pytest.mark.parametrize('memory_budget_mb', [0.05, 0.01])
+def test_percentiles_match_exact_draws(impact_model, monkeypatch, memory_budget_mb):
+    from src import monte_carlo
+    
+    model, baseline = impact_model
+    chunks = []
+    simulate_chunk = monte_carlo._simulate_chunk
+    
+    def keep_chunk(*args):
+        chunks.append(simulate_chunk(*args))
+        return chunks[-1]
+    
+    monkeypatch.setattr(monte_carlo, '_simulate_chunk', keep_chunk)
+    bands = simulate_impact_bands(model, baseline, YEARS, n_draws=5_000,
+                                  memory_budget_mb=memory_budget_mb)
+    assert len(chunks) > 1 and len(chunks[0]) < 50
+    
+    scale = np.array([baseline[ind] for ind in model.indicators])[None, :, None]
+    values = np.concatenate(chunks) * scale
+    spread = values.max(axis=0) - values.min(axis=0)
+    for q in (5, 50, 95):
+        actual = bands.pivot(index='indicator', columns='year', values=f"p{q}").loc[model.indicators]
+        error = np.abs(actual.to_numpy() - np.percentile(values, q, axis=0))
+        assert (error <= 1e-3 * spread + 1e-9).all()
+    means = bands.pivot(index='indicator', columns='year', values='mean').loc[model.indicators]
+    np.testing.assert_allclose(means.to_numpy(), values.mean(axis=0), rtol=1e-9)
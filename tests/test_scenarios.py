@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+
+from benchmarks.reference import FORECAST_YEARS
+from benchmarks.synthetic import make_adjustment_inputs
+from src.forecasting import event_adjustment_matrices
+from src.impact_model import join_impact_links
+from src.scenarios import read_scenario_results, run_scenario_grid, scenario_grid
+
+METRIC_INDICATORS = {'access': 'IND_0000', 'usage': 'IND_0001'}
+
+
+def make_inputs():
+    events, impact_links, _ = make_adjustment_inputs(20, 5, 60)
+    matrices = event_adjustment_matrices(join_impact_links(impact_links, events),
+                                         METRIC_INDICATORS.values(), FORECAST_YEARS)
+    baseline = {metric: pd.DataFrame({'year': FORECAST_YEARS, 'predicted': [40.0, 42.0, 44.0],
+                                      'ci_lower': [36.0, 37.0, 38.0], 'ci_upper': [44.0, 47.0, 50.0]})
+                for metric in METRIC_INDICATORS}
+    adjustments = {metric: matrices[indicator] for metric, indicator in METRIC_INDICATORS.items()}
+    toggled = matrices['IND_0000'][0][:2]
+    return scenario_grid((0.9, 1.0), (1.0, 1.1), (0.5, 1.0), event_ids=toggled), baseline, adjustments
+
+
+def test_parquet_run_matches_in_memory(tmp_path, capsys):
+    grid, baseline, adjustments = make_inputs()
+    expected = run_scenario_grid(grid, baseline, adjustments, chunk_size=7)
+    assert len(expected) == len(grid) * len(FORECAST_YEARS)
+    
+    output_dir = str(tmp_path / 'grid')
+    written = run_scenario_grid(grid, baseline, adjustments, output_dir=output_dir, chunk_size=7,
+                                verbose=False)
+    assert written == len(expected)
+    assert capsys.readouterr().out == ''
+    
+    results = read_scenario_results(output_dir).sort_values(['scenario', 'year'], ignore_index=True)
+    pd.testing.assert_frame_equal(results, expected, check_dtype=False)
+    subset = read_scenario_results(output_dir, scenarios=['grid_000003'], years=[2026])
+    assert len(subset) == 1
+    assert np.isclose(subset['access_forecast'].iloc[0],
+                      expected.loc[(expected['scenario'] == 'grid_000003') & (expected['year'] == 2026),
+                                   'access_forecast'].iloc[0])
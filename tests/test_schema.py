@@ -0,0 +1,95 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_loader import clean_and_prepare_data, separate_record_types
+from src.schema import build_schema, chunk_schema, coerce_frame
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+REFERENCE_PATH = os.path.join(ROOT, 'data', 'raw', 'reference_codes.xlsx')
+TEMPLATE_DIR = os.path.join(ROOT, 'data', 'templates')
+WORKBOOK_PATH = os.path.join(ROOT, 'data', 'raw', 'ethiopia_fi_unified_data.xlsx')
+
+
+@pytest.fixture(scope='module')
+def schema():
+    return build_schema(REFERENCE_PATH, TEMPLATE_DIR)
+
+
+def test_only_default_date_columns_are_dates(schema):
+    dates = {col for col, spec in schema.items() if spec['dtype'] == 'datetime'}
+    assert dates == {'observation_date', 'start_date', 'end_date', 'event_date', 'target_date'}
+    assert 'collection_date' not in schema
+
+
+def test_record_type_stays_string(schema):
+    frame = pd.DataFrame({'record_type': ['observation', 'event', 'observation']})
+    coerced, _ = coerce_frame(frame, schema=schema)
+    assert not isinstance(coerced['record_type'].dtype, pd.CategoricalDtype)
+    assert (coerced['record_type'] == 'observation').sum() == 2
+
+
+def test_value_numeric_keeps_float64_unless_downcast(schema):
+    frame = pd.DataFrame({'value_numeric': [46.123456789, 0.1, np.nan]})
+    coerced, _ = coerce_frame(frame, schema=schema)
+    assert coerced['value_numeric'].dtype == np.float64
+    pd.testing.assert_series_equal(coerced['value_numeric'], frame['value_numeric'])
+    
+    # Opt-in downcasting rounds to float32
+    downcast, _ = coerce_frame(frame, schema=schema, downcast=True)
+    assert downcast['value_numeric'].dtype == np.float32
+    assert downcast['value_numeric'].iloc[0] != frame['value_numeric'].iloc[0]
+
+
+def test_report_counts_failures(schema):
+    observations = pd.DataFrame({
+        'record_type': ['observation'] * 3,
+        'value_numeric': ['1.5', 'n/a', None],
+        'observation_date': ['2024-01-01', '2024-02-30', '2024-03-01'],
+    })
+    report = {}
+    cleaned, _, _, _ = clean_and_prepare_data(observations, pd.DataFrame(), pd.DataFrame(),
+                                              pd.DataFrame(), schema=schema, report=report)
+    assert report['observations']['value_numeric'] == 1
+    assert report['observations']['observation_date'] == 1
+    assert cleaned['value_numeric'].tolist()[0] == 1.5
+    assert cleaned['observation_date'].isna().tolist() == [False, True, False]
+
+
+def test_unknown_codes_extend_fixed_categories(schema):
+    fixed = chunk_schema(schema)
+    codes = list(fixed['category']['categories'].categories)
+    first, failures = coerce_frame(pd.DataFrame({'category': [codes[0], 'new_category', None]}),
+                                   schema=fixed)
+    assert first['category'].tolist()[:2] == [codes[0], 'new_category']
+    assert first['category'].isna().sum() == 1 and failures['category'] == 0
+    
+    # Later chunks share the extended categories and concatenate as categoricals
+    second, _ = coerce_frame(pd.DataFrame({'category': [codes[1]]}), schema=fixed)
+    assert second['category'].dtype == first['category'].dtype
+    combined = pd.concat([first, second], ignore_index=True)
+    assert isinstance(combined['category'].dtype, pd.CategoricalDtype)
+    assert schema['category']['codes'] == codes
+
+
+def test_mostly_unparseable_date_column_is_left_unchanged(schema):
+    frame = pd.DataFrame({'start_date': ['Account ownership rose', 'see notes', '2024-01-01']})
+    coerced, failures = coerce_frame(frame, schema=schema)
+    assert failures['start_date'] == 2
+    pd.testing.assert_series_equal(coerced['start_date'], frame['start_date'])
+
+
+@pytest.mark.skipif(not os.path.exists(WORKBOOK_PATH), reason='shipped workbook not available')
+def test_shipped_workbook_loses_no_free_text(schema):
+    main_data = pd.read_excel(WORKBOOK_PATH, sheet_name=0)
+    observations, events, targets = separate_record_types(main_data, verbose=False)
+    cleaned, _, _, _ = clean_and_prepare_data(observations, events, targets, pd.DataFrame(),
+                                              schema=schema)
+    
+    text = observations['collection_date']
+    assert text.notna().sum() > 0
+    pd.testing.assert_series_equal(cleaned['collection_date'], text)
+    assert cleaned['value_numeric'].dtype == np.float64
+    assert cleaned['record_type'].eq('observation').all()
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from src.series_index import SeriesIndex
+
+QUERIES = [('IND_0000', 2011, 2024), ('IND_0007', 2015, 2015), ('IND_0013', 2018, 2021),
+           ('IND_0019', None, 2013), ('IND_0404', 2011, 2024)]
+
+
+@pytest.fixture(scope='module')
+def index(observations):
+    return SeriesIndex(observations)
+
+
+@pytest.mark.parametrize('indicator, start_year, end_year', QUERIES)
+def test_series_match_mask_filtering(observations, index, indicator, start_year, end_year):
+    years = observations['observation_date'].dt.year
+    mask = (observations['indicator_code'] == indicator) & (years <= end_year)
+    if start_year is not None:
+        mask &= years >= start_year
+    expected = observations[mask].sort_values('observation_date', kind='stable')
+    
+    series = index.series(indicator, start_year, end_year)
+    assert np.array_equal(series['value_numeric'].to_numpy(), expected['value_numeric'].to_numpy(),
+                          equal_nan=True)
+    assert series['year'].tolist() == expected['observation_date'].dt.year.tolist()
+    assert observations.index[index.positions(indicator, start_year, end_year)].sort_values().equals(
+        expected.index.sort_values())
+
+
+def test_disaggregated_series(observations, index):
+    key = ('IND_0005', 'female', 'national')
+    mask = ((observations['indicator_code'] == 'IND_0005') & (observations['gender'] == 'female'))
+    expected = observations[mask].sort_values('observation_date', kind='stable')
+    series = index.series(key)
+    assert np.array_equal(series['value_numeric'].to_numpy(), expected['value_numeric'].to_numpy(),
+                          equal_nan=True)
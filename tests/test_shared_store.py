@@ -0,0 +1,65 @@
+import os
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from src.shared_store import SharedFrameStore
+
+
+def make_frame(n_rows):
+    rng = np.random.default_rng(0)
+    values = rng.normal(40, 15, n_rows)
+    values[::7] = np.nan
+    return pd.DataFrame({
+        'indicator_code': [f"IND_{i % 13:04d}" for i in range(n_rows)],
+        'year': np.arange(n_rows) % 15 + 2011,
+        'value': values,
+    })
+
+
+def test_round_trip_and_reuse(tmp_path):
+    store = SharedFrameStore(str(tmp_path))
+    frame = make_frame(1000)
+    computed = []
+    
+    def compute():
+        computed.append(1)
+        return frame
+    
+    shared = store.get('trends', 'v1', compute)
+    pd.testing.assert_frame_equal(shared, frame, check_dtype=False)
+    assert shared is not frame
+    assert store.get('trends', 'v1', compute) is shared
+    assert (len(computed), store.hits, store.misses) == (1, 1, 1)
+    assert store.stats().set_index('name').loc['trends', 'mapped']
+    
+    # A new version replaces the frame and its file
+    store.get('trends', 'v2', lambda: frame.head(10))
+    assert len(store.get('trends', 'v2', compute)) == 10
+    assert sorted(os.listdir(tmp_path)) == ['trends-v2.arrow']
+
+
+def test_other_stores_map_the_existing_file(tmp_path):
+    frame = make_frame(500_000)[['year', 'value']]
+    SharedFrameStore(str(tmp_path)).get('trends', 'v1', lambda: frame)
+    modified = os.path.getmtime(tmp_path / 'trends-v1.arrow')
+    
+    # A second process reads the same file: the numeric columns stay mapped, not copied
+    other = SharedFrameStore(str(tmp_path))
+    tracemalloc.start()
+    try:
+        shared = other.get('trends', 'v1', lambda: frame)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert peak < frame.memory_usage(index=False).sum() / 10
+    np.testing.assert_array_equal(shared['value'].to_numpy(), frame['value'].to_numpy())
+    assert os.path.getmtime(tmp_path / 'trends-v1.arrow') == modified
+
+
+def test_without_a_directory_frames_stay_in_memory():
+    store = SharedFrameStore()
+    frame = make_frame(10)
+    assert store.get('trends', 'v1', lambda: frame) is frame
+    assert not store.stats()['mapped'].any()